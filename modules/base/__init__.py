@@ -31,6 +31,7 @@
 from modules.base.core.dep_node import Dep_Node
 from modules.base.core.dag_node import Dag_Node
 from modules.base.core.attribute_base import Attributes, Attribute
+from modules.base.core.connection_graph import ConnectionGraph
 
 # -----------------------------------------------------------------------------
 # ENHANCED NODES
@@ -17,11 +17,22 @@
 >> CONTENTS >> 
     + Attributes [Class]
     + Attribute [Class]
+    + getPlug [Func]
+    + getAttributeInfo [Func]
+    + clearPlugCache [Func]
+    + bulkSet [Func]
+    + deferred [Func]
 
 >> NOTES >> 
 	Update 05/08/2023 : Start working on the script
     Update 06/08/2023 : Created Arithmetic methods for nodes
     Update 25/08/2023 : Created methods to handle attributes on channel box.
+    Update 18/10/2026 : Attributes resolve once to a cached MPlug.
+    Update 18/10/2026 : Added getMany, setMany and bulkSet.
+    Update 18/10/2026 : Operators reuse the nodes of identical expressions.
+    Update 18/10/2026 : Deferred operators fold constants before creating nodes.
+    Update 18/10/2026 : Children, parent and type are cached per node type.
+    Update 18/10/2026 : Undoable setMany and bulkSet run one MDGModifier.
  
 >> THANKS >> 
     Nick Hughes [5/08/2023]:
@@ -39,8 +50,488 @@
 # -----------------------------------------------------------------------------
 
 from maya import cmds as m
-from modules.utils import path
-import string, six
+from maya import OpenMaya
+from modules.utils import api_undo, open_maya_api, path
+from modules.base.core.attribute_expression import deferred, isDeferred, Expression
+import re, string, six
+
+# -----------------------------------------------------------------------------
+# PLUG CACHE
+# -----------------------------------------------------------------------------
+
+# {nodeKey: [MObjectHandle, {attr: MPlug}]}
+_PLUG_CACHE = {}
+
+# {nodeKey: callbackId} Attribute changed callbacks of the cached nodes.
+_PLUG_CALLBACKS = {}
+
+# {(nodeType, attr): metadata} Static attributes are the same on every node.
+_ATTRIBUTE_INFO = {}
+
+# New/Open scene callbacks that clear the whole cache.
+_SCENE_CALLBACKS = []
+
+# Returned by the plug readers when maya.cmds has to handle the value.
+_UNSUPPORTED = object()
+
+_INT_TYPES = (
+    OpenMaya.MFnNumericData.kByte,
+    OpenMaya.MFnNumericData.kChar,
+    OpenMaya.MFnNumericData.kShort,
+    OpenMaya.MFnNumericData.kLong,
+)
+
+_FLOAT_TYPES = (
+    OpenMaya.MFnNumericData.kFloat,
+    OpenMaya.MFnNumericData.kDouble,
+)
+
+# The attributeQuery(attributeType=True) names of the API types.
+_NUMERIC_TYPE_NAMES = {
+    OpenMaya.MFnNumericData.kBoolean: "bool",
+    OpenMaya.MFnNumericData.kByte: "byte",
+    OpenMaya.MFnNumericData.kChar: "char",
+    OpenMaya.MFnNumericData.kShort: "short",
+    OpenMaya.MFnNumericData.kLong: "long",
+    OpenMaya.MFnNumericData.kFloat: "float",
+    OpenMaya.MFnNumericData.kDouble: "double",
+    OpenMaya.MFnNumericData.k2Float: "float2",
+    OpenMaya.MFnNumericData.k2Double: "double2",
+    OpenMaya.MFnNumericData.k3Float: "float3",
+    OpenMaya.MFnNumericData.k3Double: "double3",
+}
+
+_UNIT_TYPE_NAMES = {
+    OpenMaya.MFnUnitAttribute.kAngle: "doubleAngle",
+    OpenMaya.MFnUnitAttribute.kDistance: "doubleLinear",
+    OpenMaya.MFnUnitAttribute.kTime: "time",
+}
+
+
+def clearPlugCache(*args):
+    """
+    Forgets every cached plug and removes the callbacks watching them.
+
+    Example:
+        clearPlugCache()
+    """
+    for callbackId in _PLUG_CALLBACKS.values():
+        _removeCallback(callbackId)
+
+    _PLUG_CALLBACKS.clear()
+    _PLUG_CACHE.clear()
+    _ATTRIBUTE_INFO.clear()
+
+
+def _removeCallback(callbackId):
+    try:
+        OpenMaya.MMessage.removeCallback(callbackId)
+    except RuntimeError:
+        pass  # The node was already removed with its callbacks.
+
+
+def _registerSceneCallbacks():
+    """ Clears the cache when a new scene is created or opened. """
+    if _SCENE_CALLBACKS:
+        return
+
+    for message in (OpenMaya.MSceneMessage.kBeforeNew,
+                    OpenMaya.MSceneMessage.kBeforeOpen):
+        _SCENE_CALLBACKS.append(
+            OpenMaya.MSceneMessage.addCallback(message, clearPlugCache))
+
+
+def _attributeChanged(message, plug, otherPlug, key):
+    """ Drops the node plugs when one of its attributes goes away. """
+    if message & (OpenMaya.MNodeMessage.kAttributeRemoved |
+                  OpenMaya.MNodeMessage.kAttributeRenamed):
+        if key in _PLUG_CACHE:
+            _PLUG_CACHE[key][1].clear()
+
+
+def _forgetNode(key):
+    _PLUG_CACHE.pop(key, None)
+
+    if key in _PLUG_CALLBACKS:
+        _removeCallback(_PLUG_CALLBACKS.pop(key))
+
+
+def _nodePlugs(node):
+    """
+    Gets the cached plugs dictionary of a node, making a new one if
+    the node was never cached or it was deleted since.
+
+    Args:
+        node (Dep_Node): The node that owns the attributes.
+
+    Returns:
+        dict: {attr: MPlug} or None if the node does not exist.
+    """
+    dep = getattr(node, "dep", None)
+    if dep is None:
+        return None
+
+    handle = OpenMaya.MObjectHandle(dep.object())
+    if not handle.isValid():
+        return None
+
+    # Hash codes are shared between nodes, the key tells them apart
+    key = open_maya_api.nodeKey(handle.object())
+    cached = _PLUG_CACHE.get(key)
+
+    if cached and cached[0].isValid() and cached[0].object() == handle.object():
+        return cached[1]
+
+    # Stale entry from a deleted node
+    _forgetNode(key)
+    _registerSceneCallbacks()
+
+    _PLUG_CACHE[key] = [handle, {}]
+    _PLUG_CALLBACKS[key] = OpenMaya.MNodeMessage.addAttributeChangedCallback(
+        handle.object(), _attributeChanged, key)
+
+    return _PLUG_CACHE[key][1]
+
+
+def getPlug(node, attr):
+    """
+    Resolves a node attribute into an OpenMaya Plug only once, after that
+    the plug is reused until the node or the attribute are removed.
+
+    Args:
+        node (Dep_Node): The node that owns the attribute.
+        attr (str): The attribute name, example: "rotateX" or "input1D[0]".
+
+    Returns:
+        MPlug: The attribute plug or None if it doesn't exist.
+
+    Example:
+        plug = getPlug(cube, "tx")
+        print(plug.asDouble())
+    """
+    plugs = _nodePlugs(node)
+    if plugs is None:
+        return None
+
+    plug = plugs.get(attr)
+    if plug is not None:
+        return plug
+
+    # Simple names are found directly, indexed or nested ones need a path
+    if "." not in attr and "[" not in attr:
+        try:
+            plug = node.dep.findPlug(attr, False)
+        except RuntimeError:
+            pass
+
+    if plug is None:
+        try:
+            plug = open_maya_api.toMPlug("{0}.{1}".format(node.fullPath, attr))
+        except RuntimeError:
+            return None
+
+    plugs[attr] = plug
+    return plug
+
+
+def getAttributeInfo(node, attr):
+    """
+    The structure of a node attribute, static attributes are read from
+    MFnAttribute once per node type and shared by every node of that type.
+
+    Args:
+        node (Dep_Node): The node that owns the attribute.
+        attr (str): The attribute name, example: "rotateX" or "input3D[0]".
+
+    Returns:
+        dict: {"children": [str], "parent": str or None, "multi": bool,
+               "indexMatters": bool, "type": str, "dynamic": bool}
+              or None if the attribute doesn't exist.
+
+    Example:
+        print(getAttributeInfo(cube, "r")["children"])
+        # Output: ["rotateX", "rotateY", "rotateZ"]
+    """
+    plug = getPlug(node, attr)
+    if plug is None:
+        return None
+
+    # Every index of a multi shares the same attribute
+    key = (node.dep.typeName(), re.sub(r"\[\d+\]", "[]", attr))
+    info = _ATTRIBUTE_INFO.get(key)
+
+    if info is None:
+        info = _attributeInfo(plug.attribute())
+
+        # Dynamic attributes can be different between nodes of the same type
+        if not info["dynamic"]:
+            _ATTRIBUTE_INFO[key] = info
+
+    return info
+
+
+def _attributeInfo(attribute):
+    """ Reads the attribute structure from its MObject. """
+    fnAttr = OpenMaya.MFnAttribute(attribute)
+
+    children = []
+    if attribute.hasFn(OpenMaya.MFn.kCompoundAttribute):
+        fnCompound = OpenMaya.MFnCompoundAttribute(attribute)
+        children = [OpenMaya.MFnAttribute(fnCompound.child(i)).name()
+                    for i in range(fnCompound.numChildren())]
+
+    parent = fnAttr.parent()
+
+    return {
+        "children": children,
+        "parent": None if parent.isNull() else OpenMaya.MFnAttribute(parent).name(),
+        "multi": fnAttr.isArray(),
+        "indexMatters": fnAttr.indexMatters(),
+        "type": _attributeTypeName(attribute),
+        "dynamic": fnAttr.isDynamic(),
+    }
+
+
+def _attributeTypeName(attribute):
+    """ The attribute type the same way attributeQuery names it. """
+    if attribute.hasFn(OpenMaya.MFn.kNumericAttribute):
+        return _NUMERIC_TYPE_NAMES.get(
+            OpenMaya.MFnNumericAttribute(attribute).unitType(), "compound")
+
+    if attribute.hasFn(OpenMaya.MFn.kUnitAttribute):
+        return _UNIT_TYPE_NAMES.get(
+            OpenMaya.MFnUnitAttribute(attribute).unitType(), "double")
+
+    if attribute.hasFn(OpenMaya.MFn.kEnumAttribute):
+        return "enum"
+
+    if attribute.hasFn(OpenMaya.MFn.kMessageAttribute):
+        return "message"
+
+    if attribute.hasFn(OpenMaya.MFn.kMatrixAttribute):
+        return "matrix"
+
+    if attribute.hasFn(OpenMaya.MFn.kCompoundAttribute):
+        return "compound"
+
+    if attribute.hasFn(OpenMaya.MFn.kTypedAttribute):
+        if OpenMaya.MFnTypedAttribute(attribute).attrType() == OpenMaya.MFnData.kMatrix:
+            return "matrix"
+        return "typed"
+
+    return "generic"
+
+
+def _readPlug(plug):
+    """
+    Reads a plug value the same way maya.cmds getAttr returns it.
+
+    Returns:
+        value: The plug value or _UNSUPPORTED to fall back to getAttr.
+    """
+    if plug.isArray():
+        return _UNSUPPORTED
+
+    if not plug.isCompound():
+        return _readScalarPlug(plug)
+
+    values = []
+    for index in range(plug.numChildren()):
+        child = plug.child(index)
+        if child.isArray() or child.isCompound():
+            return _UNSUPPORTED
+
+        value = _readScalarPlug(child)
+        if value is _UNSUPPORTED:
+            return _UNSUPPORTED
+
+        values.append(value)
+
+    return [tuple(values)]
+
+
+def _readScalarPlug(plug):
+    attribute = plug.attribute()
+
+    if attribute.hasFn(OpenMaya.MFn.kNumericAttribute):
+        unitType = OpenMaya.MFnNumericAttribute(attribute).unitType()
+        if unitType == OpenMaya.MFnNumericData.kBoolean:
+            return plug.asBool()
+        if unitType in _INT_TYPES:
+            return plug.asInt()
+        if unitType in _FLOAT_TYPES:
+            return plug.asDouble()
+
+    elif attribute.hasFn(OpenMaya.MFn.kUnitAttribute):
+        unitType = OpenMaya.MFnUnitAttribute(attribute).unitType()
+        if unitType == OpenMaya.MFnUnitAttribute.kAngle:
+            return plug.asMAngle().asUnits(OpenMaya.MAngle.uiUnit())
+        if unitType == OpenMaya.MFnUnitAttribute.kDistance:
+            return plug.asMDistance().asUnits(OpenMaya.MDistance.uiUnit())
+        if unitType == OpenMaya.MFnUnitAttribute.kTime:
+            return plug.asMTime().asUnits(OpenMaya.MTime.uiUnit())
+
+    elif attribute.hasFn(OpenMaya.MFn.kEnumAttribute):
+        return plug.asInt()
+
+    return _UNSUPPORTED
+
+
+def _plugWriter(plug):
+    """
+    Finds the MDGModifier method that sets a plug value given in the
+    same units that maya.cmds setAttr uses.
+
+    Returns:
+        callable: writer(modifier, plug, value) or None if not supported.
+    """
+    if plug.isArray() or plug.isCompound():
+        return None
+
+    attribute = plug.attribute()
+
+    if attribute.hasFn(OpenMaya.MFn.kNumericAttribute):
+        unitType = OpenMaya.MFnNumericAttribute(attribute).unitType()
+        if unitType == OpenMaya.MFnNumericData.kBoolean:
+            return lambda mod, p, v: mod.newPlugValueBool(p, bool(v))
+        if unitType in (OpenMaya.MFnNumericData.kByte,
+                        OpenMaya.MFnNumericData.kChar):
+            return lambda mod, p, v: mod.newPlugValueChar(p, int(v))
+        if unitType == OpenMaya.MFnNumericData.kShort:
+            return lambda mod, p, v: mod.newPlugValueShort(p, int(v))
+        if unitType == OpenMaya.MFnNumericData.kLong:
+            return lambda mod, p, v: mod.newPlugValueInt(p, int(v))
+        if unitType in _FLOAT_TYPES:
+            return lambda mod, p, v: mod.newPlugValueDouble(p, float(v))
+
+    elif attribute.hasFn(OpenMaya.MFn.kUnitAttribute):
+        unitType = OpenMaya.MFnUnitAttribute(attribute).unitType()
+        if unitType == OpenMaya.MFnUnitAttribute.kAngle:
+            return lambda mod, p, v: mod.newPlugValueMAngle(
+                p, OpenMaya.MAngle(v, OpenMaya.MAngle.uiUnit()))
+        if unitType == OpenMaya.MFnUnitAttribute.kDistance:
+            return lambda mod, p, v: mod.newPlugValueMDistance(
+                p, OpenMaya.MDistance(v, OpenMaya.MDistance.uiUnit()))
+        if unitType == OpenMaya.MFnUnitAttribute.kTime:
+            return lambda mod, p, v: mod.newPlugValueMTime(
+                p, OpenMaya.MTime(v, OpenMaya.MTime.uiUnit()))
+
+    elif attribute.hasFn(OpenMaya.MFn.kEnumAttribute):
+        return lambda mod, p, v: mod.newPlugValueShort(p, int(v))
+
+    return None
+
+
+def _writePlug(modifier, plug, value):
+    """
+    Queues the plug value into the modifier, compound plugs take a
+    list or tuple with one value per child.
+
+    Returns:
+        bool: False if the value has to be set with maya.cmds instead.
+    """
+    if plug.isCompound():
+        if not isinstance(value, (list, tuple)):
+            return False
+
+        plugs = [plug.child(i) for i in range(plug.numChildren())]
+        values = value
+    else:
+        plugs = [plug]
+        values = [value]
+
+    if len(plugs) != len(values):
+        return False
+
+    writers = [_plugWriter(p) for p in plugs]
+    if None in writers:
+        return False
+
+    for writer, childPlug, childValue in zip(writers, plugs, values):
+        writer(modifier, childPlug, childValue)
+
+    return True
+
+
+def _setAttrCommand(attrPath, value):
+    """ Sets the value with maya.cmds the same way Attribute.set does. """
+    if isinstance(value, six.string_types):
+        m.setAttr(attrPath, value, type="string")
+    elif isinstance(value, (list, tuple)):
+        m.setAttr(attrPath, *value)
+    else:
+        m.setAttr(attrPath, value)
+
+
+def _setAttributes(items, undoable=True):
+    """
+    Sets many attributes at once. Every supported value is queued into a
+    single MDGModifier, the rest go through maya.cmds.
+
+    When undoable, the modifier runs as one command and the maya.cmds
+    values are set after it, all in a single undo chunk. Otherwise the
+    modifier runs outside the undo queue, which skips the command but
+    can't be undone from Maya.
+
+    Args:
+        items (list): [(Attribute, value), ...]
+        undoable (bool): Keep the change in the undo queue. Defaults to True.
+
+    Raises:
+        ValueError: If any of the attributes doesn't exist.
+    """
+    missing = [str(attr.attribute) for attr, _ in items if attr.plug is None]
+    if missing:
+        raise ValueError(
+            ">>> These attributes do not exist: {}".format(", ".join(missing)))
+
+    modifier = OpenMaya.MDGModifier()
+    commands = [(attr.fullPath, value) for attr, value in items
+                if not _writePlug(modifier, attr.plug, value)]
+
+    if not undoable:
+        modifier.doIt()
+        for attrPath, value in commands:
+            _setAttrCommand(attrPath, value)
+
+        return
+
+    m.undoInfo(openChunk=True, chunkName="setAttributes")
+    try:
+        api_undo.doIt(modifier)
+        for attrPath, value in commands:
+            _setAttrCommand(attrPath, value)
+    finally:
+        m.undoInfo(closeChunk=True)
+
+
+def bulkSet(nodes, attrs, values, undoable=True):
+    """
+    Sets the same attribute values on many nodes at once.
+
+    Args:
+        nodes (list): The nodes (Dep_Node or str) to set.
+        attrs (list): The attribute names to set on each node.
+        values (list): One value per attribute, compound attributes
+                       take a list or tuple. Example: [0, (1, 1, 1)]
+        undoable (bool): Keep the change in the undo queue. Defaults to True.
+
+    Example:
+        bulkSet(controls, ["t", "r", "s"], [(0, 0, 0), (0, 0, 0), (1, 1, 1)])
+    """
+    # Importing here to avoid circular dependency
+    from modules.base import Dep_Node
+
+    if len(attrs) != len(values):
+        raise ValueError(">>> Pass one value for each attribute.")
+
+    items = []
+    for node in nodes:
+        node = node if isinstance(node, Dep_Node) else Dep_Node(node)
+        items += [(Attribute(node, attr), value)
+                  for attr, value in zip(attrs, values)]
+
+    _setAttributes(items, undoable)
 
 # -----------------------------------------------------------------------------
 # CLASSES
@@ -149,6 +640,44 @@ class Attributes(object):
         """
         m.addAttr(self.node, **kwargs)
 
+    def getMany(self, attrs):
+        """
+        Gets many attribute values of the node at once.
+
+        Args:
+            attrs (list): The attribute names to get.
+
+        Returns:
+            dict: {attr: value}
+
+        Example:
+            print(cube.a.getMany(["tx", "r"]))
+            # Output: {"tx": 0.0, "r": [(0.0, 0.0, 0.0)]}
+        """
+        return dict((attr, Attribute(self.node, attr).get()) for attr in attrs)
+
+    def setMany(self, values, undoable=True):
+        """
+        Sets many attribute values of the node at once, the output of
+        getMany can be passed back to restore a snapshot.
+
+        Args:
+            values (dict): {attr: value}, compound values take a list/tuple.
+            undoable (bool): Keep the change in the undo queue. Defaults to True.
+
+        Example:
+            cube.a.setMany({"tx": 1, "r": (0, 90, 0)})
+        """
+        items = []
+        for attr, value in values.items():
+            # Unpacking the [(x, y, z)] that getAttr returns on compounds
+            if isinstance(value, list) and len(value) == 1 \
+                    and isinstance(value[0], tuple):
+                value = value[0]
+            items.append((Attribute(self.node, attr), value))
+
+        _setAttributes(items, undoable)
+
     def zeroAttributes(self, **kwargs):
         """
         Zero's out the transform attributes of the node
@@ -227,12 +756,14 @@ class Attribute(object):
         """
         # Importing here to avoid circular dependency
         from modules.base.core.attribute_condition import Condition
+        from modules.base.core.attribute_expression import cachedExpression
 
         name = self._conditionNodeName(value)
         nodeName = "{0}_{1}_eq_CD".format(name, self.attr)
 
         # Returns nodeName, firstTerm, secondTerm, operation (0 = eq)
-        return Condition(nodeName, self, value, 0).a.outColorR
+        return cachedExpression(("condition", 0), self, value,
+            lambda: Condition(nodeName, self, value, 0).a.outColorR)
 
     def __ne__(self, value):  # !=
         """
@@ -243,12 +774,14 @@ class Attribute(object):
         """
         # Importing here to avoid circular dependency
         from modules.base.core.attribute_condition import Condition
+        from modules.base.core.attribute_expression import cachedExpression
 
         name = self._conditionNodeName(value)
         nodeName = "{0}_{1}_ne_CD".format(name, self.attr)
 
         # Returns nodeName, firstTerm, secondTerm, operation (1 = ne)
-        return Condition(nodeName, self, value, 1).a.outColorR
+        return cachedExpression(("condition", 1), self, value,
+            lambda: Condition(nodeName, self, value, 1).a.outColorR)
 
     def __gt__(self, value):  # >
         """
@@ -259,12 +792,14 @@ class Attribute(object):
         """
         # Importing here to avoid circular dependency
         from modules.base.core.attribute_condition import Condition
+        from modules.base.core.attribute_expression import cachedExpression
 
         name = self._conditionNodeName(value)
         nodeName = "{0}_{1}_gt_CD".format(name, self.attr)
 
         # Returns nodeName, firstTerm, secondTerm, operation (2 = gt)
-        return Condition(nodeName, self, value, 2).a.outColorR
+        return cachedExpression(("condition", 2), self, value,
+            lambda: Condition(nodeName, self, value, 2).a.outColorR)
 
     def __ge__(self, value):  # >=
         """
@@ -275,12 +810,14 @@ class Attribute(object):
         """
         # Importing here to avoid circular dependency
         from modules.base.core.attribute_condition import Condition
+        from modules.base.core.attribute_expression import cachedExpression
 
         name = self._conditionNodeName(value)
         nodeName = "{0}_{1}_ge_CD".format(name, self.attr)
 
         # Returns nodeName, firstTerm, secondTerm, operation (3 = ge)
-        return Condition(nodeName, self, value, 3).a.outColorR
+        return cachedExpression(("condition", 3), self, value,
+            lambda: Condition(nodeName, self, value, 3).a.outColorR)
 
     def __lt__(self, value):  # <
         """
@@ -291,12 +828,14 @@ class Attribute(object):
         """
         # Importing here to avoid circular dependency
         from modules.base.core.attribute_condition import Condition
+        from modules.base.core.attribute_expression import cachedExpression
 
         name = self._conditionNodeName(value)
         nodeName = "{0}_{1}_lt_CD".format(name, self.attr)
 
         # Returns nodeName, firstTerm, secondTerm, operation (4 = lt)
-        return Condition(nodeName, self, value, 4).a.outColorR
+        return cachedExpression(("condition", 4), self, value,
+            lambda: Condition(nodeName, self, value, 4).a.outColorR)
 
     def __le__(self, value):  # <=
         """
@@ -307,17 +846,37 @@ class Attribute(object):
         """
         # Importing here to avoid circular dependency
         from modules.base.core.attribute_condition import Condition
+        from modules.base.core.attribute_expression import cachedExpression
 
         name = self._conditionNodeName(value)
         nodeName = "{0}_{1}_le_CD".format(name, self.attr)
 
         # Returns nodeName, firstTerm, secondTerm, operation (5 = le)
-        return Condition(nodeName, self, value, 5).a.outColorR
+        return cachedExpression(("condition", 5), self, value,
+            lambda: Condition(nodeName, self, value, 5).a.outColorR)
 
     def setCondition(self, **kwargs):
         # Importing here to avoid circular dependency
         from modules.base.core.attribute_condition import Condition
-        return Condition(self.node).setCondition(**kwargs)
+        from modules.base.core import attribute_expression as expression
+
+        node = self.node
+
+        # The connections of a shared condition can't be told apart, a
+        # copy would leave them on the old node.
+        if expression.isSharedExpression(self) and m.listConnections(
+                node.fullPath, source=False, destination=True):
+            raise ValueError(">>> {0} is shared by other expressions and already "
+                             "connected, turn the cache off with setExpressionCaching"
+                             "(False) to edit it.".format(node.name))
+
+        # Every holder but the last edits a copy so the others keep their
+        # values, the last one edits the node itself.
+        if expression.releaseExpression(self):
+            node = m.duplicate(node.fullPath, inputConnections=True)[0]
+            expression.countDuplicate()
+
+        return Condition(node).setCondition(**kwargs)
 
     # -------------------------------------------------------------------------
     # ARITHMETRIC NODES - OPERATIONS
@@ -329,8 +888,20 @@ class Attribute(object):
         Example:
             calc = (node.a.sx + node.a.sy)
         """
+        if isDeferred() or isinstance(value, Expression):
+            return self.expr() + value
+
         return self.plusMinusAverageNode(value)
 
+    def __radd__(self, value):
+        """
+        Adding the attribute to the value passed
+
+        Example:
+            calc = 1 + node.a.sx
+        """
+        return self.__add__(value)
+
     def __sub__(self, value): ###123 (makes it easier to search within our code)
         """
         Substracting the value passed or attribute
@@ -338,8 +909,20 @@ class Attribute(object):
         Example:
             calc = node.a.sx - node.a.sy
         """
+        if isDeferred() or isinstance(value, Expression):
+            return self.expr() - value
+
         return self.plusMinusAverageNode(value, operationType = 2)
 
+    def __rsub__(self, value):
+        """
+        Substracting the attribute from the value passed
+
+        Example:
+            calc = 1 - node.a.sx
+        """
+        return self.evaluate(value - self.expr())
+
     def __mul__(self, value):
         """
         Multiplying the value passed or attribute
@@ -347,8 +930,20 @@ class Attribute(object):
         Example:
             calc = node.a.sx * node.a.sy
         """
+        if isDeferred() or isinstance(value, Expression):
+            return self.expr() * value
+
         return self.multiplyDivideNode(value, operationType = 1)
 
+    def __rmul__(self, value):
+        """
+        Multiplying the value passed by the attribute
+
+        Example:
+            calc = 2 * node.a.sx
+        """
+        return self.__mul__(value)
+
     def __div__(self, value):
         """
         Dividing the value passed or attribute
@@ -356,7 +951,7 @@ class Attribute(object):
         Example:
             calc = node.a.sx / node.a.sy
         """
-        return self.multiplyDivideNode(value, operationType = 2)
+        return self.__truediv__(value)
 
     def __truediv__(self, value):
         """
@@ -365,8 +960,22 @@ class Attribute(object):
         Example:
             calc = node.a.sx / node.a.sy
         """
+        if isDeferred() or isinstance(value, Expression):
+            return self.expr() / value
+
         return self.multiplyDivideNode(value, operationType = 2)
 
+    def __rtruediv__(self, value):
+        """
+        Dividing the value passed by the attribute
+
+        Example:
+            calc = 1 / node.a.sx
+        """
+        return self.evaluate(value / self.expr())
+
+    __rdiv__ = __rtruediv__
+
     def __pow__(self, value):
         """
         Power the value passed or attribute
@@ -374,7 +983,48 @@ class Attribute(object):
         Example:
             calc = node.a.sx ** node.a.sy
         """
+        if isDeferred() or isinstance(value, Expression):
+            return self.expr() ** value
+
         return self.multiplyDivideNode(value, operationType = 3)
+
+    def __rpow__(self, value):
+        """
+        Power the value passed by the attribute
+
+        Example:
+            calc = 2 ** node.a.sx
+        """
+        return self.evaluate(value ** self.expr())
+
+    # -------------------------------------------------------------------------
+    # ARITHMETRIC NODES - DEFERRED EXPRESSIONS
+
+    def expr(self):
+        """
+        Starts a deferred expression from this attribute, the constants are
+        folded and no node is created until it is connected or committed.
+
+        Returns:
+            Expression: The expression holding this attribute.
+
+        Example:
+            (node.a.sx.expr() + 1 + 2) >> node.a.sy  # One plusMinusAverage
+        """
+        return Expression(None, [self])
+
+    def evaluate(self, expression):
+        """
+        Commits the expression unless the operators are being deferred.
+
+        Args:
+            expression (Expression): The expression built from this attribute.
+
+        Returns:
+            Expression/Attribute: The expression if deferred, the output
+                                  attribute of its nodes otherwise.
+        """
+        return expression if isDeferred() else expression.commit()
     
      # -------------------------------------------------------------------------
      # ARITHMETRIC NODES - NODE HANDLING / ATTRIBUTES
@@ -459,6 +1109,9 @@ class Attribute(object):
             calc = ((node.a.sx + node.a.sy) + node.a.sz) + 10
             calc.a.output >> node.a.s
         """
+        # Importing here to avoid circular dependency
+        from modules.base.core import attribute_expression as expression
+
         # The node type
         nodeType = "plusMinusAverage"
         nodeName = self.createNodeName(value, nodeType)
@@ -467,13 +1120,19 @@ class Attribute(object):
         attribute = "input3D" if self.checkConnectionAttribute(
             value) else "input1D"
 
-        # This make the addition to a current plusMinus node if is self
-        if (m.objectType(self.node) == nodeType) and (m.getAttr(self.node.a.operation) == operationType):
+        # This make the addition to a current plusMinus node if is self,
+        # nodes reused by other expressions are left untouched.
+        if (m.objectType(self.node) == nodeType) and (m.getAttr(self.node.a.operation) == operationType) \
+                and not expression.isSharedExpression(self):
+            expression.forgetExpression(self)
             self.addToPlusMinusAverage(attribute, value)
 
         # Make this the straight string and float input
         else:
-            return self.createPlusMinusAverage(nodeName, nodeType, operationType, attribute, value)
+            return expression.cachedExpression(
+                (nodeType, operationType), self, value,
+                lambda: self.createPlusMinusAverage(
+                    nodeName, nodeType, operationType, attribute, value))
 
         return self
 
@@ -514,11 +1173,31 @@ class Attribute(object):
             calc = ((node.a.sx * node.a.sy) * node.a.sz) * 10
             calc.a.output >> node.a.s
         """
+        # Importing here to avoid circular dependency
+        from modules.base.core.attribute_expression import cachedExpression
+
         nodeType = "multiplyDivide"
         nodeName = self.createNodeName(value, nodeType)
 
-        # This makes the addition to a current plusMinus node if is self
+        # Reusing the node of an identical expression if there is one
+        return cachedExpression(
+            (nodeType, operationType), self, value,
+            lambda: self.createMultiplyDivide(
+                nodeName, nodeType, operationType, value))
+
+    def createMultiplyDivide(self, nodeName, nodeType, operationType, value):
+        """
+        Picks and creates the multiply/divide node for the operands.
+
+        Args:
+            nodeName (str): The full node name to use.
+            nodeType (str): The node to use.
+            operationType (int): The index of the node type to use.
+            value (int/float/str/attributeObject): The value to use.
 
+        Returns:
+            class: The attribute object output.
+        """
         # ---- Multiply
 
         if operationType == 1:
@@ -661,14 +1340,20 @@ class Attribute(object):
         """
         Check whether the connection is a parent.
         """
-        return bool(self.children)
+        metadata = self.metadata
+        return bool(metadata and (metadata["children"] or
+                                  (metadata["multi"] and not self.plug.isElement())))
 
     @property
     def isChild(self):
         """
         Check whether the connection is a child.
         """
-        return bool(self.parent)
+        if "." in self.attr:
+            return True
+
+        metadata = self.metadata
+        return bool(metadata and metadata["parent"] and not self.plug.isElement())
 
     # -------------------------------------------------------------------------
     # PROPERTIES
@@ -695,6 +1380,35 @@ class Attribute(object):
         """
         return self._attribute
 
+    @property
+    def plug(self):
+        """
+        The OpenMaya plug of the attribute, resolved once and cached.
+
+        Returns:
+            MPlug: The attribute plug or None if it doesn't exist.
+
+        Example:
+            print(sphere.a.rotateX.plug.name())
+            # Output: "sphere_GEO.rotateX"
+        """
+        return getPlug(self.node, self.attribute)
+
+    @property
+    def metadata(self):
+        """
+        The cached structure of the attribute: children, parent, multi,
+        indexMatters, type and dynamic.
+
+        Returns:
+            dict: The attribute metadata or None if it doesn't exist.
+
+        Example:
+            print(sphere.a.rotateX.metadata["parent"])
+            # Output: "rotate"
+        """
+        return getAttributeInfo(self.node, self.attribute)
+
     @property
     def path(self):
         """
@@ -707,9 +1421,9 @@ class Attribute(object):
             print(sphere.a.rotateX.path)
             # Output: "sphere_GEO.rotateX"
         """
-        nodePath = "{0}.{1}".format(self.node.path, self.attribute)
-        if self.node.path and m.objExists(nodePath):
-            return nodePath
+        nodePath = self.node.path
+        if nodePath and self.plug is not None:
+            return "{0}.{1}".format(nodePath, self.attribute)
 
     @property
     def fullPath(self):
@@ -724,9 +1438,9 @@ class Attribute(object):
             print(sphere.a.rotateX.fullPath)
             Output: "|BASE_GRP|SUB_GRP|sphere_GEO.rotateX"
         """
-        nodePath = "{0}.{1}".format(self.node.fullPath, self.attribute)
-        if self.node.fullPath and m.objExists(nodePath):
-            return nodePath
+        nodePath = self.node.fullPath
+        if nodePath and self.plug is not None:
+            return "{0}.{1}".format(nodePath, self.attribute)
 
     @property
     def children(self):
@@ -744,11 +1458,16 @@ class Attribute(object):
             print(sphere.a.rx.children)
             Output: []
         """
-        if self.query(indexMatters = True, multi = True):
-            multiIndices = m.getAttr(self, multiIndices = True)
-            index = len(multiIndices) if multiIndices else 0
+        metadata = self.metadata
+        if metadata is None:
+            return []
 
-            lc = self.query(listChildren = True)
+        lc = metadata["children"]
+
+        if metadata["multi"] and not self.plug.isElement():
+            multiIndices = OpenMaya.MIntArray()
+            self.plug.getExistingArrayAttributeIndices(multiIndices)
+            index = len(multiIndices)
 
             # If children return all the multi indices attrs
             if lc:
@@ -758,9 +1477,11 @@ class Attribute(object):
             else:
                 return [self.node.a["%s[%s]" % (self.attr, index)] ]
 
-        return [
-            self.node.a[attr]
-            for attr in self.query(listChildren = True) or [] ]
+        # Children of a multi index keep the index on their path
+        if "[" in self.attr:
+            return [self.node.a["%s.%s" % (self.attr, a)] for a in lc]
+
+        return [self.node.a[attr] for attr in lc]
 
     @property
     def parent(self):
@@ -774,9 +1495,12 @@ class Attribute(object):
             print(sphere.a.rotate.parent)
             Output: []
         """
-        a = self.query(listParent = True)
-        if a:
-            return Attribute(self.node, a[0]) or []
+        if "." in self.attr:
+            return Attribute(self.node, self.attr.rsplit(".", 1)[0])
+
+        metadata = self.metadata
+        if metadata and metadata["parent"] and not self.plug.isElement():
+            return Attribute(self.node, metadata["parent"])
         return []
 
     @property
@@ -807,11 +1531,10 @@ class Attribute(object):
 
         attrs = m.listConnections(self.fullPath, p = 1, d = 0) or []
 
-        if self.children:
-            for child in self.children:
-                childAttrs = m.listConnections(child.fullPath, p = 1, d = 0)
-                if childAttrs:
-                    attrs += childAttrs
+        for child in self.children:
+            childAttrs = m.listConnections(child.fullPath, p = 1, d = 0)
+            if childAttrs:
+                attrs += childAttrs
 
         inputs = []
         
@@ -839,11 +1562,10 @@ class Attribute(object):
 
         attrs = m.listConnections(self.fullPath, p=1) or []
 
-        if self.children:
-            for child in self.children:
-                childAttrs = m.listConnections(child.fullPath, p=1)
-                if childAttrs:
-                    attrs += childAttrs
+        for child in self.children:
+            childAttrs = m.listConnections(child.fullPath, p=1)
+            if childAttrs:
+                attrs += childAttrs
 
         if attrs:
             attrNodes = [
@@ -865,7 +1587,7 @@ class Attribute(object):
 
             Output: True
         """
-        if self.fullPath:
+        if self.plug is not None:
             return True
         return False
 
@@ -880,13 +1602,20 @@ class Attribute(object):
 
     def get(self, **kwargs):
         """
-        Gets our attribute value using functionality from maya.cmds
+        Gets our attribute value, numeric values are read straight from
+        the cached plug, anything else uses functionality from maya.cmds
 
         Example:
             print(sphere.a.rx.get())
 
             Output: 1
         """
+        plug = self.plug
+        if plug is not None and not kwargs:
+            value = _readPlug(plug)
+            if value is not _UNSUPPORTED:
+                return value
+
         return m.getAttr(self.fullPath, **kwargs)
 
     def query(self, **kwargs):
@@ -911,8 +1640,10 @@ class Attribute(object):
             sphere.a.rx.connect(cube.a.rx)
         """
         if not m.isConnected(self, attr):
+            selfInfo, attrInfo = self.metadata, attr.metadata
 
-            if (self.query(lc=1) != None) and (attr.query(lc = 1) == None):
+            if (selfInfo and selfInfo["children"]) and not (
+                    attrInfo and attrInfo["children"]):
                 raise ValueError(
                     """The driving of these values might be a parent value such as scale 
                     and the driven cannot then be a child such as scaleX, 
@@ -938,14 +1669,15 @@ class Attribute(object):
         Example:
             cube.a.r.disconnect()
         """
-        allAttrs = self.children if self.children else self
+        children = self.children
+        allAttrs = children if children else self
         connections = m.listConnections(allAttrs, s = 1, p = 1)
 
         if not connections:
             return None
 
-        if self.children:
-            for child_attr in self.children:
+        if children:
+            for child_attr in children:
                 conn_attr = m.listConnections(child_attr, s = 1, p = 1)
                 if not conn_attr:
                     continue
@@ -971,8 +1703,9 @@ class Attribute(object):
 
     def lock(self, value = True):
         """ Locks current attribute """
-        if self.children:
-            for child in self.children:
+        children = self.children
+        if children:
+            for child in children:
                 m.setAttr(child, lock = value)
         else:
             m.setAttr(self.fullPath, lock = value)
@@ -983,8 +1716,9 @@ class Attribute(object):
     
     def show(self, value = True):
         """ Show current attribute on channel box. """
-        if self.children:
-            for child in self.children:
+        children = self.children
+        if children:
+            for child in children:
                 m.setAttr(child, keyable = value)
         else:
            m.setAttr(self.fullPath, keyable = value)
@@ -0,0 +1,293 @@
+'''
+/*****************************************************************************/
+                          Attribute Compiler v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Compiles the deferred Attribute expressions into the fewest native
+    nodes, independent scalar operations share the X, Y and Z lanes of a
+    single multiplyDivide or plusMinusAverage, products are paired so they
+    evaluate in parallel and chains of matrices become one multMatrix.
+
+>> HOW TO USE >>
+	Opt-in from the deferred context, every expression connected inside
+    it is compiled together when the context ends:
+
+        with deferred(compiled=True):
+            (node.a.tx * 2) >> other.a.tx
+            (node.a.ty * 3) >> other.a.ty  # Shares the multiplyDivide
+
+>> CONTENTS >>
+    + compileExpressions [Func]
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import sys
+from maya import cmds as m
+from modules.base.core.attribute_expression import (Expression, _isNumber, _isConstant,
+                                                    _isVector, _toOperand, _foldConstants)
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+class _Operation(object):
+    """
+    _Operation [Class]
+
+    One operation of a compiled expression, it takes a lane of a scalar
+    node or a whole node for vectors and matrices.
+
+    Args:
+        nodeType (str): "plusMinusAverage", "multiplyDivide" or "multMatrix".
+        operationType (int): The operation attribute value of the node.
+        operands (list): Numbers, Attributes or other _Operations.
+    """
+    def __init__(self, nodeType, operationType, operands):
+        self.nodeType = nodeType
+        self.operationType = operationType
+        self.operands = operands
+        self.output = None
+
+        kinds = [_kind(i) for i in operands]
+
+        if nodeType == "multMatrix" or "matrix" in kinds:
+            if nodeType != "multMatrix" or set(kinds) != {"matrix"}:
+                raise ValueError(
+                    ">>> Matrices can only be multiplied by other matrices.")
+            self.kind = "matrix"
+        else:
+            self.kind = "vector" if "vector" in kinds else "scalar"
+
+        self.level = 1 + max([i.level for i in operands
+                              if isinstance(i, _Operation)] or [0])
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def compileExpressions(connections, verbose=True):
+    """
+    compileExpressions [Function]
+
+    Creates the nodes of several expressions at once, sharing the nodes
+    between them wherever the operations are independent.
+
+    Args:
+        connections (list): [(Expression, Attribute or None), ...] the
+                            expressions and the attributes they drive.
+        verbose (bool): Print the node count report. Defaults to True.
+
+    Returns:
+        dict: {"outputs": [Attribute or number, ...],
+               "before": nodes with one node per operator,
+               "after": nodes created}
+
+    Example:
+        compileExpressions([(node.a.tx.expr() * 2, other.a.tx),
+                            (node.a.ty.expr() * 3, other.a.ty)])
+        # Output: >>> Compiled 2 expressions: 2 nodes -> 1 nodes.
+    """
+    before = sum(i.operatorCount() for i, _ in connections)
+    roots = [_lower(_simplify(i)) for i, _ in connections]
+
+    after = 0
+    for nodeType, operations in _schedule(roots):
+        _createNode(nodeType, operations)
+        after += 1
+
+    outputs = [_output(i) for i in roots]
+
+    for output, (_, attr) in zip(outputs, connections):
+        if attr is not None:
+            _setInput(attr, output, bool(attr.children))
+
+    if verbose:
+        sys.stdout.write(">>> Compiled {0} expressions: {1} nodes -> {2} nodes.\n".format(
+            len(connections), before, after))
+
+    return {"outputs": outputs, "before": before, "after": after}
+
+# -----------------------------------------------------------------------------
+
+def _simplify(value):
+    return value.simplify() if isinstance(value, Expression) else value
+
+
+def _kind(value):
+    if isinstance(value, _Operation):
+        return value.kind
+
+    if _isNumber(value):
+        return None
+
+    if _isVector(value):
+        return "vector"
+
+    if value.metadata["type"] == "matrix":
+        return "matrix"
+
+    return "vector" if value.isParent else "scalar"
+
+
+def _lower(value):
+    """ Turns a simplified expression into _Operations. """
+    if not isinstance(value, Expression):
+        return _toOperand(value)
+
+    operands = [_lower(i) for i in value.operands]
+
+    if all(_isConstant(i) for i in operands):
+        return _foldConstants(value.operation, operands)
+
+    if value.operation == "add":
+        return _Operation("plusMinusAverage", 1, operands)
+
+    if value.operation == "sub":
+        return _Operation("plusMinusAverage", 2, operands)
+
+    if value.operation == "mul":
+        if "matrix" in [_kind(i) for i in operands]:
+            return _Operation("multMatrix", None, operands)
+
+        # Pairing the factors keeps the products on as few levels as possible
+        while len(operands) > 1:
+            pairs = [operands[i:i + 2] for i in range(0, len(operands), 2)]
+            operands = [_product(i) if len(i) == 2 else i[0] for i in pairs]
+
+        return operands[0]
+
+    operationType = 2 if value.operation == "div" else 3
+    return _Operation("multiplyDivide", operationType, operands)
+
+
+def _product(factors):
+    """ A multiplyDivide of two factors, two constants are folded. """
+    if all(_isConstant(i) for i in factors):
+        return _foldConstants("mul", factors)
+
+    return _Operation("multiplyDivide", 1, factors)
+
+
+def _schedule(roots):
+    """
+    Groups the operations in the order they have to be created.
+
+    Returns:
+        list: [(nodeType, [_Operation, ...]), ...] one item for each node.
+    """
+    operations = []
+
+    def collect(value):
+        if isinstance(value, _Operation) and value not in operations:
+            for i in value.operands:
+                collect(i)
+            operations.append(value)
+
+    for root in roots:
+        collect(root)
+
+    groups = {}
+    for operation in operations:
+        key = (operation.level, operation.nodeType,
+               operation.operationType, operation.kind)
+        groups.setdefault(key, []).append(operation)
+
+    nodes = []
+    for key in sorted(groups, key=lambda i: i[0]):
+        lanes = 3 if key[3] == "scalar" else 1
+        group = groups[key]
+
+        for index in range(0, len(group), lanes):
+            nodes.append((key[1], group[index:index + lanes]))
+
+    return nodes
+
+
+def _output(value):
+    return value.output if isinstance(value, _Operation) else value
+
+
+def _setInput(attr, value, vector=False):
+    """ Connects or sets the value into the node input. """
+    value = _output(value)
+
+    if _isNumber(value):
+        if vector:
+            attr.set(value, value, value)
+        else:
+            attr.set(value)
+
+    elif _isVector(value):
+        attr.set(*value)
+
+    elif _kind(value) == "matrix":
+        m.connectAttr(value.fullPath, attr.fullPath, force=True)
+
+    else:
+        value >> attr
+
+
+def _createNode(nodeType, operations):
+    """ Creates one node holding the operations, one on each lane. """
+    # Importing here to avoid circular dependency
+    from modules.base import Dep_Node
+
+    attr = [_output(i) for i in operations[0].operands
+            if not _isConstant(i)][0]
+    node = Dep_Node(m.createNode(
+        nodeType, n=attr.createNodeName("compiled", nodeType)))
+
+    if nodeType == "multMatrix":
+        operation = operations[0]
+        for index, factor in enumerate(operation.operands):
+            _setInput(node.a["matrixIn[{0}]".format(index)], factor)
+
+        operation.output = node.a.matrixSum
+        return node
+
+    node.a.operation.set(operations[0].operationType)
+
+    if operations[0].kind == "vector":
+        operation = operations[0]
+
+        if nodeType == "plusMinusAverage":
+            for index, term in enumerate(operation.operands):
+                _setInput(node.a["input3D[{0}]".format(index)], term, True)
+            operation.output = node.a.output3D
+
+        else:
+            _setInput(node.a.input1, operation.operands[0], True)
+            _setInput(node.a.input2, operation.operands[1], True)
+            operation.output = node.a.output
+
+        return node
+
+    for axis, operation in zip("XYZ", operations):
+        if nodeType == "plusMinusAverage":
+            for index, term in enumerate(operation.operands):
+                _setInput(node.a["input3D[{0}].input3D{1}".format(
+                    index, axis.lower())], term)
+            operation.output = node.a["output3D" + axis.lower()]
+
+        else:
+            _setInput(node.a["input1" + axis], operation.operands[0])
+            _setInput(node.a["input2" + axis], operation.operands[1])
+            operation.output = node.a["output" + axis]
+
+    return node
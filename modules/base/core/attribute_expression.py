@@ -0,0 +1,797 @@
+'''
+/*****************************************************************************/
+                        Attribute Expression v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Expression cache for the Attribute arithmetic and condition operators,
+    asking for the same expression twice reuses the utility node that was
+    created the first time instead of building an identical one.
+
+    Deferred expressions record the arithmetic as a tree instead, constants
+    are folded and chains of sums are flattened before any node is created.
+
+>> HOW TO USE >>
+	This module is used by the Attribute operators, the public functions
+    can be used to turn the cache off, clear it or check how many nodes
+    were saved during the session.
+
+>> CONTENTS >>
+    + setExpressionCaching [Func]
+    + clearExpressionCache [Func]
+    + expressionCacheStats [Func]
+    + deferred [Func]
+    + Expression [Class]
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+    Update 18/10/2026 : Added deferred expressions with constant folding.
+    Update 18/10/2026 : Deferred expressions can be compiled together.
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import operator
+import sys
+import six
+from contextlib import contextmanager
+from maya import cmds as m
+from maya import OpenMaya
+from modules.utils import open_maya_api
+
+# -----------------------------------------------------------------------------
+# EXPRESSION CACHE
+# -----------------------------------------------------------------------------
+
+# {key: (result Attribute, [operand MObjectHandle, ...])}
+_EXPRESSION_CACHE = {}
+
+# {result nodeKey: [key, hits]} hits is the number of holders after the first.
+_EXPRESSION_RESULTS = {}
+
+_EXPRESSION_STATS = {"created": 0, "reused": 0, "duplicated": 0}
+
+_SETTINGS = {"enabled": True, "deferred": 0, "queue": None}
+
+# New/Open scene callbacks that clear the whole cache.
+_SCENE_CALLBACKS = []
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def setExpressionCaching(state=True):
+    """
+    Turns the reuse of utility nodes on or off for the session.
+
+    Args:
+        state (bool): The cache state. Defaults to True.
+
+    Example:
+        setExpressionCaching(False)
+        calc = node.a.sx * 2 # Always builds a new node
+    """
+    _SETTINGS["enabled"] = bool(state)
+
+
+def clearExpressionCache(*args):
+    """
+    Forgets every cached expression and resets the session stats.
+
+    Example:
+        clearExpressionCache()
+    """
+    _EXPRESSION_CACHE.clear()
+    _EXPRESSION_RESULTS.clear()
+
+    for key in _EXPRESSION_STATS:
+        _EXPRESSION_STATS[key] = 0
+
+
+def expressionCacheStats(verbose=False):
+    """
+    How many utility nodes the operators created and how many were saved
+    by reusing an existing one during the session.
+
+    Args:
+        verbose (bool): Print the stats. Defaults to False.
+
+    Returns:
+        dict: {"created": int, "reused": int, "duplicated": int, "saved": int}
+
+    Example:
+        expressionCacheStats(verbose=True)
+        # Output: >>> Expression cache: 120 nodes created, 80 saved.
+    """
+    stats = dict(_EXPRESSION_STATS)
+    stats["saved"] = stats["reused"] - stats["duplicated"]
+
+    if verbose:
+        sys.stdout.write(">>> Expression cache: {0} nodes created, {1} saved.\n".format(
+            stats["created"], stats["saved"]))
+
+    return stats
+
+# -----------------------------------------------------------------------------
+
+def _registerSceneCallbacks():
+    """ Clears the cache when a new scene is created or opened. """
+    if _SCENE_CALLBACKS:
+        return
+
+    for message in (OpenMaya.MSceneMessage.kBeforeNew,
+                    OpenMaya.MSceneMessage.kBeforeOpen):
+        _SCENE_CALLBACKS.append(
+            OpenMaya.MSceneMessage.addCallback(message, clearExpressionCache))
+
+
+def _plugKey(plug):
+    """ The node key and long attribute path, so "sx" and "scaleX" match. """
+    handle = OpenMaya.MObjectHandle(plug.node())
+    name = plug.partialName(False, True, True, False, True, True)
+
+    return (open_maya_api.nodeKey(plug.node()), name), handle
+
+
+def _operandKey(value):
+    """
+    Normalizes an operand into a hashable key.
+
+    Args:
+        value (int/float/list/str/Attribute): The operand.
+
+    Returns:
+        tuple: (key, [MObjectHandle]) or (None, None) if it can't be cached.
+    """
+    if isinstance(value, (int, float)):
+        return ("value", float(value)), []
+
+    if isinstance(value, (list, tuple)) and all(
+            isinstance(i, (int, float)) for i in value):
+        return ("value",) + tuple(float(i) for i in value), []
+
+    plug = None
+    if isinstance(value, six.string_types):
+        try:
+            plug = open_maya_api.toMPlug(value)
+        except RuntimeError:
+            pass
+    else:
+        plug = getattr(value, "plug", None)
+
+    if plug is None:
+        return None, None
+
+    key, handle = _plugKey(plug)
+    return key, [handle]
+
+
+def _nodeKey(attr):
+    dep = getattr(attr.node, "dep", None)
+    if dep is None:
+        return None
+
+    return open_maya_api.nodeKey(dep.object())
+
+
+def _expressionKey(operation, attr, value):
+    attrKey, attrHandles = _operandKey(attr)
+    valueKey, valueHandles = _operandKey(value)
+
+    if attrKey is None or valueKey is None:
+        return None, None
+
+    return (operation, attrKey, valueKey), attrHandles + valueHandles
+
+
+def cachedExpression(operation, attr, value, build):
+    """
+    Returns the output of an existing node doing the same operation on
+    the same operands, or builds a new one and remembers it.
+
+    Args:
+        operation (tuple): The node type and operation, ("multiplyDivide", 1).
+        attr (Attribute): The first operand.
+        value (int/float/str/Attribute): The second operand.
+        build (callable): Creates the node and returns its output Attribute.
+
+    Returns:
+        Attribute: The output attribute of the node.
+    """
+    key = None
+    if _SETTINGS["enabled"]:
+        key, handles = _expressionKey(operation, attr, value)
+
+    if key is not None and key in _EXPRESSION_CACHE:
+        cached, cachedHandles = _EXPRESSION_CACHE[key]
+
+        if cached.plug is not None and all(h.isValid() for h in cachedHandles):
+            entry = _EXPRESSION_RESULTS.get(_nodeKey(cached))
+            if entry:
+                entry[1] += 1
+            _EXPRESSION_STATS["reused"] += 1
+            return cached
+
+        # The node or one of the operands was deleted
+        _EXPRESSION_CACHE.pop(key)
+
+    result = build()
+    _EXPRESSION_STATS["created"] += 1
+
+    resultKey = _nodeKey(result) if key is not None else None
+    if resultKey is not None:
+        _registerSceneCallbacks()
+        _EXPRESSION_CACHE[key] = (result, handles)
+        _EXPRESSION_RESULTS[resultKey] = [key, 0]
+
+    return result
+
+
+def isSharedExpression(attr):
+    """
+    Checks if the node of the attribute was handed out to more than
+    one expression, those nodes must not be edited in place.
+
+    Args:
+        attr (Attribute): An output of a cached node.
+
+    Returns:
+        bool: True if the node was reused at least once.
+    """
+    entry = _EXPRESSION_RESULTS.get(_nodeKey(attr))
+
+    return bool(entry and entry[1])
+
+
+def forgetExpression(attr):
+    """
+    Removes the node of the attribute from the cache, used before a node
+    is edited so later expressions don't pick up the edited node.
+
+    Args:
+        attr (Attribute): An output of a cached node.
+    """
+    entry = _EXPRESSION_RESULTS.pop(_nodeKey(attr), None)
+
+    if entry:
+        _EXPRESSION_CACHE.pop(entry[0], None)
+
+
+def releaseExpression(attr):
+    """
+    One holder of a cached node is going to edit it. While other holders
+    still use the node the caller has to edit a copy, the last holder
+    edits the node in place and it leaves the cache.
+
+    Args:
+        attr (Attribute): An output of a cached node.
+
+    Returns:
+        bool: True if other holders still use the node.
+    """
+    entry = _EXPRESSION_RESULTS.get(_nodeKey(attr))
+
+    if entry and entry[1]:
+        entry[1] -= 1
+        return True
+
+    forgetExpression(attr)
+    return False
+
+
+def countDuplicate():
+    """ A shared node had to be duplicated, so one less node was saved. """
+    _EXPRESSION_STATS["duplicated"] += 1
+    _EXPRESSION_STATS["created"] += 1
+
+# -----------------------------------------------------------------------------
+# DEFERRED EXPRESSIONS
+# -----------------------------------------------------------------------------
+
+@contextmanager
+def deferred(compiled=False):
+    """
+    Inside this context the Attribute arithmetic operators return an
+    Expression instead of creating nodes, nodes are only created when the
+    expression is connected with ">>" or committed.
+
+    Args:
+        compiled (bool): Queue the connections and compile them together
+                         into the fewest nodes when the context ends.
+                         Defaults to False.
+
+    Example:
+        with deferred():
+            calc = (node.a.sx + 1) + 2  # No nodes yet
+            calc >> node.a.sy           # A single plusMinusAverage
+
+        with deferred(compiled=True):
+            (node.a.tx * 2) >> other.a.tx
+            (node.a.ty * 3) >> other.a.ty
+        # Output: >>> Compiled 2 expressions: 2 nodes -> 1 nodes.
+    """
+    queue = _SETTINGS["queue"]
+    _SETTINGS["deferred"] += 1
+
+    if compiled:
+        _SETTINGS["queue"] = []
+
+    try:
+        yield
+
+        if compiled and _SETTINGS["queue"]:
+            # Importing here to avoid circular dependency
+            from modules.base.core.attribute_compiler import compileExpressions
+            compileExpressions(_SETTINGS["queue"])
+    finally:
+        _SETTINGS["deferred"] -= 1
+        _SETTINGS["queue"] = queue
+
+
+def isDeferred():
+    """ Checks if the operators are recording expressions. """
+    return _SETTINGS["deferred"] > 0
+
+
+def _isNumber(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _isVector(value):
+    return isinstance(value, tuple) and len(value) == 3 and all(_isNumber(i) for i in value)
+
+
+def _isConstant(value):
+    return _isNumber(value) or _isVector(value)
+
+
+def _toOperand(value):
+    """
+    The operand as the expressions use it, "node.attr" strings become
+    Attributes and lists of three numbers a constant vector.
+
+    Args:
+        value (int/float/list/str/Attribute/Expression): The operand.
+
+    Returns:
+        float/tuple/Attribute/Expression: The normalized operand.
+    """
+    if _isNumber(value):
+        return float(value)
+
+    if isinstance(value, (list, tuple)):
+        if len(value) != 3 or not all(_isNumber(i) for i in value):
+            raise ValueError(">>> Constant vectors need three numbers, got {0}.".format(value))
+
+        return tuple(float(i) for i in value)
+
+    if isinstance(value, six.string_types):
+        # Importing here to avoid circular dependency
+        from modules.base import Attribute, Dag_Node, Dep_Node
+
+        try:
+            plug = open_maya_api.toMPlug(value)
+        except RuntimeError:
+            raise ValueError(">>> {0} is not an attribute.".format(value))
+
+        obj = plug.node()
+        nodeClass = Dag_Node if obj.hasFn(OpenMaya.MFn.kDagNode) else Dep_Node
+
+        return Attribute(nodeClass.fromMObject(obj),
+                         plug.partialName(False, True, True, False, False, True))
+
+    return value
+
+
+def _dimension(value):
+    """ 3 for vectors and parent attributes, 1 for child ones, None for numbers. """
+    if _isNumber(value):
+        return None
+
+    if _isVector(value):
+        return 3
+
+    return 3 if value.isParent else 1
+
+
+_OPERATORS = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "div": operator.truediv,
+    "pow": operator.pow,
+}
+
+
+def _foldConstants(operation, operands):
+    """ The value of an operation on constants, numbers apply to every axis. """
+    if not any(_isVector(i) for i in operands):
+        return six.moves.reduce(_OPERATORS[operation], operands)
+
+    return tuple(six.moves.reduce(_OPERATORS[operation],
+                                  [i[axis] if _isVector(i) else i for i in operands])
+                 for axis in range(3))
+
+
+class Expression(object):
+    """
+    Expression [Class]
+
+    A node of a recorded arithmetic expression, the operands can be numbers,
+    Attributes or other Expressions.
+
+    Args:
+        operation (str): "add", "sub", "mul", "div", "pow" or None for a leaf.
+        operands (list): The operands of the operation.
+
+    Example:
+        calc = node.a.sx.expr() * 2 / 4
+        calc >> node.a.sy  # A single multDoubleLinear with input2 = 0.5
+    """
+    # -------------------------------------------------------------------------
+    # SPECIAL/MAGIC/DUNDER METHODS
+
+    def __init__(self, operation, operands):
+        self.operation = operation
+        self.operands = list(operands)
+
+    def __repr__(self):
+        if self.operation is None:
+            return "Expression({})".format(self.operands[0])
+
+        return "Expression({0}, {1})".format(self.operation, self.operands)
+
+    def __add__(self, value):
+        return Expression("add", [self, value])
+
+    def __radd__(self, value):
+        return Expression("add", [value, self])
+
+    def __sub__(self, value):
+        return Expression("sub", [self, value])
+
+    def __rsub__(self, value):
+        return Expression("sub", [value, self])
+
+    def __mul__(self, value):
+        return Expression("mul", [self, value])
+
+    def __rmul__(self, value):
+        return Expression("mul", [value, self])
+
+    def __truediv__(self, value):
+        return Expression("div", [self, value])
+
+    def __rtruediv__(self, value):
+        return Expression("div", [value, self])
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __pow__(self, value):
+        return Expression("pow", [self, value])
+
+    def __rpow__(self, value):
+        return Expression("pow", [value, self])
+
+    def __neg__(self):
+        return Expression("mul", [self, -1])
+
+    def __rshift__(self, attr):
+        """
+        Creates the nodes and connects the result into the attribute.
+
+        Example:
+            (node.a.sx.expr() + 1) >> node.a.sy
+        """
+        return self.connect(attr)
+
+    # -------------------------------------------------------------------------
+    # METHODS
+
+    def simplify(self):
+        """
+        Folds the constants and flattens the chains of the expression.
+
+        Returns:
+            number/Attribute/Expression: The simplest equivalent expression.
+
+        Example:
+            print(((node.a.sx.expr() + 1) + 2).simplify())
+            # Output: Expression(add, [Attribute('node.sx'), 3.0])
+        """
+        operands = [_simplify(i) for i in self.operands]
+
+        if self.operation is None:
+            return operands[0]
+
+        return _SIMPLIFY[self.operation](*operands)
+
+    def commit(self):
+        """
+        Creates the nodes of the simplified expression.
+
+        Returns:
+            Attribute/number: The output attribute, or the folded value
+                              if the expression was only constants.
+        """
+        if _SETTINGS["queue"] is not None:
+            # Importing here to avoid circular dependency
+            from modules.base.core.attribute_compiler import compileExpressions
+            return compileExpressions([(self, None)], False)["outputs"][0]
+
+        return _build(self.simplify())
+
+    def operatorCount(self):
+        """
+        The nodes this expression would cost with one node per operator.
+
+        Example:
+            print(((node.a.sx.expr() + 1) * 2).operatorCount())
+            # Output: 2
+        """
+        return sum(i.operatorCount() for i in self.operands
+                   if isinstance(i, Expression)) + (self.operation is not None)
+
+    def connect(self, attr):
+        """
+        Commits the expression and connects or sets the attribute with it.
+
+        Args:
+            attr (Attribute): The attribute to drive.
+
+        Returns:
+            Attribute/number: The committed expression output, None when
+                              it was queued to be compiled.
+        """
+        if _SETTINGS["queue"] is not None:
+            _SETTINGS["queue"].append((self, attr))
+            return None
+
+        result = self.commit()
+
+        if _isNumber(result):
+            children = attr.children
+            if children:
+                attr.set(*[result] * len(children))
+            else:
+                attr.set(result)
+        elif _isVector(result):
+            attr.set(*result)
+        else:
+            result.connect(attr)
+
+        return result
+
+
+def _simplify(value):
+    if isinstance(value, Expression):
+        return value.simplify()
+
+    return _toOperand(value)
+
+
+def _terms(value, operation):
+    """ The operands to flatten into a chain of the same operation. """
+    if isinstance(value, Expression) and value.operation == operation:
+        return list(value.operands)
+
+    return [value]
+
+
+def _simplifyAdd(*operands):
+    terms = []
+    for i in operands:
+        terms += _terms(i, "add")
+
+    total = sum(i for i in terms if _isNumber(i))
+    terms = [i for i in terms if not _isNumber(i)]
+
+    if not terms:
+        return total
+
+    # A constant added to a subtraction chain is one more input of it
+    if len(terms) == 1 and _terms(terms[0], "sub") != terms:
+        return _subtractTerms(_terms(terms[0], "sub") + [-total])
+
+    if total:
+        terms.append(total)  # Constants go last, the first input is a plug
+
+    return terms[0] if len(terms) == 1 else Expression("add", terms)
+
+
+def _simplifySub(left, right):
+    if _isNumber(right):
+        return _simplifyAdd(left, -right)
+
+    return _subtractTerms(_terms(left, "sub") + [right])
+
+
+def _subtractTerms(terms):
+    """ Only the first term of a subtraction chain is added. """
+    total = sum(i for i in terms[1:] if _isNumber(i))
+    terms = terms[:1] + [i for i in terms[1:] if not _isNumber(i)]
+
+    # Constants of the first term are substracted with the others
+    first = _terms(terms[0], "add")
+    if len(first) > 1 and _isNumber(first[-1]):
+        total -= first[-1]
+        terms[0] = first[0] if len(first) == 2 else Expression("add", first[:-1])
+
+    if _isNumber(terms[0]):
+        terms[0] -= total
+        total = 0
+
+    if total:
+        terms.append(total)
+
+    return terms[0] if len(terms) == 1 else Expression("sub", terms)
+
+
+def _simplifyMul(*operands):
+    factors = []
+    for i in operands:
+        factors += _terms(i, "mul")
+
+    product = 1.0
+    for i in factors:
+        if _isNumber(i):
+            product *= i
+
+    factors = [i for i in factors if not _isNumber(i)]
+
+    if not factors or product == 0:
+        return product
+
+    if product != 1:
+        factors.append(product)
+
+    return factors[0] if len(factors) == 1 else Expression("mul", factors)
+
+
+def _simplifyDiv(left, right):
+    if _isNumber(right):
+        if right == 0:
+            raise ZeroDivisionError(">>> The expression divides by zero.")
+
+        return _simplifyMul(left, 1.0 / right)
+
+    return Expression("div", [left, right])
+
+
+def _simplifyPow(left, right):
+    if _isNumber(left) and _isNumber(right):
+        return left ** right
+
+    if _isNumber(right) and right == 1:
+        return left
+
+    if _isNumber(right) and right == 0:
+        return 1.0
+
+    return Expression("pow", [left, right])
+
+
+_SIMPLIFY = {
+    "add": _simplifyAdd,
+    "sub": _simplifySub,
+    "mul": _simplifyMul,
+    "div": _simplifyDiv,
+    "pow": _simplifyPow,
+}
+
+# -----------------------------------------------------------------------------
+
+def _build(value):
+    """ Creates the nodes of a simplified expression, returns its output. """
+    if not isinstance(value, Expression):
+        return value
+
+    operands = [_build(i) for i in value.operands]
+
+    if all(_isConstant(i) for i in operands):
+        return _foldConstants(value.operation, operands)
+
+    if value.operation == "add":
+        return _buildPlusMinusAverage(operands, 1)
+
+    if value.operation == "sub":
+        return _buildPlusMinusAverage(operands, 2)
+
+    if value.operation == "mul":
+        result = operands[0]
+        for factor in operands[1:]:
+            result = _buildMultiplyDivide(result, factor, 1)
+
+        return result
+
+    operationType = 2 if value.operation == "div" else 3
+    return _buildMultiplyDivide(operands[0], operands[1], operationType)
+
+
+def _buildPlusMinusAverage(terms, operationType):
+    """
+    Creates one plusMinusAverage with an input for each term.
+
+    Args:
+        terms (list): Attributes, numbers and constant vectors, one of
+                      them at least is an Attribute. With any 3D term the
+                      1D ones drive the three axes.
+        operationType (int): 1 (sum) or 2 (substract).
+
+    Returns:
+        Attribute: The output of the node.
+    """
+    # Importing here to avoid circular dependency
+    from modules.base import Dep_Node
+
+    attrs = [i for i in terms if not _isConstant(i)]
+    is3D = any(_dimension(i) == 3 for i in terms)
+    attribute, output = ("input3D", "output3D") if is3D else ("input1D", "output1D")
+
+    nodeName = attrs[0].createNodeName(
+        _nameValue(terms[1] if terms[0] is attrs[0] else terms[0]), "plusMinusAverage")
+
+    pma = Dep_Node(m.createNode("plusMinusAverage", n=nodeName))
+    pma.a.operation.set(operationType)
+
+    for index, term in enumerate(terms):
+        _setOperand(pma.a["{0}[{1}]".format(attribute, index)], term, is3D)
+
+    return pma.a[output]
+
+
+def _buildMultiplyDivide(left, right, operationType):
+    """
+    Creates the multiplyDivide of two operands. Attributes with a number
+    or an attribute of the same size use the cached Attribute operators,
+    constants on the left, constant vectors and mixed 1D and 3D operands
+    get their own node, the 1D operand drives the three axes.
+
+    Returns:
+        Attribute: The output of the node.
+    """
+    # Importing here to avoid circular dependency
+    from modules.base import Dep_Node
+
+    if not _isConstant(left) and _dimension(left) == (_dimension(right) or 1):
+        return left.multiplyDivideNode(right, operationType)
+
+    attr, value = (right, left) if _isConstant(left) else (left, right)
+    nodeName = attr.createNodeName(_nameValue(value), "multiplyDivide")
+    md = Dep_Node(m.createNode("multiplyDivide", n=nodeName))
+    md.a.operation.set(operationType)
+
+    if _dimension(left) == 3 or _dimension(right) == 3:
+        _setOperand(md.a.input1, left, True)
+        _setOperand(md.a.input2, right, True)
+        return md.a.output
+
+    _setOperand(md.a.input1X, left)
+    _setOperand(md.a.input2X, right)
+    return md.a.outputX
+
+
+def _nameValue(value):
+    """ The operand as it goes in a node name, vectors without spaces. """
+    return "_".join(str(i) for i in value) if _isVector(value) else value
+
+
+def _setOperand(attr, value, is3D=False):
+    """ Connects or sets an operand into a node input. """
+    if _isVector(value):
+        attr.set(*value)
+    elif _isNumber(value):
+        attr.set(*[value] * (3 if is3D else 1))
+    else:
+        attr << value  # A 1D attribute drives the three axes of a 3D input
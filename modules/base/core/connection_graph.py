@@ -0,0 +1,278 @@
+'''
+/*****************************************************************************/
+                          Connection Graph v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    A snapshot of every connection in the scene, indexed by source and
+    destination plug so validation passes can look up the inputs and
+    outputs of thousands of attributes without calling listConnections.
+
+>> HOW TO USE >>
+	Build it once before walking the connections of the rig:
+
+        graph = ConnectionGraph()
+        print(graph.connectionInput(sphere.a.rx))
+
+    Pass track=True to keep it updated while the scene changes, then call
+    "untrack" when done to remove the callbacks.
+
+>> CONTENTS >>
+    + ConnectionGraph [Class]
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+from maya import OpenMaya
+from modules.utils.open_maya_api import nodeKey
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+class ConnectionGraph(object):
+    """
+    ConnectionGraph [Class]
+
+    Every connection of the scene read once with MItDependencyNodes, the
+    lookups are dictionary hits from then on.
+
+    Args:
+        track (bool): Keep the snapshot updated with the connection
+                      callbacks. Defaults to False.
+
+    Example:
+        graph = ConnectionGraph()
+        print(graph.connectionOutputs(cube.a.t))
+        # Output: [Attribute('sphere_GEO.translateX'), etc...]
+    """
+    # -------------------------------------------------------------------------
+    # SPECIAL/MAGIC/DUNDER METHODS
+
+    def __init__(self, track=False):
+        self._inputs = {}   # {destination key: source MPlug}
+        self._outputs = {}  # {source key: {destination key: MPlug}}
+        self._callbacks = []
+        self.dirty = True
+
+        self.rebuild()
+
+        if track:
+            self.track()
+
+    def __len__(self):
+        """ Number of connections, a destination only has one source. """
+        if self.dirty:
+            self.rebuild()
+
+        return len(self._inputs)
+
+    # -------------------------------------------------------------------------
+    # METHODS
+
+    def rebuild(self):
+        """
+        Reads every connection of the scene again.
+
+        Example:
+            graph.rebuild()
+        """
+        self._inputs.clear()
+        self._outputs.clear()
+
+        iterator = OpenMaya.MItDependencyNodes()
+        fnNode = OpenMaya.MFnDependencyNode()
+        plugs = OpenMaya.MPlugArray()
+        sources = OpenMaya.MPlugArray()
+
+        while not iterator.isDone():
+            fnNode.setObject(iterator.thisNode())
+            fnNode.getConnections(plugs)
+
+            # Reading from the destinations finds every connection once
+            for index in range(plugs.length()):
+                plug = plugs[index]
+                plug.connectedTo(sources, True, False)
+
+                if sources.length():
+                    self._addConnection(sources[0], plug)
+
+            iterator.next()
+
+        self.dirty = False
+
+    def track(self):
+        """
+        Updates the snapshot on every connection made or broken, a new or
+        opened scene marks it dirty to rebuild it on the next lookup.
+
+        Example:
+            graph.track()
+        """
+        if self._callbacks:
+            return
+
+        self._callbacks.append(OpenMaya.MDGMessage.addConnectionCallback(
+            self._connectionChanged))
+
+        for message in (OpenMaya.MSceneMessage.kBeforeNew,
+                        OpenMaya.MSceneMessage.kBeforeOpen):
+            self._callbacks.append(OpenMaya.MSceneMessage.addCallback(
+                message, self._sceneChanged))
+
+    def untrack(self):
+        """
+        Removes the callbacks added by "track".
+
+        Example:
+            graph.untrack()
+        """
+        for callbackId in self._callbacks:
+            OpenMaya.MMessage.removeCallback(callbackId)
+
+        self._callbacks = []
+
+    def inputPlug(self, plug):
+        """
+        The source of a plug.
+
+        Args:
+            plug (MPlug): The destination plug.
+
+        Returns:
+            MPlug: The source plug or None if not connected.
+        """
+        if self.dirty:
+            self.rebuild()
+
+        return self._inputs.get(_plugKey(plug))
+
+    def outputPlugs(self, plug):
+        """
+        The destinations of a plug.
+
+        Args:
+            plug (MPlug): The source plug.
+
+        Returns:
+            list: [MPlug, ...] the connected destinations.
+        """
+        if self.dirty:
+            self.rebuild()
+
+        return list(self._outputs.get(_plugKey(plug), {}).values())
+
+    def connectionInput(self, attr):
+        """
+        Same as Attribute.connectionInput, read from the snapshot.
+
+        Args:
+            attr (Attribute): The attribute to check, children included.
+
+        Returns:
+            Attribute/list: The input attribute, a list if more than
+                            one, or None if not connected.
+
+        Example:
+            print(graph.connectionInput(sphere.a.rx))
+            # Output: Attribute('cube_GEO.rotateX')
+        """
+        inputs = [self.inputPlug(i) for i in _attributePlugs(attr)]
+        inputs = [_toAttribute(i) for i in inputs if i is not None]
+
+        if inputs:
+            return inputs[0] if len(inputs) == 1 else inputs
+
+        return None
+
+    def connectionOutputs(self, attr):
+        """
+        Same as Attribute.connectionOutputs, read from the snapshot.
+
+        Args:
+            attr (Attribute): The attribute to check, children included.
+
+        Returns:
+            list: [Attribute, ...] or None if not connected.
+
+        Example:
+            print(graph.connectionOutputs(cube.a.rx))
+            # Output: [Attribute('sphere_GEO.rotateX'), etc...]
+        """
+        outputs = []
+        for plug in _attributePlugs(attr):
+            outputs += [_toAttribute(i) for i in self.outputPlugs(plug)]
+
+        return outputs or None
+
+    # -------------------------------------------------------------------------
+
+    def _addConnection(self, source, destination):
+        sourceKey, destinationKey = _plugKey(source), _plugKey(destination)
+
+        self._inputs[destinationKey] = OpenMaya.MPlug(source)
+        self._outputs.setdefault(sourceKey, {})[destinationKey] = \
+            OpenMaya.MPlug(destination)
+
+    def _removeConnection(self, source, destination):
+        sourceKey, destinationKey = _plugKey(source), _plugKey(destination)
+
+        self._inputs.pop(destinationKey, None)
+        self._outputs.get(sourceKey, {}).pop(destinationKey, None)
+
+    def _connectionChanged(self, source, destination, made, *args):
+        if self.dirty:
+            return  # Rebuilt on the next lookup anyway
+
+        if made:
+            self._addConnection(source, destination)
+        else:
+            self._removeConnection(source, destination)
+
+    def _sceneChanged(self, *args):
+        self.dirty = True
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def _plugKey(plug):
+    """ The node and the full attribute path with its indices. """
+    return (nodeKey(plug.node()),
+            plug.partialName(False, True, True, False, True, True))
+
+
+def _attributePlugs(attr):
+    """ The attribute plug followed by its children plugs. """
+    plug = attr.plug
+    if plug is None:
+        return []
+
+    plugs = [plug]
+    if plug.isCompound() and not plug.isArray():
+        plugs += [plug.child(i) for i in range(plug.numChildren())]
+
+    return plugs
+
+
+def _toAttribute(plug):
+    """ Wraps a plug into our Attribute, reusing the node wrappers. """
+    # Importing here to avoid circular dependency
+    from modules.base import Dag_Node, Attribute
+
+    return Attribute(Dag_Node.fromMObject(plug.node()),
+                     plug.partialName(False, True, True, False, False, True))
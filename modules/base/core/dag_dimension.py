@@ -15,9 +15,17 @@
 
 >> CONTENTS >> 
     + Object_Dimension [Class]
+    + boundingBox [Func]
+    + boundingBoxes [Func]
+    + positions [Func]
+    + clearBoundingBoxCache [Func]
 
 >> NOTES >> 
 	Update 08/08/2023 : Start working on the script
+	Update 18/10/2026 : The bounding box is read with the API and cached
+	                    until the node or its children are dirtied
+	Update 18/10/2026 : position is read from the world matrix, no more
+	                    temporary group
  
 >> THANKS >> 
     Nick Hughes [08/08/2023]:
@@ -35,8 +43,19 @@
 # -----------------------------------------------------------------------------
 
 from maya import cmds as m
+from maya import OpenMaya
+from modules.utils import open_maya_api
 from modules.utils.math import getDistanceBetween
 
+try:
+    import numpy
+except ImportError:  # mayapy builds without numpy
+    numpy = None
+
+# {nodeKey: [MObjectHandle, [minX, ..., maxZ], [callback ids]]}
+_BOUNDING_BOX_CACHE = {}
+_SCENE_CALLBACKS = []
+
 # -----------------------------------------------------------------------------
 # CLASSES
 # -----------------------------------------------------------------------------
@@ -53,22 +72,23 @@ class Object_Dimension(object):
     """
     def __init__(self, node):
         self._node = node
+        self._dag = _toMDagPath(node)
 
         if not self.worldMatrix:
             raise ValueError(">>> No worldMatrix and therefore no dimension found for this object.")
         
     @property
     def worldMatrix(self):
-        return self._node.a.worldMatrix.exists()    
+        return self._dag is not None
     
     @property
     def xformBoundingBox(self):
-        """ Xform Bounding Box
+        """ Xform Bounding Box, cached until the node is dirtied.
             
             Returns:
                 list: [minTX, minTY, minTZ, maxTX, maxTY, maxTZ]
         """
-        return m.xform(self._node, q=1, bbi=1)
+        return _cachedBoundingBox(self._dag)
         
     @property
     def bb(self):
@@ -77,15 +97,18 @@ class Object_Dimension(object):
     
     @property
     def width(self):
-        return self.bb[3] - self.bb[0] # From list example on BB
+        bb = self.bb
+        return bb[3] - bb[0] # From list example on BB
     
     @property
     def height(self):
-        return self.bb[4] - self.bb[1]
+        bb = self.bb
+        return bb[4] - bb[1]
     
     @property
     def depth(self):
-        return self.bb[5] - self.bb[2]
+        bb = self.bb
+        return bb[5] - bb[2]
     
     @property
     def centre(self):
@@ -94,10 +117,11 @@ class Object_Dimension(object):
             Returns:
                 list: [x, y, z]
         """
+        bb = self.bb
         return [
-            (self.bb[3] + self.bb[0]) / 2,
-            (self.bb[4] + self.bb[1]) / 2,
-            (self.bb[5] + self.bb[2]) / 2
+            (bb[3] + bb[0]) / 2,
+            (bb[4] + bb[1]) / 2,
+            (bb[5] + bb[2]) / 2
         ]
     
     @property
@@ -107,15 +131,7 @@ class Object_Dimension(object):
     @property
     def position(self):
         """ Position will return the world space translate and rotate pivot of the object """
-        from modules.base import Dag_Node as Dag
-        tempDag = Dag(m.group(em=1, w=1)); tempDag.moveTo(self._node);
-
-        position = [float(format(i, "f")) for i in m.xform(tempDag, ws=1, t=1, q=1) 
-                    + m.xform(tempDag, ws=1, ro=1, q=1)]
-        
-        tempDag.delete()
-
-        return position
+        return _worldPosition(self._dag)
     
     @property
     def pivot(self):
@@ -158,4 +174,213 @@ class Object_Dimension(object):
         distance = getDistanceBetween(str(self._node), str(item))
 
         return distance
-    
\ No newline at end of file
+    
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def boundingBox(node):
+    """
+    boundingBox [Function]
+
+    The world bounding box of a node, children included, the same values
+    as "xform -q -bbi". It is computed once and reused until the node or
+    any of its children is dirtied.
+
+    Args:
+        node (str/Dag_Node): The dag node.
+
+    Returns:
+        list: [minX, minY, minZ, maxX, maxY, maxZ]
+
+    Example:
+        print(boundingBox("sphere_GEO"))
+        # Output: [-1.0, -1.0, -1.0, 1.0, 1.0, 1.0]
+    """
+    dagPath = _toMDagPath(node)
+    if dagPath is None:
+        raise ValueError(">>> No worldMatrix and therefore no dimension found for {0}.".format(node))
+
+    return _cachedBoundingBox(dagPath)
+
+
+def boundingBoxes(nodes):
+    """
+    boundingBoxes [Function]
+
+    The world bounding boxes of many nodes, resolved with one selection
+    list and read from the same cache as "boundingBox".
+
+    Args:
+        nodes (list): The dag nodes, names or Dag_Nodes.
+
+    Returns:
+        list: [[minX, minY, minZ, maxX, maxY, maxZ], ...] in the same order.
+
+    Example:
+        boxes = boundingBoxes(m.ls(type="mesh", long=True))
+    """
+    boxes = []
+    for node, obj in zip(nodes, open_maya_api.toMObjects([str(i) for i in nodes])):
+        if not obj.hasFn(OpenMaya.MFn.kDagNode):
+            raise ValueError(">>> No worldMatrix and therefore no dimension found for {0}.".format(node))
+
+        dagPath = OpenMaya.MDagPath()
+        OpenMaya.MDagPath.getAPathTo(obj, dagPath)
+        boxes.append(_cachedBoundingBox(dagPath))
+
+    return boxes
+
+
+def positions(nodes):
+    """
+    positions [Function]
+
+    The world rotate pivot and rotation of many nodes, the same values as
+    Object_Dimension.position without touching the scene.
+
+    Args:
+        nodes (list): The transforms, names or Dag_Nodes.
+
+    Returns:
+        numpy.ndarray/list: (N, 6) rows of [tx, ty, tz, rx, ry, rz], a list
+                            of lists when numpy is not available.
+
+    Example:
+        print(positions(["L_arm_JNT", "L_elbow_JNT"]))
+        # Output: [[5.0, 0.0, 0.0, 0.0, 0.0, 0.0], [10.0, 0.0, -1.0, 0.0, 0.0, 0.0]]
+    """
+    rows = []
+    for node, obj in zip(nodes, open_maya_api.toMObjects([str(i) for i in nodes])):
+        if not obj.hasFn(OpenMaya.MFn.kTransform):
+            raise ValueError(">>> No worldMatrix and therefore no position found for {0}.".format(node))
+
+        dagPath = OpenMaya.MDagPath()
+        OpenMaya.MDagPath.getAPathTo(obj, dagPath)
+        rows.append(_worldPosition(dagPath))
+
+    return numpy.array(rows, dtype=float).reshape(-1, 6) if numpy else rows
+
+
+def clearBoundingBoxCache(*args):
+    """
+    clearBoundingBoxCache [Function]
+
+    Forgets every cached bounding box and removes their callbacks.
+
+    Example:
+        clearBoundingBoxCache()
+    """
+    for key in list(_BOUNDING_BOX_CACHE):
+        _invalidateBoundingBox(key)
+
+# -----------------------------------------------------------------------------
+
+def _toMDagPath(node):
+    """ The dag path of a Dag_Node, Dep_Node or name, None if not a dag node. """
+    dagPath = getattr(node, "dag", None)
+    if dagPath is not None:
+        return dagPath
+
+    handle = getattr(node, "_handle", None)
+    if handle is not None:
+        if not handle.isValid() or not handle.object().hasFn(OpenMaya.MFn.kDagNode):
+            return None
+
+        dagPath = OpenMaya.MDagPath()
+        OpenMaya.MDagPath.getAPathTo(handle.object(), dagPath)
+        return dagPath
+
+    try:
+        return open_maya_api.toMDagPath(str(node))
+    except RuntimeError:  # Doesn't exist
+        return None
+
+
+def _worldBoundingBox(dagPath):
+    """ The object space box of the node moved into world space, in UI units. """
+    box = OpenMaya.MFnDagNode(dagPath).boundingBox()
+    box.transformUsing(dagPath.inclusiveMatrix())
+
+    unit = OpenMaya.MDistance.uiUnit()
+    return [OpenMaya.MDistance(i, OpenMaya.MDistance.kCentimeters).asUnits(unit)
+            for point in (box.min(), box.max()) for i in (point.x, point.y, point.z)]
+
+
+def _worldPosition(dagPath):
+    """ World rotate pivot and XYZ rotation in UI units, what a parentConstraint would match. """
+    pivot = OpenMaya.MFnTransform(dagPath).rotatePivot(OpenMaya.MSpace.kWorld)
+    rotation = OpenMaya.MTransformationMatrix(dagPath.inclusiveMatrix()).eulerRotation()
+
+    distanceUnit = OpenMaya.MDistance.uiUnit()
+    angleUnit = OpenMaya.MAngle.uiUnit()
+
+    position = [OpenMaya.MDistance(i, OpenMaya.MDistance.kCentimeters).asUnits(distanceUnit)
+                for i in (pivot.x, pivot.y, pivot.z)]
+    position += [OpenMaya.MAngle(i).asUnits(angleUnit)
+                 for i in (rotation.x, rotation.y, rotation.z)]
+
+    return [float(format(i, "f")) for i in position]
+
+
+def _cachedBoundingBox(dagPath):
+    obj = dagPath.node()
+    key = open_maya_api.nodeKey(obj)
+
+    entry = _BOUNDING_BOX_CACHE.get(key)
+    if entry is not None and entry[0].isValid() and entry[0].object() == obj:
+        return list(entry[1])
+
+    _invalidateBoundingBox(key)
+
+    box = _worldBoundingBox(dagPath)
+
+    # The node, its shapes and its children can all change the box, and so
+    # can a child added or removed anywhere under it later on
+    callbacks = []
+    iterator = OpenMaya.MItDag()
+    iterator.reset(dagPath, OpenMaya.MItDag.kDepthFirst)
+    while not iterator.isDone():
+        item = iterator.currentItem()
+        callbacks.append(OpenMaya.MNodeMessage.addNodeDirtyCallback(
+            item, _boundingBoxDirty, key))
+
+        if item.hasFn(OpenMaya.MFn.kTransform):
+            itemPath = OpenMaya.MDagPath()
+            iterator.getPath(itemPath)
+            callbacks.append(OpenMaya.MDagMessage.addChildAddedDagPathCallback(
+                itemPath, _hierarchyChanged, key))
+            callbacks.append(OpenMaya.MDagMessage.addChildRemovedDagPathCallback(
+                itemPath, _hierarchyChanged, key))
+
+        iterator.next()
+
+    if not _SCENE_CALLBACKS:
+        for message in (OpenMaya.MSceneMessage.kBeforeNew,
+                        OpenMaya.MSceneMessage.kBeforeOpen):
+            _SCENE_CALLBACKS.append(OpenMaya.MSceneMessage.addCallback(
+                message, clearBoundingBoxCache))
+
+    _BOUNDING_BOX_CACHE[key] = [OpenMaya.MObjectHandle(obj), box, callbacks]
+
+    return list(box)
+
+
+def _boundingBoxDirty(node, key):
+    _invalidateBoundingBox(key)
+
+
+def _hierarchyChanged(child, parent, key):
+    _invalidateBoundingBox(key)
+
+
+def _invalidateBoundingBox(key):
+    entry = _BOUNDING_BOX_CACHE.pop(key, None)
+    if entry is None:
+        return
+
+    for callbackId in entry[2]:
+        try:
+            OpenMaya.MMessage.removeCallback(callbackId)
+        except RuntimeError:  # Removed with its node
+            pass
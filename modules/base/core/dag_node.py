@@ -20,6 +20,8 @@
 >> NOTES >> 
 	Update 03/08/2023 : Start working on the script
     Update 17/08/2023 : Created from Dag_Node (split into multiple modules)
+    Update 18/10/2026 : Nodes resolve once, hierarchy queries reuse wrappers.
+    Update 18/10/2026 : Added iterChildren and iterDescendants.
  
 >> THANKS >> 
     Nick Hughes [03/08/2023]:
@@ -37,8 +39,9 @@
 # -----------------------------------------------------------------------------
 
 from maya import cmds as m
+from maya import OpenMaya
 from modules.base import Dep_Node
-from modules.utils import color, open_maya_api
+from modules.utils import color
 from modules.utils.common import createOffset
 from modules.utils.common import matchMove
 from modules.common.functions import getKeyFromValue
@@ -93,12 +96,16 @@ class Dag_Node(Dep_Node):
     def node(self, node):  # Setter - Set a new node.
         self._dag = None  # from node to None
 
-        if not Dep_Node.node.fset(self, node):
-            return False
+        return Dep_Node.node.fset(self, node)
 
-        self._dag = open_maya_api.toMDagPath(self.node)
+    def _setMObject(self, obj):
+        """ Gets the dag path from the same MObject, no second lookup. """
+        Dep_Node._setMObject(self, obj)
 
-        return True
+        self._dag = None
+        if obj.hasFn(OpenMaya.MFn.kDagNode):
+            self._dag = OpenMaya.MDagPath()
+            OpenMaya.MDagPath.getAPathTo(obj, self._dag)
 
     # ----------------------------------------------------------------
 
@@ -126,11 +133,8 @@ class Dag_Node(Dep_Node):
 
     @property
     def shapes(self):
-        shapes = []
-        for shape in m.listRelatives(self.fullPath, s=True, f=True, ni=True) or []:
-            shapes.append(Dag_Node(shape))
-
-        return shapes
+        return Dag_Node.fromNames(
+            m.listRelatives(self.fullPath, s=True, f=True, ni=True) or [])
 
     @property
     def shape(self):
@@ -142,29 +146,80 @@ class Dag_Node(Dep_Node):
 
     @property
     def children(self):
-        children = []
-        shapes = self.shapes
-
-        for child in m.listRelatives(self.fullPath, c=True, f=True, ni=True) or []:
-            if child not in shapes:
-                children.append(Dag_Node(child))
-
-        return children
+        return list(self.iterChildren())
 
     @property
     def allChildren(self):
-        children = []
-        for child in m.listRelatives(self.fullPath, ad=True, f=True, ni=True) or []:
-            children.append(Dag_Node(child))
+        """ Same order as listRelatives(ad=True), deepest last child first. """
+        return list(self.iterDescendants())[::-1]
+
+    def iterChildren(self, type=None, shapes=False):
+        """
+        Yields the direct children one at a time.
+
+        Args:
+            type (int): Only the children with this MFn type, example:
+                        OpenMaya.MFn.kJoint. Defaults to None (any).
+            shapes (bool): Include the shapes. Defaults to False.
+
+        Example:
+            for child in grp.iterChildren(OpenMaya.MFn.kJoint):
+                print(child)
+        """
+        if not self.dag:
+            return
+
+        fnDag = OpenMaya.MFnDagNode(self.dag)
+
+        for index in range(fnDag.childCount()):
+            child = fnDag.child(index)
+
+            if child.hasFn(OpenMaya.MFn.kShape):
+                if not shapes or OpenMaya.MFnDagNode(child).isIntermediateObject():
+                    continue
+
+            if type is None or child.hasFn(type):
+                yield Dag_Node.fromMObject(child)
+
+    def iterDescendants(self, type=None, depthFirst=True):
+        """
+        Yields every node under this one, parents before their children,
+        intermediate shapes are skipped like listRelatives(ni=True).
+
+        Args:
+            type (int): Only the nodes with this MFn type, example:
+                        OpenMaya.MFn.kJoint. Defaults to None (any).
+            depthFirst (bool): Depth or breadth first. Defaults to True.
+
+        Example:
+            joints = list(guide.iterDescendants(OpenMaya.MFn.kJoint))
+        """
+        if not self.dag:
+            return
+
+        traversal = OpenMaya.MItDag.kDepthFirst if depthFirst \
+            else OpenMaya.MItDag.kBreadthFirst
+        filterType = OpenMaya.MFn.kInvalid if type is None else type
+
+        iterator = OpenMaya.MItDag(traversal, filterType)
+        iterator.reset(self.dag, traversal, filterType)
+        root = self.dag.node()
+
+        while not iterator.isDone():
+            obj = iterator.currentItem()
+
+            if obj != root and not (obj.hasFn(OpenMaya.MFn.kShape) and
+                    OpenMaya.MFnDagNode(obj).isIntermediateObject()):
+                yield Dag_Node.fromMObject(obj)
 
-        return children
+            iterator.next()
 
     @property
     def parent(self):
         parent = m.listRelatives(self.fullPath, p=True, f=True)
 
         if parent:
-            return Dag_Node(parent[0])
+            return Dag_Node.fromNames(parent)[0]
 
     @property
     def allParents(self):
@@ -280,8 +335,7 @@ class Dag_Node(Dep_Node):
     def history(self):
         """ Returns obj construction history. """
         if self.exists():
-            history = [Dag_Node(i) for i in m.listHistory(self.fullPath)]
-            return history
+            return Dag_Node.fromNames(m.listHistory(self.fullPath) or [])
         
         return []
 
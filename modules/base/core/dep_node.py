@@ -20,6 +20,7 @@
 >> NOTES >> 
 	Update 02/08/2023 : Start working on the script
     Update 03/08/2023 : Improved documentation
+    Update 18/10/2026 : Wrappers are interned by MObjectHandle.
  
 >> THANKS >> 
     Nick Hughes [02/08/2023]:
@@ -36,11 +37,20 @@
 # LIBRARIES AND MODULES
 # -----------------------------------------------------------------------------
 
+import weakref
 from maya import cmds as m
+from maya import OpenMaya
 from modules.utils import open_maya_api, path
 from modules.base.core.attribute_base import Attributes
 from modules.base.core.dag_dimension import Object_Dimension
 
+# -----------------------------------------------------------------------------
+# NODE CACHE
+# -----------------------------------------------------------------------------
+
+# {(class, MObjectHandle hash): wrapper} Only while the wrapper is referenced.
+_NODE_CACHE = weakref.WeakValueDictionary()
+
 # -----------------------------------------------------------------------------
 # CLASSES
 # -----------------------------------------------------------------------------
@@ -70,6 +80,7 @@ class Dep_Node(object):
 
     def __init__(self, node, nodeType=None):
         self._dep = None
+        self._handle = None
         self.node = node
 
         # Create on initiate if nodeType is passed
@@ -111,15 +122,82 @@ class Dep_Node(object):
     @node.setter
     def node(self, node):  # Setter - Set a new node.
         self._dep = None
+        self._handle = None
         self._node = str(node) if node != None else None
 
-        if not self.node or not m.objExists(self.node):
+        if not self.node:
             return False
 
-        self._dep = open_maya_api.toDpendencyNode(self.node)
-        
+        try:
+            obj = open_maya_api.toMObject(self.node)
+        except RuntimeError:  # Doesn't exist
+            return False
+
+        self._setMObject(obj)
+
         return True
 
+    def _setMObject(self, obj):
+        """ Points the wrapper to the node, with no name resolution. """
+        self._dep = OpenMaya.MFnDependencyNode(obj)
+        self._handle = OpenMaya.MObjectHandle(obj)
+
+    # -------------------------------------------------------------------------
+    # INTERNED WRAPPERS
+
+    @classmethod
+    def fromMObject(cls, obj):
+        """
+        Wraps an OpenMaya Object, reusing the wrapper of that node if one
+        is still alive so traversals don't resolve the same node twice.
+
+        Args:
+            obj (MObject): The maya node.
+
+        Returns:
+            Dep_Node: The wrapper, same class as the one called.
+
+        Example:
+            joint = Dag_Node.fromMObject(obj)
+            print(joint is Dag_Node.fromMObject(obj))
+            # Output: True
+        """
+        handle = OpenMaya.MObjectHandle(obj)
+        key = (cls, handle.hashCode())
+
+        node = _NODE_CACHE.get(key)
+
+        # A deleted node or a wrapper pointed to another node is not reused
+        if node is not None and node._handle is not None and \
+                node._handle.isValid() and node._handle.object() == obj:
+            return node
+
+        node = cls.__new__(cls)
+        node._initFromMObject(obj)
+        _NODE_CACHE[key] = node
+
+        return node
+
+    @classmethod
+    def fromNames(cls, nodes):
+        """
+        Wraps many nodes resolving their names with a single selection list.
+
+        Args:
+            nodes (list): Unique names or full paths, like listRelatives(f=True).
+
+        Returns:
+            list: [Dep_Node, ...] in the same order.
+        """
+        return [cls.fromMObject(i) for i in open_maya_api.toMObjects(nodes)]
+
+    def _initFromMObject(self, obj):
+        """ The __init__ of the interned wrappers. """
+        self._dep = None
+        self._handle = None
+        self._setMObject(obj)
+        self._node = self.fullPath
+
     # -------------------------------------------------------------------------
     # PROPERTIES
 
@@ -206,9 +284,9 @@ class Dep_Node(object):
         Returns:
             Bool: objExists
         """
-        if self.fullPath and m.objExists(self.fullPath):
-            return True
-        return False
+        if self._handle is None or not self._handle.isValid():
+            return False
+        return bool(self.fullPath)
 
     def rename(self, name):
         """
@@ -241,6 +319,7 @@ class Dep_Node(object):
         if self.fullPath and m.objExists(self.fullPath):
             m.delete(self.fullPath)
         self._dep = None
+        self._handle = None
 
     def create(self, nodeType):
         """
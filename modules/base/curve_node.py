@@ -18,6 +18,9 @@
 
 >> NOTES >> 
 	Update 21/08/2023 : Started to work on the script.
+	Update 18/10/2026 : getCVs and setCVs read and write every shape with
+	                    MFnNurbsCurve
+	Update 18/10/2026 : getShapeData for the control shape library
 
 >> CONTACT >>
     luisf.carranza@outlook.com
@@ -30,8 +33,11 @@
 # LIBRARIES AND MODULES
 # -----------------------------------------------------------------------------
 
+import array
 from maya import cmds as m
+from maya import OpenMaya
 from modules.base import Dag_Node
+from modules.utils import open_maya_api
 
 # -----------------------------------------------------------------------------
 # CLASSES
@@ -68,18 +74,121 @@ class Curve(Dag_Node):
 
     @property
     def pointPosition(self):
-        epCoordinates = []
-        for i in self.points:
-            epPos = m.pointPosition( "{}".format(i), w=True )
-            epCoordinates.append(epPos)
-
-        return epCoordinates
+        cvs = self.getCVs()
+        return [list(cvs[i:i + 3]) for i in range(0, len(cvs), 3)]
 
     @property
     def cvPosition(self):
         """ Returns list of positions of curve points. """
         return self.pointPosition
     
+    def getCVs(self, space="world"):
+        """
+        getCVs [Method]
+
+        The position of every CV of every shape, one MFnNurbsCurve call
+        per shape. Periodic curves skip their repeated CVs like "cv[*]".
+
+        Args:
+            space (str): "world" or "object". Defaults to "world".
+
+        Returns:
+            array: Flat array("d") of x, y, z in the order of the shapes.
+
+        Example:
+            cvs = ctl.getCVs()
+            print(cvs[:3])
+            # Output: array('d', [0.78, 0.0, -0.78])
+        """
+        values = array.array("d")
+
+        for curveFn in self._curveFns():
+            points = OpenMaya.MPointArray()
+            curveFn.getCVs(points, open_maya_api.toMSpace(space))
+
+            for index in range(_cvCount(curveFn)):
+                point = points[index]
+                values.extend((point.x, point.y, point.z))
+
+        return values
+
+    def setCVs(self, points, space="world"):
+        """
+        setCVs [Method]
+
+        Moves every CV of every shape, one MFnNurbsCurve call per shape.
+        It skips the undo queue like any API edit.
+
+        Args:
+            points (list): Flat x, y, z values or [x, y, z] rows, in the
+                           same order as getCVs.
+            space (str): "world" or "object". Defaults to "world".
+
+        Example:
+            ctl.setCVs([i * 2 for i in ctl.getCVs("object")], "object")
+        """
+        values = open_maya_api.flatValues(points)
+        curveFns = self._curveFns()
+
+        expected = sum(_cvCount(i) for i in curveFns) * 3
+        if len(values) != expected:
+            raise ValueError(">>> {0} has {1} CVs, got {2} values.".format(
+                self.name, expected // 3, len(values)))
+
+        offset = 0
+        for curveFn in curveFns:
+            count = _cvCount(curveFn)
+
+            cvs = OpenMaya.MPointArray()
+            for index in range(offset, offset + count * 3, 3):
+                cvs.append(OpenMaya.MPoint(values[index], values[index + 1], values[index + 2]))
+
+            # The first CVs are repeated at the end of periodic curves
+            for index in range(curveFn.numCVs() - count):
+                cvs.append(cvs[index])
+
+            curveFn.setCVs(cvs, open_maya_api.toMSpace(space))
+            curveFn.updateCurve()
+            offset += count * 3
+
+    def getShapeData(self):
+        """
+        getShapeData [Method]
+
+        Everything needed to rebuild the shapes with MFnNurbsCurve.create,
+        the CVs are in object space and include the periodic repeats.
+
+        Returns:
+            list: [{"degree", "form", "knots", "cvs"}, ...] one item per
+                  shape, the knots and the flat CVs as array("d").
+
+        Example:
+            print(ctl.getShapeData()[0]["degree"])
+            # Output: 3
+        """
+        data = []
+
+        for curveFn in self._curveFns():
+            knots = OpenMaya.MDoubleArray()
+            curveFn.getKnots(knots)
+
+            points = OpenMaya.MPointArray()
+            curveFn.getCVs(points, OpenMaya.MSpace.kObject)
+
+            cvs = array.array("d")
+            for index in range(points.length()):
+                point = points[index]
+                cvs.extend((point.x, point.y, point.z))
+
+            data.append({"degree": curveFn.degree(), "form": curveFn.form(),
+                         "knots": array.array("d", knots), "cvs": cvs})
+
+        return data
+
+    def _curveFns(self):
+        return [OpenMaya.MFnNurbsCurve(i.dag) for i in self.shapes
+                if i.dag.hasFn(OpenMaya.MFn.kNurbsCurve)]
+
     # -------------------------------------------------------------------------
     # METHODS
 
@@ -116,5 +225,14 @@ class Curve(Dag_Node):
             crv.delete()
         
         return self.fullPath
-    
-    # -----------------
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def _cvCount(curveFn):
+    """ The CVs without the ones periodic curves repeat at the end. """
+    if curveFn.form() == OpenMaya.MFnNurbsCurve.kPeriodic:
+        return curveFn.numCVs() - curveFn.degree()
+
+    return curveFn.numCVs()
@@ -15,9 +15,17 @@
 
 >> CONTENTS >> 
     + Mesh_Node [Class]
+    + Weight_Source [Class]
+    + Component_Range [Class]
 
 >> NOTES >> 
 	Update 10/08/2023 : Start working on the script
+	Update 18/10/2026 : getWeights and setWeights read and write every
+	                    weight at once with MFnSkinCluster
+	Update 18/10/2026 : copyWeightsTo samples a Weight_Source built once
+	                    instead of calling copySkinWeights per target
+	Update 18/10/2026 : verts, edges and faces are lazy Component_Ranges,
+	                    points and faceVertexIndices read MFnMesh buffers
  
 >> THANKS >> 
     Nick Hughes [10/08/2023]:
@@ -34,9 +42,18 @@
 # LIBRARIES AND MODULES
 # -----------------------------------------------------------------------------
 
+import array
 from maya import cmds as m
 from maya import mel
+from maya import OpenMaya, OpenMayaAnim
 from modules.base import Dag_Node, Dep_Node
+from modules.utils import open_maya_api
+from modules.utils.math import KDTree
+
+try:
+    import numpy
+except ImportError:  # mayapy builds without numpy
+    numpy = None
 
 # -----------------------------------------------------------------------------
 # CLASSES
@@ -65,15 +82,84 @@ class Mesh(Dag_Node):
 
     @property
     def verts(self):
-        return m.ls(self.fullPath + ".vtx[*]", fl = 1)
+        return Component_Range(self, "vtx", 0, self.vertexCount)
 
     @property
     def edges(self):
-        return m.ls(self.fullPath + ".e[*]", fl = 1)
+        return Component_Range(self, "e", 0, self.edgeCount)
 
     @property
     def faces(self):
-        return m.ls(self.fullPath + ".f[*]", fl = 1)
+        return Component_Range(self, "f", 0, self.faceCount)
+
+    @property
+    def vertexCount(self):
+        return self._meshFn().numVertices()
+
+    @property
+    def edgeCount(self):
+        return self._meshFn().numEdges()
+
+    @property
+    def faceCount(self):
+        return self._meshFn().numPolygons()
+
+    def points(self, space="world"):
+        """
+        points [Method]
+
+        The position of every vertex read in one call.
+
+        Args:
+            space (str): "world" or "object". Defaults to "world".
+
+        Returns:
+            numpy.ndarray/array: (vertexCount, 3) positions, a flat
+                                 array("d") of x, y, z without numpy.
+
+        Example:
+            print(body.points()[0])
+            # Output: [ 0.   -1.    0.  ]
+        """
+        points = open_maya_api.meshPoints(self.shape.dag, open_maya_api.toMSpace(space))
+
+        if numpy is not None:
+            return numpy.frombuffer(points, dtype=float).reshape(-1, 3).copy()
+
+        return points
+
+    def faceVertexIndices(self):
+        """
+        faceVertexIndices [Method]
+
+        The vertices of every face, in the same layout as MFnMesh.getVertices.
+
+        Returns:
+            tuple: (counts, indices) the vertex count of each face and the
+                   vertices of all faces one after the other, numpy int
+                   arrays or array("i") without numpy.
+
+        Example:
+            counts, indices = body.faceVertexIndices()
+            print(indices[:counts[0]])
+            # Output: [0 1 21 20]
+        """
+        counts, indices = OpenMaya.MIntArray(), OpenMaya.MIntArray()
+        self._meshFn().getVertices(counts, indices)
+
+        counts, indices = array.array("i", counts), array.array("i", indices)
+
+        if numpy is not None:
+            return (numpy.frombuffer(counts, dtype=numpy.intc).copy(),
+                    numpy.frombuffer(indices, dtype=numpy.intc).copy())
+
+        return counts, indices
+
+    def _meshFn(self):
+        if not self.shape.dag:
+            raise ValueError(">>> No mesh shape found on {0}.".format(self.name))
+
+        return OpenMaya.MFnMesh(self.shape.dag)
 
     # -------------------------------------------------------------------------
     # TYPE
@@ -122,28 +208,109 @@ class Mesh(Dag_Node):
         """
         self.weightTo(joints, rui = 0, mi = 1, tsb = 1, dr = 0.1)
 
-    def copyWeightsTo(self, items):
+    def copyWeightsTo(self, items, interpolate=False):
         """
         copyWeightsTo [Method]
 
-        Copy weights from object to list of other objects.
+        Copy weights from object to list of other objects, the points and
+        weights of the object are indexed once for every item.
+
+        Args:
+            items (str/list): The meshes to copy the weights to.
+            interpolate (bool): Blend the weights of the closest triangle
+                                instead of taking the closest vertex.
+                                Defaults to False.
         """
         items = items if isinstance(items, (list, tuple)) else [items]
         if self.skinCluster.exists():
-            joints = self.joints
+            source = Weight_Source(self)
 
-            for item in [Mesh(i) for i in items]:
-                if item.skinCluster:
-                    item.skinCluster.delete()
+            for item in items:
+                source.copyTo(item, interpolate)
 
-                item.hardWeightTo(joints)
+    def getWeights(self):
+        """
+        getWeights [Method]
 
-                m.copySkinWeights(
-                    ss = self.skinCluster.name,
-                    ds = item.skinCluster.name,
-                    noMirror = 1,
-                    sa = "closestPoint",
-                    ia = "oneToOne" )
+        Every weight of the skin cluster in a single call, the columns
+        follow the order of "joints".
+
+        Returns:
+            numpy.ndarray/array: (vertexCount, influenceCount) weights, a flat
+                                 array("d") of the same rows when numpy is
+                                 not available.
+
+        Example:
+            weights = body.getWeights()
+            weights[weights < 0.01] = 0
+            body.setWeights(weights, normalize=True)
+        """
+        skinFn, dagPath, components = self._skinClusterData()
+
+        influenceIndices = OpenMaya.MIntArray()
+        for index in range(self._influenceCount(skinFn)):
+            influenceIndices.append(index)
+
+        weights = OpenMaya.MDoubleArray()
+        skinFn.getWeights(dagPath, components, influenceIndices, weights)
+
+        buffer = array.array("d", weights)
+        if numpy is not None:
+            return numpy.frombuffer(buffer, dtype=float).reshape(
+                -1, influenceIndices.length()).copy()
+
+        return buffer
+
+    def setWeights(self, weights, influences=None, normalize=False):
+        """
+        setWeights [Method]
+
+        Writes every weight of the skin cluster in a single call. It skips
+        the undo queue, keep a getWeights copy to go back.
+
+        Args:
+            weights (numpy.ndarray/list): (vertexCount, influenceCount)
+                                          weights or the same values flat.
+            influences (list): The joints of each column, they must be
+                               influences of the skin cluster. Defaults to
+                               "joints".
+            normalize (bool): Let the skin cluster normalize the weights.
+                              Defaults to False.
+
+        Example:
+            body.setWeights(weights, ["L_arm_JNT", "L_elbow_JNT"])
+        """
+        skinFn, dagPath, components = self._skinClusterData()
+
+        indices = self._influenceIndices(skinFn)
+        if influences is None:
+            influences = sorted(indices, key=indices.get)
+        else:
+            influences = [open_maya_api.toMDagPath(str(i)).fullPathName()
+                          for i in influences]
+
+        missing = [i for i in influences if i not in indices]
+        if missing:
+            raise ValueError(">>> {0} not influences of {1}.".format(
+                missing, self.skinCluster.name))
+
+        values = open_maya_api.flatValues(weights)
+
+        vertexCount = OpenMaya.MFnSingleIndexedComponent(components).elementCount()
+        if len(values) != vertexCount * len(influences):
+            raise ValueError(">>> Expected {0} weights, {1} vertices by {2} influences, got {3}.".format(
+                vertexCount * len(influences), vertexCount, len(influences), len(values)))
+
+        influenceIndices = OpenMaya.MIntArray()
+        for influence in influences:
+            influenceIndices.append(indices[influence])
+
+        util = OpenMaya.MScriptUtil()
+        util.createFromList(values, len(values))
+
+        skinFn.setWeights(dagPath, components, influenceIndices,
+                          OpenMaya.MDoubleArray(util.asDoublePtr(), len(values)),
+                          normalize)
 
     def copyWeightsFrom(self, item):
         """
@@ -153,6 +320,36 @@ class Mesh(Dag_Node):
         """
         Mesh(item).copyWeightsTo(self)
 
+    def _skinClusterData(self):
+        """ The skin cluster function set, the skinned shape and all its vertices. """
+        skinCluster = self.skinCluster
+        if not skinCluster.exists():
+            raise ValueError(">>> No skinCluster found on {0}.".format(self.name))
+
+        skinFn = OpenMayaAnim.MFnSkinCluster(skinCluster.dep.object())
+
+        dagPath = OpenMaya.MDagPath()
+        skinFn.getPathAtIndex(0, dagPath)
+
+        componentFn = OpenMaya.MFnSingleIndexedComponent()
+        components = componentFn.create(OpenMaya.MFn.kMeshVertComponent)
+        componentFn.setCompleteData(OpenMaya.MFnMesh(dagPath).numVertices())
+
+        return skinFn, dagPath, components
+
+    @staticmethod
+    def _influenceCount(skinFn):
+        influences = OpenMaya.MDagPathArray()
+        return skinFn.influenceObjects(influences)
+
+    @staticmethod
+    def _influenceIndices(skinFn):
+        """ {joint full path: index used by getWeights/setWeights} """
+        influences = OpenMaya.MDagPathArray()
+        skinFn.influenceObjects(influences)
+
+        return {influences[i].fullPathName(): i for i in range(influences.length())}
+
     # -------------------------------------------------------------------------
     # TOPOLOGY
 
@@ -172,3 +369,202 @@ class Mesh(Dag_Node):
             raise ValueError(">>> No item to duplicate")
 
         return Mesh(m.duplicate(self.fullPath, **kwargs)[0])
+
+
+class Weight_Source(object):
+    """
+    Weight_Source [Class]
+
+    The world points and the weights of a skinned mesh, read and indexed
+    once so many meshes can take their weights from it.
+
+    Args:
+        mesh (str/Mesh): The skinned mesh to copy the weights from.
+
+    Example:
+        source = Weight_Source("body_GEO")
+        for cloth in ["shirt_GEO", "pants_GEO"]:
+            source.copyTo(cloth)
+    """
+    def __init__(self, mesh):
+        self.mesh = Mesh(mesh)
+        self.joints = self.mesh.joints or []
+
+        _, self._dagPath, _ = self.mesh._skinClusterData()
+        self._weights = self.mesh.getWeights()
+        self._tree = KDTree(_worldPoints(self._dagPath))
+        self._intersector = None
+
+    def sample(self, points, interpolate=False):
+        """
+        The source weights at each point.
+
+        Args:
+            points (list): (M, 3) world points.
+            interpolate (bool): Blend the weights of the closest triangle
+                                instead of taking the closest vertex.
+                                Defaults to False.
+
+        Returns:
+            numpy.ndarray/array: (M, influenceCount) weights, flat array("d")
+                                 rows when numpy is not available.
+        """
+        if not interpolate:
+            vertices = self._tree.nearest(points)[0]
+            return self._blend([(i,) for i in vertices], [(1.0,)] * len(vertices))
+
+        vertices, weights = [], []
+        for point in points:
+            triangle, barycentric = self._closestTriangle(point)
+            vertices.append(triangle)
+            weights.append(barycentric)
+
+        return self._blend(vertices, weights)
+
+    def copyTo(self, mesh, interpolate=False):
+        """
+        Skins the mesh to the source joints and sets the sampled weights,
+        a skin cluster with the same joints is kept.
+
+        Args:
+            mesh (str/Mesh): The mesh to copy the weights to.
+            interpolate (bool): See "sample". Defaults to False.
+        """
+        mesh = Mesh(mesh)
+        joints = set(str(i) for i in self.joints)
+
+        if not mesh.skinCluster.exists() or set(str(i) for i in mesh.joints or []) != joints:
+            if mesh.skinCluster.exists():
+                mesh.skinCluster.delete()
+
+            mesh.hardWeightTo(self.joints)
+
+        _, dagPath, _ = mesh._skinClusterData()
+        mesh.setWeights(self.sample(_worldPoints(dagPath), interpolate),
+                        self.joints, normalize=True)
+
+    # -------------------------------------------------------------------------
+
+    def _blend(self, vertices, weights):
+        """ The source rows of each vertex group blended by their weights. """
+        influenceCount = len(self.joints)
+
+        if numpy is not None:
+            result = numpy.zeros((len(vertices), influenceCount))
+            vertices, weights = numpy.asarray(vertices), numpy.asarray(weights)
+
+            for corner in range(vertices.shape[1]):
+                result += self._weights[vertices[:, corner]] * weights[:, corner, numpy.newaxis]
+
+            return result
+
+        result = array.array("d", bytes(8 * len(vertices) * influenceCount))
+        for row, (corners, blend) in enumerate(zip(vertices, weights)):
+            for vertex, weight in zip(corners, blend):
+                for column in range(influenceCount):
+                    result[row * influenceCount + column] += \
+                        self._weights[vertex * influenceCount + column] * weight
+
+        return result
+
+    def _closestTriangle(self, point):
+        """ The vertices of the closest triangle and their barycentric weights. """
+        if self._intersector is None:
+            self._intersector = OpenMaya.MMeshIntersector()
+            self._intersector.create(self._dagPath.node(), self._dagPath.inclusiveMatrix())
+            self._meshFn = OpenMaya.MFnMesh(self._dagPath)
+
+        pointOnMesh = OpenMaya.MPointOnMesh()
+        self._intersector.getClosestPoint(OpenMaya.MPoint(*point[:3]), pointOnMesh)
+
+        uUtil, vUtil = OpenMaya.MScriptUtil(0.0), OpenMaya.MScriptUtil(0.0)
+        uPtr, vPtr = uUtil.asFloatPtr(), vUtil.asFloatPtr()
+        pointOnMesh.getBarycentricCoords(uPtr, vPtr)
+        u, v = OpenMaya.MScriptUtil.getFloat(uPtr), OpenMaya.MScriptUtil.getFloat(vPtr)
+
+        vertexUtil = OpenMaya.MScriptUtil()
+        vertexUtil.createFromList([0, 0, 0], 3)
+        vertexPtr = vertexUtil.asIntPtr()
+        self._meshFn.getPolygonTriangleVertices(
+            pointOnMesh.faceIndex(), pointOnMesh.triangleIndex(), vertexPtr)
+
+        return ([OpenMaya.MScriptUtil.getIntArrayItem(vertexPtr, i) for i in range(3)],
+                [u, v, 1.0 - u - v])
+
+
+class Component_Range(object):
+    """
+    Component_Range [Class]
+
+    A range of mesh components that only becomes strings when used, its
+    str is the compacted "mesh.vtx[0:381]" that cmds understands.
+
+    Args:
+        mesh (Mesh): The mesh of the components.
+        component (str): "vtx", "e" or "f".
+        start (int): First index.
+        stop (int): One past the last index.
+
+    Example:
+        m.move(0, 1, 0, body.verts[:33], r=1)
+        print(body.verts[5])
+        # Output: body_GEO.vtx[5]
+    """
+    def __init__(self, mesh, component, start, stop):
+        self.mesh = mesh
+        self.component = component
+        self.start = start
+        self.stop = max(stop, start)
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __iter__(self):
+        prefix = self._prefix()
+        for index in range(self.start, self.stop):
+            yield "{0}[{1}]".format(prefix, index)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return list(self)[index]
+
+            return Component_Range(self.mesh, self.component,
+                                   self.start + start, self.start + stop)
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError(">>> Component index out of range.")
+
+        return "{0}[{1}]".format(self._prefix(), self.start + index)
+
+    def __str__(self):
+        if not len(self):
+            return ""
+
+        if len(self) == 1:
+            return self[0]
+
+        return "{0}[{1}:{2}]".format(self._prefix(), self.start, self.stop - 1)
+
+    def __repr__(self):
+        return "Component_Range('{0}')".format(self)
+
+    @property
+    def indices(self):
+        return range(self.start, self.stop)
+
+    def _prefix(self):
+        return "{0}.{1}".format(self.mesh.path, self.component)
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def _worldPoints(dagPath):
+    """ [(x, y, z), ...] world positions of the vertices of a mesh shape. """
+    values = open_maya_api.meshPoints(dagPath)
+    return [tuple(values[i:i + 3]) for i in range(0, len(values), 3)]
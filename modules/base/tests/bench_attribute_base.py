@@ -0,0 +1,90 @@
+'''
+/*****************************************************************************/
+                          Benchmark Attributes v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Micro benchmarks for our Attributes Functionality, comparing the cached
+    plug access against the old string path + objExists access.
+
+>> HOW TO USE >>
+	Simply run the script inside Maya, it is not picked by "testing.py".
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+from maya import cmds as m
+from modules.base import Dag_Node as Dag
+from modules.utils import benchmark
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def legacyFullPath(attr):
+    """ The attribute full path as it was resolved before the plug cache. """
+    nodePath = "{0}.{1}".format(attr.node.fullPath, attr.attribute)
+    if attr.node.fullPath and m.objExists(nodePath):
+        return nodePath
+
+
+def legacyGet(attr):
+    return m.getAttr(legacyFullPath(attr))
+
+
+def legacySet(attr, value):
+    m.setAttr(legacyFullPath(attr), value)
+
+
+def benchAttributeAccess(number=2000):
+    """
+    Compares the cost per get/set/fullPath of a translate and a rotate
+    attribute against the old implementation.
+
+    Args:
+        number (int): Calls per repetition. Defaults to 2000.
+
+    Returns:
+        dict: {label: (before, after)} seconds per call.
+    """
+    cube = Dag(m.polyCube(n="bench_GEO")[0])
+    results = {}
+
+    try:
+        for attr in [cube.a.tx, cube.a.rx]:
+            label = "Attribute({}).".format(attr.attr)
+
+            results[label + "get"] = benchmark.compare(
+                label + "get", lambda: legacyGet(attr), attr.get, number)
+
+            results[label + "set"] = benchmark.compare(
+                label + "set", lambda: legacySet(attr, 1),
+                lambda: attr.set(1), number)
+
+            results[label + "fullPath"] = benchmark.compare(
+                label + "fullPath", lambda: legacyFullPath(attr),
+                lambda: attr.fullPath, number)
+    finally:
+        cube.delete()
+
+    return results
+
+# -----------------------------------------------------------------------------
+# EXECUTE SCRIPT
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    benchAttributeAccess()
@@ -33,6 +33,10 @@ import unittest
 from maya import cmds as m
 from modules.base import Dag_Node as Dag
 from modules.base import Attribute
+from modules.base.core.attribute_base import bulkSet, deferred, getAttributeInfo
+from modules.base.core.attribute_expression import (clearExpressionCache,
+                                                    expressionCacheStats)
+from modules.base.core.attribute_compiler import compileExpressions
 
 # -----------------------------------------------------------------------------
 # CLASSES
@@ -96,6 +100,38 @@ class Test_Attributes(Test_Attributes_Base):
         self.sphere.a.zeroAttributes()
         self.assertEqual(self.sphere.a.rx.get(), 0)
 
+    def test_attributes_getMany(self):
+        values = self.sphere.a.getMany(["rx", "t"])
+        self.assertEqual(values["rx"], 1)
+        self.assertEqual(values["t"], [(1, 1, 1)])
+
+    def test_attributes_setMany(self):
+        snapshot = self.sphere.a.getMany(["rx", "t"])
+        self.sphere.a.setMany({"rx": 5, "t": (2, 3, 4)})
+        self.assertEqual(self.sphere.a.rx.get(), 5)
+        self.assertEqual(self.sphere.a.t.get(), [(2, 3, 4)])
+
+        m.undo()
+        self.assertEqual(self.sphere.a.getMany(["rx", "t"]), snapshot)
+
+        self.sphere.a.setMany({"rx": 5, "t": (2, 3, 4)}, undoable=False)
+        self.sphere.a.setMany(snapshot, undoable=False)
+        self.assertEqual(self.sphere.a.getMany(["rx", "t"]), snapshot)
+
+    def test_attributes_setMany_ValueError(self):
+        with self.assertRaises(ValueError):
+            self.sphere.a.setMany({"attr_item_1": 1})
+
+    def test_attributes_bulkSet(self):
+        bulkSet([self.sphere, self.cube.fullPath], ["ry", "s"], [0, (2, 2, 2)])
+        self.assertEqual(self.sphere.a.ry.get(), 0)
+        self.assertEqual(self.cube.a.ry.get(), 0)
+        self.assertEqual(self.cube.a.s.get(), [(2, 2, 2)])
+
+        m.undo()
+        self.assertEqual(self.sphere.a.ry.get(), 1)
+        self.assertEqual(self.cube.a.ry.get(), 2)
+
 
 class Test_Attribute(Test_Attributes_Base):
 
@@ -234,6 +270,130 @@ class Test_Attribute(Test_Attributes_Base):
         (self.sphere.a.tx ** self.cube.a.tx) >> self.plane.a.tx
         self.assertEqual(self.plane.a.tx.get(), 9)
 
+    def test_attribute_expression_cache(self):
+        clearExpressionCache()
+        calc1 = self.sphere.a.sx * 2
+        calc2 = self.sphere.a.scaleX * 2
+        calc3 = self.sphere.a.sx * 3
+
+        self.assertEqual(str(calc1), str(calc2))
+        self.assertNotEqual(str(calc1), str(calc3))
+        self.assertEqual(expressionCacheStats()["saved"], 1)
+
+        calc1.node.delete()
+        calc3.node.delete()
+
+    def test_attribute_expression_cache_setCondition(self):
+        calc1 = (self.cube.a.sx == self.sphere.a.sx)
+        calc2 = (self.cube.a.sx == self.sphere.a.sx)
+        self.assertEqual(str(calc1), str(calc2))
+
+        result1 = calc1.setCondition(ifTrue=1, ifFalse=0)
+        result2 = calc2.setCondition(ifTrue=5, ifFalse=3)
+        self.assertNotEqual(str(result1), str(result2))
+        self.assertEqual(result1.node.a.colorIfTrueR.get(), 1)
+        self.assertEqual(result2.node.a.colorIfTrueR.get(), 5)
+
+        # The last holder edits the node itself
+        self.assertEqual(result2.node.fullPath, calc1.node.fullPath)
+
+        for node in [result1.node, result2.node]:
+            node.delete()
+
+    def test_attribute_expression_cache_setCondition_ValueError(self):
+        calc1 = (self.cube.a.sx > self.sphere.a.sx)
+        calc2 = (self.cube.a.sx > self.sphere.a.sx)
+        calc1 >> self.plane.a.v
+
+        with self.assertRaises(ValueError):
+            calc2.setCondition(ifTrue=1, ifFalse=0)
+
+        calc1.node.delete()
+
+    def test_attribute_deferred(self):
+        nodes = m.ls(type="plusMinusAverage")
+
+        with deferred():
+            calc = (self.sphere.a.tx + 1) + 2 - self.cube.a.tx
+            self.assertEqual(m.ls(type="plusMinusAverage"), nodes)
+
+            calc >> self.plane.a.tx
+
+        self.assertEqual(len(m.ls(type="plusMinusAverage")), len(nodes) + 1)
+        self.assertEqual(self.plane.a.tx.get(), 2)
+
+    def test_attribute_deferred_constants(self):
+        nodes = m.ls(type="multDoubleLinear")
+
+        (self.sphere.a.tx.expr() * 2 * 3 / 6) >> self.plane.a.tx
+        self.assertEqual(m.ls(type="multDoubleLinear"), nodes)
+        self.assertEqual(str(self.plane.a.tx.connectionInput), str(self.sphere.a.tx))
+
+        (self.sphere.a.tx.expr() * 0 + 4) >> self.plane.a.ty
+        self.assertEqual(self.plane.a.ty.get(), 4)
+
+    def test_attribute_deferred_constantLeft(self):
+        self.sphere.a.tx.set(4)
+        (8 / self.sphere.a.tx) >> self.plane.a.tx
+        (10 - self.sphere.a.tx) >> self.plane.a.ty
+        self.assertEqual(self.plane.a.tx.get(), 2)
+        self.assertEqual(self.plane.a.ty.get(), 6)
+
+    def test_attribute_deferred_operands(self):
+        with deferred():
+            (self.sphere.a.t + [1, 2, 3]) >> self.plane.a.t
+            (self.sphere.a.r - self.cube.a.tx) >> self.plane.a.r
+            (self.sphere.a.tx + "cube_GEO.ty") >> self.plane.a.sx
+            (self.cube.a.t * self.sphere.a.tx) >> self.cube.a.s
+
+        self.assertEqual(self.plane.a.t.get(), [(2, 3, 4)])
+        self.assertEqual(self.plane.a.r.get(), [(-1, -1, -1)])
+        self.assertEqual(self.plane.a.sx.get(), 3)
+        self.assertEqual(self.cube.a.s.get(), [(2, 2, 2)])
+
+        with self.assertRaises(ValueError):
+            (self.sphere.a.t.expr() + [1, 2]) >> self.plane.a.t
+
+    def test_attribute_deferred_compiled(self):
+        nodes = m.ls(type="multiplyDivide")
+
+        with deferred(compiled=True):
+            (self.sphere.a.tx * 3) >> self.plane.a.tx
+            (self.cube.a.tx / 4) >> self.plane.a.ty
+            (self.cube.a.ty * self.sphere.a.ty) >> self.plane.a.tz
+
+        self.assertEqual(len(m.ls(type="multiplyDivide")), len(nodes) + 1)
+        self.assertEqual(self.plane.a.tx.get(), 3)
+        self.assertEqual(self.plane.a.ty.get(), 0.5)
+        self.assertEqual(self.plane.a.tz.get(), 2)
+
+    def test_attribute_compileExpressions(self):
+        a, b = self.sphere.a.tx.expr(), self.cube.a.tx.expr()
+        report = compileExpressions(
+            [(a * b * a * b, self.plane.a.tx), (a + b - 1, self.plane.a.ty)], False)
+
+        self.assertEqual(report["before"], 5)
+        self.assertEqual(report["after"], 3)
+        self.assertEqual(self.plane.a.tx.get(), 4)
+        self.assertEqual(self.plane.a.ty.get(), 2)
+
+    def test_attribute_compileExpressions_operands(self):
+        compileExpressions([(self.sphere.a.t.expr() * [1, 2, 3], self.plane.a.t),
+                            (self.sphere.a.tx.expr() + "cube_GEO.ty", self.plane.a.sx)], False)
+
+        self.assertEqual(self.plane.a.t.get(), [(1, 2, 3)])
+        self.assertEqual(self.plane.a.sx.get(), 3)
+
+    def test_attribute_compileExpressions_matrix(self):
+        calc = self.sphere.a.worldMatrix.expr() * self.cube.a.worldInverseMatrix
+        report = compileExpressions([(calc, None)], False)
+
+        self.assertEqual(report["after"], 1)
+        self.assertEqual(m.nodeType(report["outputs"][0].node.name), "multMatrix")
+
+        with self.assertRaises(ValueError):
+            compileExpressions([(self.sphere.a.worldMatrix.expr() + 1, None)], False)
+
     # -----------------------------------------------------------------------------
 
     def test_attribute_isParent(self): 
@@ -262,7 +422,17 @@ class Test_Attribute(Test_Attributes_Base):
         self.assertEqual(self.sphere.fullPath, "|sphere_GEO_OFF_GRP|sphere_GEO")
         self.assertEqual(self.sphere.a.rx.fullPath, "|sphere_GEO_OFF_GRP|sphere_GEO.rx")
 
-    def test_attribute_set(self): 
+    def test_attribute_plug(self):
+        self.assertTrue(self.sphere.a.rx.plug is self.sphere.a.rx.plug)
+        self.assertEqual(self.sphere.a.attr_item_1.plug, None)
+
+        self.sphere.a.add(ln="attr_item_1", at="float", k=1)
+        self.assertTrue(self.sphere.a.attr_item_1.exists())
+
+        self.sphere.a.attr_item_1.delete()
+        self.assertEqual(self.sphere.a.attr_item_1.plug, None)
+
+    def test_attribute_set(self):
         self.assertEqual(self.sphere.a.rx.get(), 1)
         self.sphere.a.rx.set(2)
         self.assertEqual(self.sphere.a.rx.get(), 2)
@@ -296,6 +466,32 @@ class Test_Attribute(Test_Attributes_Base):
             str([self.sphere.a.rotateX, self.sphere.a.rotateY, self.sphere.a.rotateZ])
         )
         
+    def test_attribute_metadata(self):
+        info = self.sphere.a.r.metadata
+        self.assertEqual(info["children"], ["rotateX", "rotateY", "rotateZ"])
+        self.assertEqual(info["type"], "double3")
+        self.assertFalse(info["multi"])
+
+        self.assertEqual(self.sphere.a.rx.metadata["parent"], "rotate")
+        self.assertEqual(self.sphere.a.rx.metadata["type"], "doubleAngle")
+        self.assertEqual(self.sphere.a.worldMatrix.metadata["type"], "matrix")
+        self.assertTrue(self.sphere.a.worldMatrix.metadata["multi"])
+        self.assertEqual(self.sphere.a.missingAttr.metadata, None)
+
+        # Shared between the nodes of the same type
+        self.assertIs(getAttributeInfo(self.cube, "r"), info)
+
+    def test_attribute_metadata_dynamic(self):
+        self.sphere.a.add(ln="foo", at="double3")
+        self.sphere.a.add(ln="fooX", at="double", p="foo")
+        self.sphere.a.add(ln="fooY", at="double", p="foo")
+        self.sphere.a.add(ln="fooZ", at="double", p="foo")
+        self.cube.a.add(ln="foo", at="double")
+
+        self.assertTrue(self.sphere.a.foo.metadata["dynamic"])
+        self.assertEqual(len(self.sphere.a.foo.children), 3)
+        self.assertEqual(self.cube.a.foo.children, [])
+
     def test_attribute_parent(self): 
         self.assertEqual(self.sphere.a.r.parent, [])
         self.assertEqual(self.sphere.a.rx.parent, self.sphere.a.r)
@@ -0,0 +1,90 @@
+'''
+/*****************************************************************************/
+                         Test Connection Graph v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Tests for our Connection Graph Functionality
+
+>> HOW TO USE >>
+	Simply run the script or run the script called "testing.py"
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import unittest
+from maya import cmds as m
+from modules.base import Dag_Node, ConnectionGraph
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+
+class Test_Connection_Graph(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.sphere = Dag_Node(m.polySphere(n="sphere_GEO")[0])
+        self.cube = Dag_Node(m.polyCube(n="cube_GEO")[0])
+        self.plane = Dag_Node(m.polyPlane(n="plane_GEO")[0])
+
+        self.cube.a.t >> self.sphere.a.t
+        self.cube.a.rx >> self.sphere.a.rx
+        self.cube.a.rx >> self.plane.a.rx
+
+    def tearDown(self) -> None:
+        for node in [self.sphere, self.cube, self.plane]:
+            node.delete()
+
+    def test_connectionInput(self):
+        graph = ConnectionGraph()
+
+        self.assertEqual(
+            str(graph.connectionInput(self.sphere.a.rx)),
+            str(self.sphere.a.rx.connectionInput))
+        self.assertEqual(
+            str(graph.connectionInput(self.sphere.a.t)),
+            str(self.sphere.a.t.connectionInput))
+        self.assertEqual(graph.connectionInput(self.plane.a.ry), None)
+
+    def test_connectionOutputs(self):
+        graph = ConnectionGraph()
+
+        self.assertEqual(
+            sorted(str(i) for i in graph.connectionOutputs(self.cube.a.rx)),
+            sorted(str(i) for i in self.cube.a.rx.connectionOutputs))
+        self.assertEqual(graph.connectionOutputs(self.plane.a.rx), None)
+
+    def test_track(self):
+        graph = ConnectionGraph(track=True)
+
+        try:
+            self.cube.a.ry >> self.plane.a.ry
+            self.assertEqual(
+                str(graph.connectionInput(self.plane.a.ry)), str(self.cube.a.ry))
+
+            self.plane.a.ry.disconnect()
+            self.assertEqual(graph.connectionInput(self.plane.a.ry), None)
+        finally:
+            graph.untrack()
+
+# -----------------------------------------------------------------------------
+# EXECUTE SCRIPT
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+'''
+/*****************************************************************************/
+                            Test Curve Node v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Tests for our Curve Node Functionality
+
+>> HOW TO USE >>
+	Simply run the script or run the script called "testing.py"
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import unittest
+from maya import cmds as m
+from modules.base import Curve
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+class Test_Curve(unittest.TestCase):
+
+    def setUp(self):
+        self.circle = Curve(m.circle(n="circle_CTL", s=8, normal=[0, 1, 0], ch=False)[0])
+        self.line = Curve(m.curve(n="line_CTL", d=1, p=[(0, 0, 0), (1, 0, 0), (1, 1, 0)]))
+
+    def tearDown(self) -> None:
+        self.circle.delete()
+        self.line.delete()
+
+    def test_curve_getCVs(self):
+        self.circle.a.ty.set(2)
+        cvs = self.circle.getCVs()
+
+        self.assertEqual(len(cvs), len(self.circle.points) * 3)
+        self.assertEqual(
+            [round(i, 4) for i in cvs[:3]],
+            [round(i, 4) for i in m.pointPosition(self.circle.points[0], w=1)])
+        self.assertEqual(round(self.circle.getCVs("object")[1], 4), round(cvs[1] - 2, 4))
+
+    def test_curve_pointPosition(self):
+        self.assertEqual(self.line.pointPosition, [[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+
+    def test_curve_setCVs(self):
+        self.line.setCVs([[0, 0, 0], [2, 0, 0], [2, 2, 0]])
+        self.assertEqual(list(self.line.getCVs()), [0, 0, 0, 2, 0, 0, 2, 2, 0])
+
+        points = [[i, 0, 0] for i in range(8)]
+        self.circle.setCVs(points)
+        self.assertEqual(self.circle.pointPosition, points)
+
+        with self.assertRaises(ValueError):
+            self.line.setCVs([0, 0, 0])
+
+    def test_curve_getShapeData(self):
+        data = self.circle.getShapeData()
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["degree"], 3)
+        self.assertEqual(len(data[0]["knots"]), 8 + 5)
+        self.assertEqual(len(data[0]["cvs"]), (8 + 3) * 3)
+
+    def test_curve_setCVs_shapes(self):
+        self.circle.mergeCurves(self.line)
+        cvs = self.circle.getCVs()
+
+        self.assertEqual(len(cvs), (8 + 3) * 3)
+
+        self.circle.setCVs([i + 1 for i in cvs])
+        self.assertEqual([round(i, 4) for i in self.circle.getCVs()], [round(i + 1, 4) for i in cvs])
+
+# -----------------------------------------------------------------------------
+# EXECUTE SCRIPT
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -33,6 +33,7 @@
 import unittest
 from maya import cmds as m
 from modules.base import Dag_Node as Dag
+from modules.base.core.dag_dimension import boundingBoxes, positions
 
 # -----------------------------------------------------------------------------
 # CLASSES
@@ -70,6 +71,35 @@ class Test_Object_Dimension(unittest.TestCase):
         expectedResult = [-1.0, -1.0, -1.0, 1.0, 1.0, 1.0]
         self.assertEqual([round(i, 4) for i in self.sphere.o.xformBoundingBox], expectedResult)
 
+    def test_dag_dimension_xformBoundingBox_cache(self):
+        self.assertEqual([round(i, 4) for i in self.sphere.o.bb], [-1.0, -1.0, -1.0, 1.0, 1.0, 1.0])
+
+        self.sphere.a.tx.set(2)
+        self.assertEqual([round(i, 4) for i in self.sphere.o.bb], [1.0, -1.0, -1.0, 3.0, 1.0, 1.0])
+
+        m.setAttr(self.sphere.shapes[0].fullPath + ".pnts[0]", 0, 5, 0)
+        self.assertEqual(
+            [round(i, 4) for i in self.sphere.o.bb],
+            [round(i, 4) for i in m.xform(self.sphere.fullPath, q=1, bbi=1)])
+
+    def test_dag_dimension_xformBoundingBox_cache_children(self):
+        self.cube.a.ty.set(5)
+        self.assertEqual([round(i, 4) for i in self.sphere.o.bb], [-1.0, -1.0, -1.0, 1.0, 1.0, 1.0])
+
+        m.parent(self.cube.fullPath, self.sphere.fullPath)
+        self.assertEqual([round(i, 4) for i in self.sphere.o.bb], [-1.0, -1.0, -1.5, 1.0, 6.0, 1.5])
+
+        m.parent(self.sphere.fullPath + "|" + self.cubeName, world=True)
+        self.assertEqual([round(i, 4) for i in self.sphere.o.bb], [-1.0, -1.0, -1.0, 1.0, 1.0, 1.0])
+
+    def test_dag_dimension_boundingBoxes(self):
+        self.cube.a.ty.set(5)
+
+        self.assertEqual(
+            [[round(i, 4) for i in box] for box in boundingBoxes([self.sphere, self.cube])],
+            [[round(i, 4) for i in m.xform(node.fullPath, q=1, bbi=1)]
+             for node in [self.sphere, self.cube]])
+
     def test_dag_dimension_bb(self):
         expectedResult = lambda x: self.sphere.o.xformBoundingBox
         testedResult = lambda x: self.sphere.o.bb
@@ -103,6 +133,23 @@ class Test_Object_Dimension(unittest.TestCase):
         [self.sphere.a[i].set(1) for i in self.attrs]
         self.assertEqual(self.sphere.o.position, [1, 1, 1, 1, 1, 1])
 
+    def test_dag_dimension_position_parented(self):
+        tempDag = Dag(m.group(em=1, w=1))
+        tempDag.a.ty.set(5)
+        tempDag.a.ry.set(90)
+        m.parent(self.cube.fullPath, tempDag.fullPath)
+
+        self.assertEqual([round(i, 4) for i in self.cube.o.position], [0, 5, 0, 0, 90, 0])
+
+        tempDag.delete()
+
+    def test_dag_dimension_positions(self):
+        self.cube.a.t.set(1, 2, 3)
+
+        self.assertEqual(
+            [[round(i, 4) for i in row] for row in positions([self.sphere, self.cube])],
+            [[0, 0, 0, 0, 0, 0], [1, 2, 3, 0, 0, 0]])
+
     # def test_dag_dimension_pivot(self): pass
 
     def test_dag_dimension_copyPivotTo(self):
@@ -32,6 +32,7 @@
 
 import unittest
 from maya import cmds
+from maya import OpenMaya
 from modules.base import Dag_Node
 
 # -----------------------------------------------------------------------------
@@ -149,9 +150,45 @@ class Test_Dag_Hierarchy(Test_Dag_Node_Base):
         self.assertEqual(len(self.grp1.children), 5)
         self.assertEqual(self.grp1.children[0], self.sphere)
 
+    def test_dag_node_fromMObject(self):
+        children = self.grp1.children
+        self.assertIs(children[0], self.grp1.children[0])
+
+        obj = self.sphere.dep.object()
+        self.assertIs(Dag_Node.fromMObject(obj), Dag_Node.fromMObject(obj))
+        self.assertEqual(Dag_Node.fromMObject(obj), self.sphere)
+
+    def test_dag_node_fromMObject_deleted(self):
+        grp = Dag_Node.fromNames([cmds.group(em=1, n="TEMP_GRP")])[0]
+        obj = grp.dep.object()
+
+        self.assertIs(Dag_Node.fromMObject(obj), grp)
+
+        cmds.delete("TEMP_GRP")
+        self.assertFalse(grp.exists())
+
     def test_dag_node_allChildren(self):
         self.assertEqual(len(self.grp1.allChildren), 7)
 
+    def test_dag_node_iterChildren(self):
+        self.assertEqual(len(list(self.grp1.iterChildren())), 5)
+        self.assertEqual(len(list(self.sphere.iterChildren(shapes=True))), 1)
+        self.assertEqual(
+            len(list(self.grp1.iterChildren(OpenMaya.MFn.kMesh, shapes=True))), 0)
+
+    def test_dag_node_iterDescendants(self):
+        meshes = list(self.grp1.iterDescendants(OpenMaya.MFn.kMesh))
+        self.assertEqual(len(meshes), 1)
+        self.assertEqual(meshes[0].name, self.sphereName + "Shape")
+
+        depthFirst = [i.name for i in self.grp1.iterDescendants(OpenMaya.MFn.kTransform)]
+        breadthFirst = [i.name for i in self.grp1.iterDescendants(
+            OpenMaya.MFn.kTransform, depthFirst=False)]
+
+        self.assertEqual(breadthFirst[-1], "OFFSET_5_GRP")
+        self.assertEqual(sorted(depthFirst), sorted(breadthFirst))
+        self.assertLess(depthFirst.index("OFFSET_4_GRP"), depthFirst.index("OFFSET_5_GRP"))
+
     def test_dag_node_parent(self):
         self.assertEqual(Dag_Node(self.grp5).parent, Dag_Node(self.grp4))
 
@@ -183,6 +220,21 @@ class Test_Dag_Hierarchy(Test_Dag_Node_Base):
         self.assertTrue(cmds.xform(self.sphere, ws=1, t=1, q=1) == 
                          cmds.xform(self.joint, ws=1, t=1, q=1))
 
+    def test_dag_node_moveTo_jointOrient(self):
+        cmds.xform(self.sphere.fullPath, ws=1, t=(1, 2, 3), ro=(30, 45, 60))
+        cmds.setAttr(self.joint.fullPath + ".jointOrient", 10, 20, 30)
+        cmds.setAttr(self.joint.fullPath + ".rotateOrder", 4)
+
+        self.joint.moveTo(self.sphere)
+
+        for expected, result in zip(
+                cmds.xform(self.sphere.fullPath, q=1, ws=1, m=1),
+                cmds.xform(self.joint.fullPath, q=1, ws=1, m=1)):
+            self.assertAlmostEqual(expected, result, 4)
+
+        self.assertEqual(
+            cmds.getAttr(self.joint.fullPath + ".jointOrient")[0], (10, 20, 30))
+
     def test_dag_node_moveHere(self):
         cmds.setAttr(self.sphere.fullPath + ".tz", 100)
         self.assertFalse(cmds.xform(self.sphere, ws=1, t=1, q=1) == 
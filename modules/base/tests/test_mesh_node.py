@@ -33,6 +33,7 @@
 import unittest
 from maya import cmds as m
 from modules.base import Mesh, Dag_Node, Dep_Node
+from modules.base.mesh_node import Weight_Source
 
 # -----------------------------------------------------------------------------
 # CLASSES
@@ -78,6 +79,37 @@ class Test_Mesh(unittest.TestCase):
     def test_mesh_faces(self): 
         self.assertEqual(self.sphere.faces[0], self.sphereName + ".f[0]")
         self.assertEqual(self.sphere.faces[1], self.sphereName + ".f[1]")
+
+    def test_mesh_componentRange(self):
+        self.assertEqual(len(self.sphere.verts), len(m.ls(self.sphereName + ".vtx[*]", fl=1)))
+        self.assertEqual(list(self.sphere.verts), m.ls(self.sphereName + ".vtx[*]", fl=1))
+        self.assertEqual(str(self.sphere.verts[:33]), self.sphereName + ".vtx[0:32]")
+        self.assertEqual(len(m.ls(self.sphere.verts[:33], fl=1)), 33)
+
+    def test_mesh_vertexCount(self):
+        self.assertEqual(self.sphere.vertexCount, m.polyEvaluate(self.sphereName, v=1))
+        self.assertEqual(self.sphere.edgeCount, m.polyEvaluate(self.sphereName, e=1))
+        self.assertEqual(self.sphere.faceCount, m.polyEvaluate(self.sphereName, f=1))
+
+    def test_mesh_points(self):
+        self.sphere.a.ty.set(2)
+
+        # (N, 3) with numpy, flat without
+        firstPoint = lambda points: [round(float(i), 4) for i in list(points)[0]] \
+            if hasattr(points, "shape") else [round(i, 4) for i in points[:3]]
+
+        world = firstPoint(self.sphere.points())
+        self.assertEqual(world, [round(i, 4) for i in m.pointPosition(self.sphere.verts[0], w=1)])
+        self.assertEqual(firstPoint(self.sphere.points("object"))[1], round(world[1] - 2, 4))
+
+        with self.assertRaises(ValueError):
+            self.sphere.points("tangent")
+
+    def test_mesh_faceVertexIndices(self):
+        counts, indices = self.cube.faceVertexIndices()
+
+        self.assertEqual(list(counts), [4] * 6)
+        self.assertEqual(list(indices[:4]), [int(i) for i in m.polyInfo(self.cubeName + ".f[0]", fv=1)[0].split()[2:]])
         
 
     # -------------------------------------------------------------------------
@@ -116,6 +148,65 @@ class Test_Mesh(unittest.TestCase):
         self.sphere.copyWeightsTo(self.cube)
         self.assertTrue(self.cube.skinCluster.exists())
 
+    def test_mesh_getWeights(self):
+        weights = self.sphere.getWeights()
+        vertexCount = len(self.sphere.verts)
+
+        self.assertEqual(len(weights) if hasattr(weights, "shape") else len(weights) // 2, vertexCount)
+        self.assertEqual(
+            round(sum(weights.ravel() if hasattr(weights, "ravel") else weights), 4), vertexCount)
+        self.assertEqual(
+            round(m.skinPercent(self.sphere.skinCluster.name, self.sphere.verts[0],
+                                transform=self.body_j2.name, q=1), 4),
+            round(float(weights[0][1] if hasattr(weights, "shape") else weights[1]), 4))
+
+    def test_mesh_setWeights(self):
+        vertexCount = len(self.sphere.verts)
+        self.sphere.setWeights([[0, 1]] * vertexCount)
+
+        self.assertEqual(
+            m.skinPercent(self.sphere.skinCluster.name, self.sphere.verts[5],
+                          transform=self.body_j2.name, q=1), 1)
+
+        self.sphere.setWeights([1] * vertexCount, [self.body_j1])
+        self.assertEqual(
+            m.skinPercent(self.sphere.skinCluster.name, self.sphere.verts[5],
+                          transform=self.body_j1.name, q=1), 1)
+
+        with self.assertRaises(ValueError):
+            self.sphere.setWeights([1] * vertexCount, [self.cube])
+
+        with self.assertRaises(ValueError):
+            self.sphere.setWeights([1, 0])
+
+    def test_mesh_copyWeightsTo_weights(self):
+        sphere2 = Mesh(m.polySphere(n="sphere2_GEO", r=1)[0])
+        sphere3 = Mesh(m.polySphere(n="sphere3_GEO", r=1)[0])
+
+        self.sphere.copyWeightsTo([sphere2, sphere3])
+
+        for mesh in [sphere2, sphere3]:
+            self.assertEqual(
+                round(m.skinPercent(mesh.skinCluster.name, mesh.verts[3], transform=self.body_j2.name, q=1), 4),
+                round(m.skinPercent(self.sphere.skinCluster.name, self.sphere.verts[3],
+                                    transform=self.body_j2.name, q=1), 4))
+
+        sphere2.delete()
+        sphere3.delete()
+
+    def test_mesh_weightSource_interpolate(self):
+        source = Weight_Source(self.sphere)
+        point = m.pointPosition(self.sphere.verts[7], w=1)
+
+        for interpolate in [False, True]:
+            weights = source.sample([point], interpolate)
+            rows = weights.tolist() if hasattr(weights, "tolist") else [list(weights)]
+            self.assertEqual(round(sum(rows[0]), 4), 1)
+            self.assertEqual(
+                round(rows[0][1], 4),
+                round(m.skinPercent(self.sphere.skinCluster.name, self.sphere.verts[7],
+                                    transform=self.body_j2.name, q=1), 4))
+
     def test_mesh_copyWeightsFrom(self): 
         self.cube.copyWeightsFrom(self.sphere)
         self.assertTrue(self.cube.skinCluster.exists())
@@ -35,6 +35,9 @@ from modules.build.guides.base.guide_base import (Base_Guide,
 
 from modules.build.guides.base.guide_base import Guide_Main
 
+from modules.build.guides.base.guide_registry import (Guide_Registry,
+                                                      registry)
+
 # -----------------------------------------------------------------------------
 # ENHANCED NODES
 
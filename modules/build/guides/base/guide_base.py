@@ -15,9 +15,20 @@
 
 >> CONTENTS >> 
     + Window_Base [Class]
+    + build_guides [Func]
+    + resolve_template [Func]
+    + save_template [Func]
+    + load_template [Func]
 
 >> NOTES >> 
 	Update 22/08/2023 : Start working on the script
+    Update 18/10/2026 : Guide joints are found with an MItDag filter.
+    Update 18/10/2026 : Guides are built from template rows with one
+                        MDagModifier, templates can be cached as json.
+    Update 18/10/2026 : The guides are looked up in the guide registry.
+    Update 18/10/2026 : mirror_guide computes the mirrored guides in one
+                        pass, without selection changes or mel, and
+                        undoes in one step.
 
 >> CONTACT >>
     luisf.carranza@outlook.com
@@ -29,10 +40,26 @@
 # -----------------------------------------------------------------------------
 # LIBRARIES AND MODULES
 # -----------------------------------------------------------------------------
+import json
+import os
 import sys
 from maya import cmds as m
-from maya import mel
-from modules.base import Joint, Curve, Dag_Node as Dag
+from maya import OpenMaya
+from modules.base import Joint, Curve
+from modules.build.guides.base.guide_registry import registry, register_guide
+from modules.common.names import JOINT_LABEL_DICT
+from modules.utils import api_undo
+from modules.utils.open_maya_api import nodeKey, toMObject
+
+# Columns of a guide template row, "world" rows have their position in the
+# space of the template parent, the others relative to their parent guide.
+GUIDE_COLUMNS = ("name", "parent", "position", "orient", "world", "label",
+                 "radius", "kind")
+
+_TEMPLATE_VERSION = 1
+
+# Axis flipped by each mirror plane
+_MIRROR_PLANES = {"YZ": 0, "XZ": 1, "XY": 2}
 
 # -----------------------------------------------------------------------------
 # CLASSES
@@ -60,6 +87,7 @@ class Base_Guide(Joint):
         super().__init__(node, **kwargs)
 
         self.a.add(ln="PtmMadre", nn="Base", at="float", k=True)
+        register_guide(self)
 
     pass
 
@@ -68,67 +96,154 @@ class Base_Guide(Joint):
 # -----------------------------------------------------------------------------
 
 def find_guide_main():
-    main_guide = m.ls("Guide")
-
-    gMain = Dag(main_guide[0])
-
-    return gMain
+    # The registry keeps it between calls, no ls on every click
+    return registry().main()
 
 def find_guide_joints():
-    gMain = find_guide_main()
-    guide_joints = gMain.allChildren[1:]
-    guide_joints = [Joint(i) for i in guide_joints]
+    # Same order as listRelatives(ad=True), read from the registry
+    return registry().joints()
 
-    return guide_joints
-
-def mirror_guide():
+def mirror_guide(plane="YZ", rules=(("L_", "R_"),), orient="xzy",
+                 secondary="ydown", unlabeled="zdown", keep=("heel",)):
     """
     Find and mirror the guides on scene.
+
+    Every branch of one side is duplicated, renamed and placed in one
+    pass: the mirrored world matrices are computed in python and written
+    with one MDGModifier, no selection change and no joint command per
+    guide. The duplicates and the modifier run inside one undo chunk, a
+    single undo removes the mirrored side.
+
+    Args:
+        plane (str): Mirror plane "YZ", "XZ" or "XY". Defaults to "YZ".
+        rules (tuple): ((prefix, replace), ...) name rules, a guide is
+                       mirrored when its name starts with a prefix.
+        orient (str): Aim, secondary and last axis, the aim axis points
+                      to the first child. Defaults to "xzy".
+        secondary (str): World direction of the secondary axis, example
+                         "ydown" or "zup". Defaults to "ydown".
+        unlabeled (str): Secondary axis direction of the guides without a
+                         label type, the eyes excepted. Defaults to "zdown".
+        keep (tuple): End guides whose name has one of these keep the
+                      mirrored orientation, the others are zeroed.
+
+    Returns:
+        list: [Joint, ...] the mirrored guides.
+
+    Example:
+        mirror_guide()
+        mirror_guide(rules=(("L_", "R_"), ("Lf_", "Rt_")))
     """
-    
+    if plane not in _MIRROR_PLANES:
+        raise ValueError(">>> Mirror plane has to be one of {0}.".format(
+            sorted(_MIRROR_PLANES)))
+
     guide_joints = find_guide_joints()
-    
-    side = "L_"
-    
-    joints_to_mirror = []
-    mirrored_joints = []
 
+    joints_to_mirror = []
     for jnt in guide_joints:
-        if jnt.name.startswith(side):
-            if jnt.parent.name.startswith(side):
-                continue
-            else:
-                if not m.objExists(jnt.name.replace(side, "R_")):
-                    joints_to_mirror.append(jnt)
-    
+        name = _mirrorName(jnt.name, rules)
+        if name is None or (jnt.parent and _mirrorName(jnt.parent.name, rules) is not None):
+            continue
+
+        if not m.objExists(name):
+            joints_to_mirror.append(jnt)
+
     if not joints_to_mirror:
         sys.stdout.write (">>> There's nothing left to mirror")
+        return []
+
+    m.undoInfo(openChunk=True, chunkName="mirror_guide")
+    selection = m.ls(sl=True, long=True)
+    try:
+        return _mirrorGuide(joints_to_mirror, plane, rules, orient,
+                            secondary, unlabeled, keep)
+    finally:
+        # The duplicate command selects the copies
+        if selection:
+            m.select(selection, r=True)
+        else:
+            m.select(cl=True)
+        m.undoInfo(closeChunk=True)
+
+
+def _mirrorGuide(joints_to_mirror, plane, rules, orient, secondary, unlabeled, keep):
+    """ mirror_guide without the undo chunk, the branch roots are found. """
+    flip = _MIRROR_PLANES[plane]
+    aim, up = "xyz".index(orient[0]), "xyz".index(orient[1])
+    labeledUp, unlabeledUp = _upVector(secondary), _upVector(unlabeled)
+
+    modifier = OpenMaya.MDGModifier()
+    mirrored_joints = []
 
     for jnt in joints_to_mirror:
-        mirrored =  m.mirrorJoint(jnt, mirrorYZ = True, sr=["L_", "R_"])
-        for i in  mirrored:
-            mirrored_joints.append(i)
+        source = jnt.dag
+        copy = toMObject(m.duplicate(source.fullPathName(), rr=True)[0])
+        matrices = {}
+
+        for sourcePath, copyObj, parentObj in _branchPairs(source, copy):
+            fnCopy = OpenMaya.MFnDependencyNode(copyObj)
+            sourceName = sourcePath.partialPathName().split("|")[-1]
+
+            # Children without a rule keep their name, as mirrorJoint did
+            modifier.renameNode(copyObj, _mirrorName(sourceName, rules) or sourceName)
+
+            parentMatrix = matrices.get(nodeKey(parentObj))
+            if parentMatrix is None:
+                parentMatrix = _worldMatrix(parentObj)
+
+            # World position and rotation of the mirrored guide
+            sourceMatrix = sourcePath.inclusiveMatrix()
+            position = _reflect(_matrixRow(sourceMatrix, 3), flip)
+            children = _jointChildren(sourcePath)
+            rotation = None
+
+            if children:
+                labeled = "eye" in sourceName or fnCopy.findPlug("type").asInt() != 0
+                target = _reflect(_matrixRow(children[0].inclusiveMatrix(), 3), flip)
+                rotation = _aimRotation(target - position,
+                                        labeledUp if labeled else unlabeledUp, aim, up)
+
+            if rotation is None and (children or any(i in sourceName for i in keep)):
+                rotation = _reflectRotation(sourceMatrix, flip, aim, up)
+
+            # Local values, the rotate channels are kept
+            fnTransform = OpenMaya.MFnTransform(copyObj)
+            rotate = OpenMaya.MEulerRotation()
+            fnTransform.getRotation(rotate)
+            parentRotation = OpenMaya.MTransformationMatrix(parentMatrix).rotation().asMatrix()
+
+            if rotation is None:
+                jointOrient = OpenMaya.MMatrix()
+                rotation = rotate.asMatrix() * parentRotation
+            else:
+                jointOrient = rotate.asMatrix().inverse() * rotation * parentRotation.inverse()
 
-    mirrored_joints = [Joint(i) for i in mirrored_joints]
+            translate = OpenMaya.MPoint(position) * parentMatrix.inverse()
+            jointOrient = OpenMaya.MTransformationMatrix(jointOrient).eulerRotation()
 
-    for jnt in mirrored_joints:
-        jnt.setLabelSide("R")
-        
-        # Setting the joint orientation
-        m.select(jnt)
+            for axis, value in zip("xyz", (translate.x, translate.y, translate.z)):
+                modifier.newPlugValueMDistance(fnCopy.findPlug("t" + axis),
+                                               OpenMaya.MDistance(value))
 
-        if "eye"  in jnt.name or jnt.labelType:
-            mel.eval("joint -e  -oj xzy -secondaryAxisOrient ydown -ch -zso;")
-        else:
-            mel.eval("joint -e  -oj xzy -secondaryAxisOrient zdown -ch -zso;")
+            for axis, value in zip("xyz", (jointOrient.x, jointOrient.y, jointOrient.z)):
+                modifier.newPlugValueMAngle(fnCopy.findPlug("jo" + axis),
+                                            OpenMaya.MAngle(value))
+
+            side = fnCopy.findPlug("side")
+            modifier.newPlugValueInt(side, {1: 2, 2: 1}.get(side.asInt(), side.asInt()))
 
-        if not jnt.children and "heel" not in jnt.name:
-            jnt.setJointOrient(0)
+            inverseScale = fnCopy.findPlug("inverseScale")
+            if parentObj.hasFn(OpenMaya.MFn.kJoint) and not inverseScale.isConnected():
+                modifier.connect(OpenMaya.MFnDependencyNode(parentObj).findPlug("scale"),
+                                 inverseScale)
 
+            matrices[nodeKey(copyObj)] = _composeMatrix(rotation, position)
+            mirrored_joints.append(copyObj)
 
-    m.select(cl = True) # Cleaning last selected object.
+    api_undo.doIt(modifier)
 
-    return mirrored_joints
+    return [Joint.fromMObject(i) for i in mirrored_joints]
 
 def toggle_guide_name():
     """
@@ -158,4 +273,367 @@ def toggle_guide_axis():
             jnt.hideLocalAxis()
         else:
             jnt.showLocalAxis()
-    pass
\ No newline at end of file
+    pass
+
+def build_guides(rows, kinds, parent=None):
+    """
+    build_guides [Function]
+
+    Creates a guide hierarchy from template rows in one MDagModifier, no
+    joint command and no selection change per guide. The modifiers run as
+    undoable commands inside one undo chunk, a single undo removes them.
+
+    Args:
+        rows (list): [(name, parent, position, orient, world, label,
+                     radius, kind), ...] parents before their children,
+                     see GUIDE_COLUMNS.
+        kinds (dict): {kind: {"attrs": [(longName, niceName), ...],
+                      "lockHide": [attr, ...], "lock": [attr, ...]}} the
+                      tag attributes and the locked channels of each kind.
+        parent (str/Dag_Node): Parent of the rows whose parent is not in
+                               the template. Defaults to the parent named
+                               in the row, or the world if it doesn't exist.
+
+    Returns:
+        dict: {name: Base_Guide} the new guides in the template order.
+
+    Example:
+        guides = build_guides(BIPED_GUIDES, GUIDE_KINDS, "Guide")
+        print(guides["L_hand"])
+        # Output: Base_Guide('L_hand')
+    """
+    m.undoInfo(openChunk=True, chunkName="build_guides")
+    try:
+        return _buildGuides(resolve_template(rows), kinds, parent)
+    finally:
+        m.undoInfo(closeChunk=True)
+
+
+def _buildGuides(rows, kinds, parent):
+    """ build_guides without the undo chunk, the rows are resolved. """
+    modifier = OpenMaya.MDagModifier()
+    nodes = {}
+
+    # Nodes and tag attributes
+    for name, parentName, _, _, _, _, _, kind in rows:
+        parentObj = nodes.get(parentName)
+        if parentObj is None:
+            parentObj = _sceneParent(parent or parentName)
+
+        obj = modifier.createNode("joint", parentObj)
+        modifier.renameNode(obj, name)
+
+        for longName, niceName in kinds[kind].get("attrs", ()):
+            modifier.addAttribute(obj, _tagAttribute(longName, niceName))
+
+        nodes[name] = obj
+
+    api_undo.doIt(modifier)
+
+    # Values and locks, queued on a second modifier once the attributes exist
+    modifier = OpenMaya.MDGModifier()
+
+    for name, parentName, position, orient, _, label, radius, _ in rows:
+        fnNode = OpenMaya.MFnDependencyNode(nodes[name])
+
+        for axis, value in zip("xyz", position):
+            modifier.newPlugValueMDistance(
+                fnNode.findPlug("t" + axis),
+                OpenMaya.MDistance(value, OpenMaya.MDistance.uiUnit()))
+
+        for axis, value in zip("xyz", orient):
+            modifier.newPlugValueMAngle(
+                fnNode.findPlug("jo" + axis),
+                OpenMaya.MAngle(value, OpenMaya.MAngle.kDegrees))
+
+        modifier.newPlugValueDouble(fnNode.findPlug("radius"), radius)
+
+        side, labelType, otherType = _labelValues(label)
+        modifier.newPlugValueInt(fnNode.findPlug("side"), side)
+        modifier.newPlugValueInt(fnNode.findPlug("type"), labelType)
+        modifier.newPlugValueBool(fnNode.findPlug("drawLabel"), bool(label[2]))
+        if otherType:
+            modifier.newPlugValueString(fnNode.findPlug("otherType"), otherType)
+
+        # Same scale compensation the joint command connects
+        parentObj = nodes.get(parentName)
+        if parentObj is None:
+            parentObj = OpenMaya.MFnDagNode(nodes[name]).parent(0)
+
+        if parentObj.hasFn(OpenMaya.MFn.kJoint):
+            modifier.connect(OpenMaya.MFnDependencyNode(parentObj).findPlug("scale"),
+                             fnNode.findPlug("inverseScale"))
+
+    # The lock and keyable states have no modifier operation, the modifier
+    # runs them as commands after the values and undoes them with the rest
+    for name, _, _, _, _, _, _, kind in rows:
+        dagPath = OpenMaya.MDagPath()
+        OpenMaya.MDagPath.getAPathTo(nodes[name], dagPath)
+        path = dagPath.fullPathName()
+
+        for attr in kinds[kind].get("lockHide", ()):
+            modifier.commandToExecute(
+                'setAttr -lock true -keyable false "{0}.{1}"'.format(path, attr))
+
+        for attr in kinds[kind].get("lock", ()):
+            modifier.commandToExecute('setAttr -lock true "{0}.{1}"'.format(path, attr))
+
+    api_undo.doIt(modifier)
+
+    guides = {}
+    for name, _, _, _, _, _, _, _ in rows:
+        guides[name] = Base_Guide.fromMObject(nodes[name])
+
+    return guides
+
+
+def resolve_template(rows):
+    """
+    resolve_template [Function]
+
+    Turns the "world" positions of a template into positions relative to
+    the parent guide, reading the parent matrices of the template itself.
+    The result builds the same guides and is the one worth caching.
+
+    Args:
+        rows (list): The template rows, see GUIDE_COLUMNS.
+
+    Returns:
+        list: The rows with every position relative to its parent.
+
+    Example:
+        rows = resolve_template(BIPED_GUIDES)
+        print(rows[0])
+        # Output: ('COG', 'Guide', (0.0, 60.584, 1.065), (0, 0, 0), False, etc...)
+    """
+    matrices = {}
+    resolved = []
+
+    for name, parentName, position, orient, world, label, radius, kind in rows:
+        parentMatrix = matrices.get(parentName, OpenMaya.MMatrix())
+
+        if world:
+            point = OpenMaya.MPoint(*position) * parentMatrix.inverse()
+            position = (round(point.x, 6), round(point.y, 6), round(point.z, 6))
+
+        transform = OpenMaya.MTransformationMatrix()
+        transform.setTranslation(OpenMaya.MVector(*position), OpenMaya.MSpace.kTransform)
+        transform.rotateTo(OpenMaya.MEulerRotation(
+            *[OpenMaya.MAngle(i, OpenMaya.MAngle.kDegrees).asRadians() for i in orient]))
+
+        # Joint local matrix: jointOrient * translate
+        matrices[name] = transform.asMatrix() * parentMatrix
+
+        resolved.append((name, parentName, tuple(position), tuple(orient), False,
+                         tuple(label), radius, kind))
+
+    return resolved
+
+
+def save_template(rows, path):
+    """
+    save_template [Function]
+
+    Writes template rows as json, resolved first so loading it needs no
+    matrix math.
+
+    Args:
+        rows (list): The template rows, see GUIDE_COLUMNS.
+        path (str): The json file to write.
+
+    Example:
+        save_template(BIPED_GUIDES, "C:/rig/biped.guides")
+    """
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    with open(path, "w") as templateFile:
+        json.dump({"version": _TEMPLATE_VERSION,
+                   "columns": GUIDE_COLUMNS,
+                   "guides": resolve_template(rows)}, templateFile)
+
+
+def load_template(path):
+    """
+    load_template [Function]
+
+    Reads the template rows written by save_template.
+
+    Args:
+        path (str): The json file.
+
+    Returns:
+        list: The template rows, see GUIDE_COLUMNS.
+
+    Example:
+        guides = build_guides(load_template("C:/rig/biped.guides"), GUIDE_KINDS)
+    """
+    with open(path) as templateFile:
+        data = json.load(templateFile)
+
+    if data.get("version") != _TEMPLATE_VERSION:
+        raise ValueError(">>> {0} is not a guide template.".format(path))
+
+    return [(name, parent, tuple(position), tuple(orient), world, tuple(label), radius, kind)
+            for name, parent, position, orient, world, label, radius, kind in data["guides"]]
+
+# -----------------------------------------------------------------------------
+
+def _sceneParent(node):
+    """ The MObject of an existing node, a null object for the world. """
+    if node and m.objExists(str(node)):
+        return toMObject(str(node))
+
+    return OpenMaya.MObject.kNullObj
+
+
+def _tagAttribute(longName, niceName):
+    """ A keyable float attribute like the ones Base_Guide adds. """
+    fnAttr = OpenMaya.MFnNumericAttribute()
+    attr = fnAttr.create(longName, longName, OpenMaya.MFnNumericData.kFloat, 0.0)
+    fnAttr.setKeyable(True)
+    fnAttr.setNiceNameOverride(niceName)
+
+    return attr
+
+
+def _labelValues(label):
+    """ (side, type, otherType) plug values of a (side, type, vis) label. """
+    side, labelType = label[0], label[1]
+
+    if not isinstance(side, int):
+        side = JOINT_LABEL_DICT["side"][side.lower()]
+
+    if isinstance(labelType, int):
+        return side, labelType, None
+
+    if labelType.lower() in JOINT_LABEL_DICT["type"]:
+        return side, JOINT_LABEL_DICT["type"][labelType.lower()], None
+
+    return side, 18, labelType
+
+
+def _mirrorName(name, rules):
+    """ The mirrored name of the first matching rule, None if no rule matches. """
+    for prefix, replace in rules:
+        if name.startswith(prefix):
+            return replace + name[len(prefix):]
+
+    return None
+
+
+def _jointChildren(dagPath):
+    """ MDagPaths of the joint children. """
+    children = []
+    for index in range(dagPath.childCount()):
+        child = dagPath.child(index)
+        if child.hasFn(OpenMaya.MFn.kJoint):
+            path = OpenMaya.MDagPath(dagPath)
+            path.push(child)
+            children.append(path)
+
+    return children
+
+
+def _branchPairs(source, copy):
+    """
+    (source MDagPath, copy MObject, copy parent MObject) of every joint of
+    a branch and its duplicate, parents first. The duplicate keeps the
+    child order so both are walked together.
+    """
+    pairs = []
+    stack = [(source, copy, OpenMaya.MFnDagNode(copy).parent(0))]
+
+    while stack:
+        sourcePath, copyObj, parentObj = stack.pop(0)
+        pairs.append((sourcePath, copyObj, parentObj))
+
+        fnCopy = OpenMaya.MFnDagNode(copyObj)
+        copyChildren = [fnCopy.child(i) for i in range(fnCopy.childCount())]
+        copyChildren = [i for i in copyChildren if i.hasFn(OpenMaya.MFn.kJoint)]
+
+        for child, copyChild in zip(_jointChildren(sourcePath), copyChildren):
+            stack.append((child, copyChild, copyObj))
+
+    return pairs
+
+
+def _upVector(direction):
+    """ World vector of a direction like "ydown" or "zup". """
+    values = [0.0, 0.0, 0.0]
+    values["xyz".index(direction[0])] = -1.0 if direction.endswith("down") else 1.0
+
+    return OpenMaya.MVector(*values)
+
+
+def _matrixRow(matrix, row):
+    return OpenMaya.MVector(matrix(row, 0), matrix(row, 1), matrix(row, 2))
+
+
+def _reflect(vector, axis):
+    values = [vector.x, vector.y, vector.z]
+    values[axis] = -values[axis]
+
+    return OpenMaya.MVector(*values)
+
+
+def _worldMatrix(obj):
+    """ World matrix of a dag node, identity for the world. """
+    if not obj.hasFn(OpenMaya.MFn.kDagNode):
+        return OpenMaya.MMatrix()
+
+    dagPath = OpenMaya.MDagPath()
+    OpenMaya.MDagPath.getAPathTo(obj, dagPath)
+
+    return dagPath.inclusiveMatrix()
+
+
+def _axesMatrix(first, second, firstAxis, secondAxis):
+    """ Rotation matrix with the two axes given, the third one is derived. """
+    lastAxis = 3 - firstAxis - secondAxis
+
+    # Right handed: x ^ y = z, y ^ z = x, z ^ x = y
+    if (firstAxis, secondAxis) in ((0, 1), (1, 2), (2, 0)):
+        last = first ^ second
+    else:
+        last = second ^ first
+
+    axes = {firstAxis: first, secondAxis: second, lastAxis: last}
+    values = []
+    for index in range(3):
+        values += [axes[index].x, axes[index].y, axes[index].z, 0.0]
+    values += [0.0, 0.0, 0.0, 1.0]
+
+    matrix = OpenMaya.MMatrix()
+    OpenMaya.MScriptUtil.createMatrixFromList(values, matrix)
+
+    return matrix
+
+
+def _aimRotation(direction, upVector, aim, up):
+    """ World rotation aiming one axis and pointing another to upVector. """
+    if direction.length() < 1e-6:
+        return None
+
+    direction = direction.normal()
+    second = upVector - direction * (upVector * direction)
+    if second.length() < 1e-6:
+        return None  # Aim parallel to the up vector
+
+    return _axesMatrix(direction, second.normal(), aim, up)
+
+
+def _reflectRotation(matrix, flip, aim, up):
+    """ World rotation with the aim and up axes reflected by the plane. """
+    rotation = OpenMaya.MTransformationMatrix(matrix).rotation().asMatrix()
+
+    return _axesMatrix(_reflect(_matrixRow(rotation, aim), flip).normal(),
+                       _reflect(_matrixRow(rotation, up), flip).normal(), aim, up)
+
+
+def _composeMatrix(rotation, position):
+    transform = OpenMaya.MTransformationMatrix(rotation)
+    transform.setTranslation(position, OpenMaya.MSpace.kTransform)
+
+    return transform.asMatrix()
@@ -15,9 +15,14 @@
 
 >> CONTENTS >> 
     + Biped_Guide [Class]
+    + BIPED_GUIDES [List]
+    + GUIDE_KINDS [Dict]
+    + build_biped_guide [Func]
 
 >> NOTES >> 
 	Update 23/08/2023 : Start working on the script
+    Update 18/10/2026 : The guides are a table built in one pass by
+                        build_guides instead of one joint command each.
 
 >> CONTACT >>
     luisf.carranza@outlook.com
@@ -30,9 +35,14 @@
 # LIBRARIES AND MODULES
 # -----------------------------------------------------------------------------
 
+import os
 from maya import cmds as m
 from modules.build import Base_Guide as Guide
 from modules.build import Guide_Main as gMain
+from modules.build.guides.base.guide_base import (build_guides,
+                                                  resolve_template,
+                                                  save_template,
+                                                  load_template)
 
 # -----------------------------------------------------------------------------
 # CLASSES
@@ -47,10 +57,8 @@ class Biped_Guide(Guide):
         #self.setColor("yellow")
         self.a.add(ln="Ground_1", nn="Biped", at="float", k=True)
 
-    def build(self):
-        main_ctl = gMain(m.circle(n="Guide", r=20, nr=[0,1,0])[0])
-        main_ctl.setColor("cyan")
-        cog_build_guide()
+    def build(self, template=None):
+        build_biped_guide(template)
         self.delete()
 
 
@@ -80,566 +88,260 @@ class Hand_Guide(Biped_Guide):
     def __init__(self, node=None):
         super().__init__(node)
 
-    def build(self):
-        hand_build_guide()
+    def build(self, parent=None):
+        return hand_build_guide(parent)
 
 
-# -------------------------------------------------------------------------
-# COG CREATE GUIDE
-def cog_build_guide():
-    cog_guide = Biped_Guide(m.joint(
-                                n = "COG", 
-                                p = [0, 60.584, 1.065],
-                                o = [0, 0, 0]
-                                    ))
-    cog_guide.setLabel("C", "COG", False)
-    
-    spine_build_guide()
+# -----------------------------------------------------------------------------
+# GUIDE TEMPLATE
+# -----------------------------------------------------------------------------
 
-    m.select(cog_guide)
+_SCALE = ("sx", "sy", "sz")
+_BIPED_ATTRS = (("PtmMadre", "Base"), ("Ground_1", "Biped"))
+
+# Tag attributes and locked channels, same as the guide classes above
+GUIDE_KINDS = {
+    "biped": {"attrs": _BIPED_ATTRS, "lockHide": _SCALE},
+    "hand": {"attrs": _BIPED_ATTRS, "lockHide": _SCALE},
+    "eye": {"attrs": _BIPED_ATTRS, "lockHide": _SCALE, "lock": ("rx",)},
+    "spine": {"attrs": _BIPED_ATTRS, "lockHide": _SCALE + ("ty", "rx", "rz")},
+    "spine_base": {"attrs": _BIPED_ATTRS, "lockHide": _SCALE + ("tx", "rx", "rz")},
+    "limb": {"attrs": _BIPED_ATTRS + (("Ground_2", "Limb"),), "lockHide": _SCALE},
+}
+
+# (name, parent, position, orient, world, label, radius, kind) see GUIDE_COLUMNS,
+# parents before their children in the order the guides are created.
+BIPED_GUIDES = [
+    # COG
+    ("COG", "Guide", (0, 60.584, 1.065), (0, 0, 0), True,
+        ("C", "COG", False), 1.0, "biped"),
+
+    # SPINE
+    ("spine_01", "COG", (0, 60.584, 1.065), (0, 0, 90), True,
+        ("C", "spine", True), 1.0, "spine_base"),
+    ("spine_02", "spine_01", (6.964, 0, 0), (0, 0, 0), False,
+        ("C", "spine mid", False), 1.0, "spine"),
+    ("chest", "spine_02", (6.964, 0, 0), (0, 0, 0), False,
+        ("C", "Chest", True), 1.0, "spine"),
+
+    # NECK & HEAD
+    ("neck_01", "chest", (0, 83.666, 0.127), (0, -6.231, 0), True,
+        ("C", "neck", True), 1.0, "spine"),
+    ("neck_02", "neck_01", (4.242, 0, 0), (0, 0, 0), False,
+        ("C", "neck mid", False), 1.0, "spine"),
+    ("neck_03", "neck_02", (4.242, 0, 0), (0, 0, 0), False,
+        ("C", "neck end", False), 1.0, "spine"),
+    ("head", "neck_03", (0, 0, 0), (0, 0, 0), False,
+        ("C", "head", True), 1.0, "spine"),
+    ("jaw_00", "head", (1.090, 0, 0.378), (0, 216.241, 0), False,
+        ("C", "Jaw Swing", False), 1.0, "spine"),
+    ("jaw_01", "jaw_00", (2.501, 0, 0), (0, 48.909, 0), False,
+        ("C", "jaw", True), 1.0, "spine"),
+    ("chin", "jaw_01", (5.843, 0, 0), (0, 0, 0), False,
+        ("C", "jaw end", False), 1.0, "spine"),
+    ("headEnd", "head", (13.052, 0, 0), (0, 0, 0), False,
+        ("C", "head end", False), 1.0, "spine"),
+    ("L_eye", "head", (5.049, -2.172, 3.784), (-148.245, -76.850, -31.832), False,
+        ("L", "eye", True), 1.0, "eye"),
+    ("L_eyeEnd", "L_eye", (2.472, 0, 0), (0, 0, 0), False,
+        ("L", "eye end", False), 1.0, "eye"),
+
+    # ARM
+    ("L_clavicle", "chest", (0.956, 82.173, -1.350), (0, 0, -90), True,
+        ("L", "collar", True), 1.0, "limb"),
+    ("L_shoulder", "L_clavicle", (9.566, 0, 0), (0, 0.500, 0), False,
+        ("L", "shoulder", True), 1.0, "limb"),
+    ("L_elbow", "L_shoulder", (13.595, 0, 0), (0, -1, 0), False,
+        ("L", "elbow", True), 1.0, "limb"),
+    ("L_wrist", "L_elbow", (13.518, 0, 0), (0, 0, 0), False,
+        ("L", "wrist", False), 1.0, "limb"),
+
+    # HAND
+    ("L_hand", "L_wrist", (37.634, 82.173, -1.350), (0, 0, 0), True,
+        ("L", "hand", True), 1.0, "hand"),
+    ("L_indexFinger_00", "L_hand", (1.309, 0.075, 0.726), (-0.623, -5.496, 3.016), False,
+        ("L", "index meta", False), 1.0, "hand"),
+    ("L_indexFinger_01", "L_indexFinger_00", (4, 0, 0), (0.337, 7.605, -2.958), False,
+        ("L", "index finger", True), 1.0, "hand"),
+    ("L_indexFinger_02", "L_indexFinger_01", (1.981, 0, 0), (0, 0, 0), False,
+        ("L", "index finger", False), 1.0, "hand"),
+    ("L_indexFinger_03", "L_indexFinger_02", (1.171, 0, 0), (0, 0, 0), False,
+        ("L", "index finger", False), 1.0, "hand"),
+    ("L_indexFinger_04", "L_indexFinger_03", (1.399, 0, 0), (0, 0, 0), False,
+        ("L", "index finger end", False), 1.0, "hand"),
+    ("L_middleFinger_00", "L_hand", (1.267, 0.069, 0.084), (0.048, 2.361, 3.104), False,
+        ("L", "middle meta", False), 1.0, "hand"),
+    ("L_middleFinger_01", "L_middleFinger_00", (4, 0, 0), (0.080, -0.229, -3.101), False,
+        ("L", "middle finger", True), 1.0, "hand"),
+    ("L_middleFinger_02", "L_middleFinger_01", (1.974, 0, 0), (0, 0, 0), False,
+        ("L", "middle finger", False), 1.0, "hand"),
+    ("L_middleFinger_03", "L_middleFinger_02", (1.476, 0, 0), (0, 0, 0), False,
+        ("L", "middle finger", False), 1.0, "hand"),
+    ("L_middleFinger_04", "L_middleFinger_03", (2, 0, 0), (0, 0, 0), False,
+        ("L", "middle finger end", False), 1.0, "hand"),
+    ("L_ringFinger_00", "L_hand", (1.242, 0.072, -0.599), (0.700, 8.714, 3.089), False,
+        ("L", "ring meta", False), 1.0, "hand"),
+    ("L_ringFinger_01", "L_ringFinger_00", (4, 0.039, -0.189), (-0.233, -6.259, -3.028), False,
+        ("L", "ring finger", True), 1.0, "hand"),
+    ("L_ringFinger_02", "L_ringFinger_01", (1.939, 0, 0), (0, 0, 0), False,
+        ("L", "ring finger", False), 1.0, "hand"),
+    ("L_ringFinger_03", "L_ringFinger_02", (1.397, 0, 0), (0, 0, 0), False,
+        ("L", "ring finger", False), 1.0, "hand"),
+    ("L_ringFinger_04", "L_ringFinger_03", (1.425, 0, 0), (0, 0, 0), False,
+        ("L", "ring finger end", False), 1.0, "hand"),
+    ("L_pinkyFinger_00", "L_hand", (1.125, 0.086, -1.244), (1.433, 15.996, 3.235), False,
+        ("L", "pinky meta", False), 1.0, "hand"),
+    ("L_pinkyFinger_01", "L_pinkyFinger_00", (3.673, 0, 0), (-0.556, -14.015, -2.975), False,
+        ("L", "pinky finger", True), 1.0, "hand"),
+    ("L_pinkyFinger_02", "L_pinkyFinger_01", (1.476, 0, 0), (0, 0, 0), False,
+        ("L", "pinky finger", False), 1.0, "hand"),
+    ("L_pinkyFinger_03", "L_pinkyFinger_02", (0.905, 0, 0), (0, 0, 0), False,
+        ("L", "pinky finger", False), 1.0, "hand"),
+    ("L_pinkyFinger_04", "L_pinkyFinger_03", (1.293, 0, 0), (0, 0, 0), False,
+        ("L", "pinky finger end", False), 1.0, "hand"),
+    ("L_thumbFinger_00", "L_hand", (1.466, -0.811, 1.164), (45.544, -32.643, -22.500), False,
+        ("L", "thumb meta", False), 1.0, "hand"),
+    ("L_thumbFinger_01", "L_thumbFinger_00", (2.276, 0, 0), (0, 0, -1.957), False,
+        ("L", "thumb", True), 1.0, "hand"),
+    ("L_thumbFinger_02", "L_thumbFinger_01", (1.551, 0, 0), (0, 0, -2.389), False,
+        ("L", "thumb", False), 1.0, "hand"),
+    ("L_thumbFinger_03", "L_thumbFinger_02", (1.730, 0, 0), (0, 0, 0), False,
+        ("L", "thumb end", False), 1.0, "hand"),
+
+    # HIP & LEG
+    ("hip", "COG", (0, 0, 0), (0, 0, -90), False,
+        ("C", "hip swing", False), 1.0, "spine_base"),
+    ("hipEnd", "hip", (5.919, 0, 0), (0, 0, 0), False,
+        ("C", "hip", True), 1.0, "spine"),
+    ("L_leg", "hipEnd", (0, 5.354, 0), (0, 0, 0), False,
+        ("L", "hip", True), 1.0, "limb"),
+    ("L_knee", "L_leg", (23.519, 0, 0), (0, 8.074, 0), False,
+        ("L", "knee", True), 1.0, "limb"),
+    ("L_ankle", "L_knee", (26.302, 0, 0), (0, 0, 0), False,
+        ("L", "ankle", False), 1.0, "limb"),
+
+    # FOOT
+    ("L_foot", "L_ankle", (0, 0, 0), (-13.691, -64.119, 11.518), False,
+        ("L", "foot", True), 1.0, "biped"),
+    ("L_toe", "L_foot", (6.533, 0, 0), (0, -18.513, 0), False,
+        ("L", "toe", True), 1.0, "biped"),
+    ("L_toeEnd", "L_toe", (5.904, 0, 0), (0, 0, 0), False,
+        ("L", "toeEnd", False), 1.0, "limb"),
+    ("L_heel", "L_foot", (0, 0, -6.064), (3.929, -33.150, -7.159), False,
+        ("L", "heel", True), 1.0, "biped"),
+    ("L_foot_in", "L_toe", (0.025, -2.495, -1.558), (1.310, -14.786, -5.124), False,
+        ("L", "Bank In", True), 1.0, "biped"),
+    ("L_bigToe", "L_foot_in", (5.302, 0, 0), (0, 0, 0), False,
+        ("L", "big toe", True), 1.0, "biped"),
+    ("L_foot_out", "L_toe", (0.028, 2.832, -1.558), (-2.377, -14.656, 9.316), False,
+        ("L", "Bank Out", True), 1.0, "biped"),
+    ("L_pinkyToe", "L_foot_out", (3.241, 0, 0), (0, 0, 0), False,
+        ("L", "pinky toe", True), 1.0, "biped"),
+]
 
-    hip_build_guide()
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
 
-    m.select(cl=True)
+def build_biped_guide(template=None):
+    """
+    build_biped_guide [Function]
 
-# -------------------------------------------------------------------------
-# SPINE CREATE GUIDE
-
-def spine_build_guide():
-    spine1_guide = Spine_Guide(m.joint(
-                                n = "spine_01", 
-                                p = [0, 60.584, 1.065],
-                                o = [0, 0, 90]
-                                    ))
-    spine1_guide.setLabel("C", "spine", True)
-    spine1_guide.base_spine()
-
-    spine2_guide = Spine_Guide(m.joint(
-                                n = "spine_02",
-                                r = True, 
-                                p = [6.964, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    spine2_guide.setLabel("C", "spine mid", False)
-   
-    chest_guide = Spine_Guide(m.joint(
-                                n = "chest", 
-                                r = True,
-                                p = [6.964, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    chest_guide.setLabel("C", "Chest", True)
-
-    neck_build_guide()
-
-    m.select(chest_guide)
-    arm_build_guide()
-
-    m.select(cl=True)
+    Creates the main guide control and every biped guide under it, one
+    undo removes them all.
 
-# -------------------------------------------------------------------------
-# NECK & HEAD CREATE GUIDES
-
-def neck_build_guide():
-    neck1_guide = Spine_Guide(m.joint(
-                                n = "neck_01", 
-                                p = [0, 83.666, 0.127],
-                                o = [0, -6.231, 0]
-                                    ))
-    neck1_guide.setLabel("C", "neck", True)
-    
-    neck2_guide = Spine_Guide(m.joint(
-                                n = "neck_02",
-                                r = True, 
-                                p = [4.242, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    neck2_guide.setLabel("C", "neck mid", False)
-
-    neck3_guide = Spine_Guide(m.joint(
-                                n = "neck_03",
-                                r = True, 
-                                p = [4.242, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    neck3_guide.setLabel("C", "neck end", False)
+    Args:
+        template (str): Optional json cache of the resolved table, it is
+                        written the first time and read from then on.
 
-    
-    head_guide = Spine_Guide(m.joint(
-                                n = "head",
-                                r = True, 
-                                p = [0, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    head_guide.setLabel("C", "head", True)
-
-    # ------- JAW -------
-
-    jaw0_guide = Spine_Guide(m.joint(
-                                n = "jaw_00",
-                                r = True, 
-                                p = [1.090, 0, 0.378],
-                                o = [0, 216.241, 0]
-                                    ))
-    jaw0_guide.setLabel("C", "Jaw Swing", False)
-    
-    jaw1_guide = Spine_Guide(m.joint(
-                                n = "jaw_01",
-                                r = True, 
-                                p = [2.501, 0, 0],
-                                o = [0, 48.909, 0]
-                                    ))
-    jaw1_guide.setLabel("C", "jaw", True)
-    
-    chin_guide = Spine_Guide(m.joint(
-                                n = "chin",
-                                r = True, 
-                                p = [5.843, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    chin_guide.setLabel("C", "jaw end", False)
+    Returns:
+        dict: {name: Base_Guide} the new guides.
 
-    
-    # -------------------------------------------------------------------------
-    m.select(head_guide) # HEAD END
-    # -------------------------------------------------------------------------
-
-    headEnd_guide = Spine_Guide(m.joint(
-                                n = "headEnd",
-                                r = True, 
-                                p = [13.052, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    headEnd_guide.setLabel("C", "head end", False)
-
-    # -------------------------------------------------------------------------
-    m.select(head_guide) # EYES
-    # -------------------------------------------------------------------------
-
-    eye_guide = Biped_Guide(m.joint(
-                                n = "L_eye",
-                                r = True, 
-                                p = [5.049, -2.172, 3.784],
-                                o = [-148.245, -76.850, -31.832]
-                                    ))
-    eye_guide.setLabel("L", "eye", True)
-    eye_guide.a.rx.lock()
-
-    eyeEnd_guide = Biped_Guide(m.joint(
-                                n = "L_eyeEnd",
-                                r = True, 
-                                p = [2.472, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    eyeEnd_guide.setLabel("L", "eye end", False)
-    eyeEnd_guide.a.rx.lock()
-    
-    m.select(cl=True) # Deselect last created object
+    Example:
+        guides = build_biped_guide("C:/rig/biped.guides")
+    """
+    m.undoInfo(openChunk=True, chunkName="build_biped_guide")
+    try:
+        main_ctl = gMain(m.circle(n="Guide", r=20, nr=[0,1,0])[0])
+        main_ctl.setColor("cyan")
 
-# -------------------------------------------------------------------------
-# HIP CREATE GUIDE
-
-def hip_build_guide():
-    hip_guide = Spine_Guide(m.joint(
-                                n = "hip",
-                                r = True, 
-                                p = [0, 0, 0],
-                                o = [0, 0, -90]
-                                    ))
-    hip_guide.setLabel("C", "hip swing", False)
-    hip_guide.base_spine()
-
-    hipEnd_guide = Spine_Guide(m.joint(
-                                n = "hipEnd",
-                                r = True, 
-                                p = [5.919, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    hipEnd_guide.setLabel("C", "hip", True)
-
-    leg_build_guide()
+        guides = cog_build_guide(main_ctl, template)
+        m.select(cl=True)
 
-# -------------------------------------------------------------------------
-# LEG CREATE GUIDE
-
-def leg_build_guide():
-    leg_guide = Limbs_Guide(m.joint(
-                                n = "L_leg", 
-                                r = True,
-                                p = [0, 5.354, 0],
-                                o = [0, 0, 0]
-                                    ))
-    leg_guide.setLabel("L", "hip", True)
-
-    knee_guide = Limbs_Guide(m.joint(
-                                n = "L_knee",
-                                r = True, 
-                                p = [23.519, 0, 0],
-                                o = [0, 8.074, 0]
-                                    ))
-    knee_guide.setLabel("L", "knee", True)
-
-    ankle_guide = Limbs_Guide(m.joint(
-                                n = "L_ankle", 
-                                r = True,
-                                p = [26.302, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    ankle_guide.setLabel("L", "ankle", False)
-
-    foot_build_guide()
-    m.select(cl=True) # Deselect last created object
+    finally:
+        m.undoInfo(closeChunk=True)
 
-# -------------------------------------------------------------------------
-# FOOT CREATE GUIDE
-
-def foot_build_guide():
-    foot_guide = Biped_Guide(m.joint(
-                                n = "L_foot",
-                                r = True, 
-                                p = [0, 0, 0],
-                                o = [-13.691, -64.119, 11.518]
-                                    ))
-    foot_guide.setLabel("L", "foot", True)
-
-    toe_guide = Biped_Guide(m.joint(
-                                n = "L_toe",
-                                r = True, 
-                                p = [6.533, 0, 0],
-                                o = [0, -18.513, 0]
-                                    ))
-    toe_guide.setLabel("L", "toe", True)
-
-    toeEnd_guide = Limbs_Guide(m.joint(
-                                n = "L_toeEnd", 
-                                r = True,
-                                p = [5.904, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    toeEnd_guide.setLabel("L", "toeEnd", False)
-
-    # -------------------------------------------------------------------------
-    # HEEL
-    m.select(foot_guide)
-
-    heel_guide = Biped_Guide(m.joint(
-                                n = "L_heel",
-                                r = True, 
-                                p = [0, 0, -6.064],
-                                o = [3.929, -33.150, -7.159]
-                                    ))
-    heel_guide.setLabel("L", "heel", True)
-
-    # -------------------------------------------------------------------------
-    # FOOT IN
-    m.select(toe_guide)
-
-    foot_in_guide = Biped_Guide(m.joint(
-                                n = "L_foot_in",
-                                r = True, 
-                                p = [0.025, -2.495, -1.558],
-                                o = [1.310, -14.786, -5.124]
-                                    ))
-    foot_in_guide.setLabel("L", "Bank In", True)
-
-    toe_in_guide = Biped_Guide(m.joint(
-                                n = "L_bigToe",
-                                r = True, 
-                                p = [5.302, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    toe_in_guide.setLabel("L", "big toe", True)
-
-    # -------------------------------------------------------------------------
-    # FOOT OUT
-    m.select(toe_guide)
-
-    foot_out_guide = Biped_Guide(m.joint(
-                                n = "L_foot_out",
-                                r = True, 
-                                p = [0.028, 2.832, -1.558],
-                                o = [-2.377, -14.656, 9.316]
-                                    ))
-    foot_out_guide.setLabel("L", "Bank Out", True)
-
-    toe_out_guide = Biped_Guide(m.joint(
-                                n = "L_pinkyToe",
-                                r = True, 
-                                p = [3.241, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    toe_out_guide.setLabel("L", "pinky toe", True)
-
-    m.select(cl=True) # Deselect last created object
+    return guides
 
 
-# -------------------------------------------------------------------------
-# ARM CREATE GUIDE
-
-def arm_build_guide():
-    clavicle_guide = Limbs_Guide(m.joint(
-                                n = "L_clavicle", 
-                                p = [0.956, 82.173, -1.350],
-                                o = [0, 0, -90]
-                                    ))
-    clavicle_guide.setLabel("L", "collar", True)
-
-    shoulder_guide = Limbs_Guide(m.joint(
-                                n = "L_shoulder",
-                                r = True, 
-                                p = [9.566, 0, 0],
-                                o = [0, 0.5, 0]
-                                    ))
-    shoulder_guide.setLabel("L", "shoulder", True)
-
-    elbow_guide = Limbs_Guide(m.joint(
-                                n = "L_elbow", 
-                                r = True,
-                                p = [13.595, 0, 0],
-                                o = [0, -1, 0]
-                                    ))
-    elbow_guide.setLabel("L", "elbow", True)
-
-    wrist_guide = Limbs_Guide(m.joint(
-                                n = "L_wrist", 
-                                r = True,
-                                p = [13.518, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    wrist_guide.setLabel("L", "wrist", False)
-
-    hand_build_guide()
-    m.select(cl=True) # Deselect last created object
+def biped_template(template=None):
+    """ The resolved biped rows, from the json cache when there is one. """
+    if template and os.path.exists(template):
+        return load_template(template)
+
+    if template:
+        save_template(BIPED_GUIDES, template)
+
+    return resolve_template(BIPED_GUIDES)
+
+
+def build_biped_branch(root, parent=None, template=None):
+    """
+    build_biped_branch [Function]
 
+    Creates one guide of the biped table and everything under it.
+
+    Args:
+        root (str): The first guide of the branch, example "L_hand".
+        parent (str/Dag_Node): The parent of the branch. Defaults to the
+                               parent in the table if it exists.
+        template (str): Optional json cache, see build_biped_guide.
+
+    Returns:
+        dict: {name: Base_Guide} the new guides.
+
+    Example:
+        guides = build_biped_branch("L_hand", "L_wrist")
+    """
+    rows = biped_template(template)
+    names = set([root])
+    branch = []
+
+    for row in rows:
+        if row[0] in names or row[1] in names:
+            names.add(row[0])
+            branch.append(row)
+
+    if not branch:
+        raise ValueError(">>> {0} is not a biped guide.".format(root))
+
+    return build_guides(branch, GUIDE_KINDS, parent)
 
 # -------------------------------------------------------------------------
-# HAND CREATE GUIDE
-
-def hand_build_guide():
-    hand_guide = Hand_Guide(m.joint(
-                                n = "L_hand", 
-                                p = [37.634, 82.173, -1.350],
-                                o = [0, 0, 0]
-                                    ))
-    hand_guide.setLabel("L", "hand", True)
-
-    # -------------------------------------------------------------------------
-    # INDEX FINGER
-
-    index0_guide = Hand_Guide(m.joint(
-                                n = "L_indexFinger_00",
-                                r = True, 
-                                p = [1.309, 0.075, 0.726],
-                                o = [-0.623, -5.496, 3.016]
-                                    ))
-    index0_guide.setLabel("L", "index meta", False)
-
-    index1_guide = Hand_Guide(m.joint(
-                                n = "L_indexFinger_01",
-                                r = True, 
-                                p = [4, 0, 0],
-                                o = [0.337, 7.605, -2.958]
-                                    ))
-    index1_guide.setLabel("L", "index finger", True)
-
-    index2_guide = Hand_Guide(m.joint(
-                                n = "L_indexFinger_02",
-                                r = True, 
-                                p = [1.981, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    index2_guide.setLabel("L", "index finger", False)
-    
-    index3_guide = Hand_Guide(m.joint(
-                                n = "L_indexFinger_03",
-                                r = True, 
-                                p = [1.171, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    index3_guide.setLabel("L", "index finger", False)
-    
-    index4_guide = Hand_Guide(m.joint(
-                                n = "L_indexFinger_04",
-                                r = True, 
-                                p = [1.399, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    index4_guide.setLabel("L", "index finger end", False)
-    
-    # -------------------------------------------------------------------------
-    m.select(hand_guide)
-    # -------------------------------------------------------------------------
-    # MIDDLE FINGER
-
-    middle0_guide = Hand_Guide(m.joint(
-                                n = "L_middleFinger_00",
-                                r = True, 
-                                p = [1.267, 0.069, 0.084],
-                                o = [0.048, 2.361, 3.104]
-                                    ))
-    middle0_guide.setLabel("L", "middle meta", False)
-
-    middle1_guide = Hand_Guide(m.joint(
-                                n = "L_middleFinger_01",
-                                r = True, 
-                                p = [4, 0, 0],
-                                o = [0.080, -0.229, -3.101]
-                                    ))
-    middle1_guide.setLabel("L", "middle finger", True)
-
-    middle2_guide = Hand_Guide(m.joint(
-                                n = "L_middleFinger_02",
-                                r = True, 
-                                p = [1.974, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    middle2_guide.setLabel("L", "middle finger", False)
-    
-    middle3_guide = Hand_Guide(m.joint(
-                                n = "L_middleFinger_03",
-                                r = True, 
-                                p = [1.476, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    middle3_guide.setLabel("L", "middle finger", False)
-    
-    middle4_guide = Hand_Guide(m.joint(
-                                n = "L_middleFinger_04",
-                                r = True, 
-                                p = [2, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    middle4_guide.setLabel("L", "middle finger end", False)
-    
-    # -------------------------------------------------------------------------
-    m.select(hand_guide)
-    # -------------------------------------------------------------------------
-    # RING FINGER
-
-    ring0_guide = Hand_Guide(m.joint(
-                                n = "L_ringFinger_00",
-                                r = True, 
-                                p = [1.242, 0.072, -0.599],
-                                o = [0.700, 8.714, 3.089]
-                                    ))
-    ring0_guide.setLabel("L", "ring meta", False)
-
-    ring1_guide = Hand_Guide(m.joint(
-                                n = "L_ringFinger_01",
-                                r = True, 
-                                p = [4, 0.039, -0.189],
-                                o = [-0.233, -6.259, -3.028]
-                                    ))
-    ring1_guide.setLabel("L", "ring finger", True)
-
-    ring2_guide = Hand_Guide(m.joint(
-                                n = "L_ringFinger_02",
-                                r = True, 
-                                p = [1.939, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    ring2_guide.setLabel("L", "ring finger", False)
+# BRANCHES
 
-    
-    ring3_guide = Hand_Guide(m.joint(
-                                n = "L_ringFinger_03",
-                                r = True, 
-                                p = [1.397, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    ring3_guide.setLabel("L", "ring finger", False)
-    
-    ring4_guide = Hand_Guide(m.joint(
-                                n = "L_ringFinger_04",
-                                r = True, 
-                                p = [1.425, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    ring4_guide.setLabel("L", "ring finger end", False)
-    
-    # -------------------------------------------------------------------------
-    m.select(hand_guide)
-    # -------------------------------------------------------------------------
-    # PINKY FINGER
-
-    pinky0_guide = Hand_Guide(m.joint(
-                                n = "L_pinkyFinger_00",
-                                r = True, 
-                                p = [1.125, 0.086, -1.244],
-                                o = [1.433, 15.996, 3.235]
-                                    ))
-    pinky0_guide.setLabel("L", "pinky meta", False)
-
-    pinky1_guide = Hand_Guide(m.joint(
-                                n = "L_pinkyFinger_01",
-                                r = True, 
-                                p = [3.673, 0, 0],
-                                o = [-0.556, -14.015, -2.975]
-                                    ))
-    pinky1_guide.setLabel("L", "pinky finger", True)
-
-    pinky2_guide = Hand_Guide(m.joint(
-                                n = "L_pinkyFinger_02",
-                                r = True, 
-                                p = [1.476, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    pinky2_guide.setLabel("L", "pinky finger", False)
-    
-    pinky3_guide = Hand_Guide(m.joint(
-                                n = "L_pinkyFinger_03",
-                                r = True, 
-                                p = [0.905, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    pinky3_guide.setLabel("L", "pinky finger", False)
-    
-    pinky4_guide = Hand_Guide(m.joint(
-                                n = "L_pinkyFinger_04",
-                                r = True, 
-                                p = [1.293, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    pinky4_guide.setLabel("L", "pinky finger end", False)
-    
-    # -------------------------------------------------------------------------
-    m.select(hand_guide)
-    # -------------------------------------------------------------------------
-    # THUMB FINGER
-
-    thumb0_guide = Hand_Guide(m.joint(
-                                n = "L_thumbFinger_00",
-                                r = True, 
-                                p = [1.466, -0.811, 1.164],
-                                o = [45.544, -32.643, -22.500]
-                                    ))
-    thumb0_guide.setLabel("L", "thumb meta", False)
-
-    thumb1_guide = Hand_Guide(m.joint(
-                                n = "L_thumbFinger_01",
-                                r = True, 
-                                p = [2.276, 0, 0],
-                                o = [0, 0, -1.957]
-                                    ))
-    thumb1_guide.setLabel("L", "thumb", True)
-
-    thumb2_guide = Hand_Guide(m.joint(
-                                n = "L_thumbFinger_02",
-                                r = True, 
-                                p = [1.551, 0, 0],
-                                o = [0, 0, -2.389]
-                                    ))
-    thumb2_guide.setLabel("L", "thumb", False)
-    
-    thumb3_guide = Hand_Guide(m.joint(
-                                n = "L_thumbFinger_03",
-                                r = True, 
-                                p = [1.730, 0, 0],
-                                o = [0, 0, 0]
-                                    ))
-    thumb3_guide.setLabel("L", "thumb end", False)
-    
+def cog_build_guide(parent=None, template=None):
+    return build_biped_branch("COG", parent, template)
+
+def spine_build_guide(parent=None):
+    return build_biped_branch("spine_01", parent)
+
+def neck_build_guide(parent=None):
+    return build_biped_branch("neck_01", parent)
+
+def hip_build_guide(parent=None):
+    return build_biped_branch("hip", parent)
+
+def leg_build_guide(parent=None):
+    return build_biped_branch("L_leg", parent)
+
+def foot_build_guide(parent=None):
+    return build_biped_branch("L_foot", parent)
+
+def arm_build_guide(parent=None):
+    return build_biped_branch("L_clavicle", parent)
 
-    m.select(cl=True) # Deselect last created object
+def hand_build_guide(parent=None):
+    return build_biped_branch("L_hand", parent)
 
-# :3
\ No newline at end of file
+# :3
@@ -0,0 +1,413 @@
+'''
+/*****************************************************************************/
+                              Guide Registry v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Keeps the guides of the scene, the joints tagged with the "PtmMadre"
+    attribute of Base_Guide, indexed by side, label and role. Node added
+    and removed callbacks keep it updated so the guide tools don't walk
+    the guide hierarchy on every click.
+
+>> HOW TO USE >>
+	Use the shared registry of the guide tools:
+
+        guides = registry()
+        print(guides.joints())
+        print(guides.find(side="L", role="limb"))
+
+    A registry made with track=False is a snapshot, call "rebuild" to
+    read the scene again.
+
+>> CONTENTS >>
+    + Guide_Registry [Class]
+    + registry [Func]
+    + register_guide [Func]
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+from maya import cmds as m
+from maya import OpenMaya
+from modules.base import Joint, Dag_Node as Dag
+from modules.common.names import JOINT_LABEL_DICT
+from modules.utils.open_maya_api import nodeKey, toMObject
+
+GUIDE_TAG = "PtmMadre"
+GUIDE_MAIN = "Guide"
+
+# Role of a guide from its tag attributes, the first one found wins
+_ROLES = (("Ground_2", "limb"), ("Ground_1", "biped"), (GUIDE_TAG, "base"))
+
+# Attributes that change the side, label or role index of a guide
+_INDEXED_ATTRS = ("side", "type", "otherType") + tuple(i[0] for i in _ROLES)
+
+# A reload runs this file again in the same module, the registry of the
+# previous run is untracked so its callbacks don't call stale methods
+for _previous in globals().get("_REGISTRY", ()):
+    _previous.untrack()
+
+_REGISTRY = []
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+class Guide_Registry(object):
+    """
+    Guide_Registry [Class]
+
+    The tagged guide joints found once with MItDependencyNodes, node
+    callbacks add and remove them from then on.
+
+    Args:
+        track (bool): Keep the registry updated with node callbacks.
+                      Defaults to True.
+
+    Example:
+        guides = Guide_Registry()
+        print(guides.find(side="L", label="hand"))
+        # Output: [Joint('L_hand')]
+    """
+    # -------------------------------------------------------------------------
+    # SPECIAL/MAGIC/DUNDER METHODS
+
+    def __init__(self, track=True):
+        self._guides = {}     # {nodeKey: MObjectHandle}
+        self._pending = {}    # {nodeKey: MObjectHandle} added, not read yet
+        self._nodeCallbacks = {}  # {nodeKey: attribute changed callback id}
+        self._index = None    # {(key, value): [nodeKey, ...]}
+        self._order = None    # [nodeKey, ...] same order as listRelatives
+        self._main = None
+        self._callbacks = []
+        self.dirty = True
+
+        self.rebuild()
+
+        if track:
+            self.track()
+
+    def __len__(self):
+        self._update()
+        return len(self._guides)
+
+    def __contains__(self, node):
+        self._update()
+        return nodeKey(_toMObject(node)) in self._guides
+
+    # -------------------------------------------------------------------------
+    # METHODS
+
+    def rebuild(self):
+        """
+        Reads every tagged joint of the scene again.
+
+        Example:
+            registry().rebuild()
+        """
+        self._removeNodeCallbacks()
+        self._guides.clear()
+        self._pending.clear()
+
+        iterator = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kJoint)
+        while not iterator.isDone():
+            self._addGuide(iterator.thisNode())
+            iterator.next()
+
+        self._main = None
+        self._index = None
+        self._order = None
+        self.dirty = False
+
+    def track(self):
+        """
+        Updates the registry when joints are added, removed or parented,
+        a new or opened scene marks it dirty to rebuild it on next use.
+
+        Example:
+            guides.track()
+        """
+        if self._callbacks:
+            return
+
+        self._callbacks.append(OpenMaya.MDGMessage.addNodeAddedCallback(
+            self._nodeAdded, "joint"))
+        self._callbacks.append(OpenMaya.MDGMessage.addNodeRemovedCallback(
+            self._nodeRemoved, "joint"))
+        self._callbacks.append(OpenMaya.MDagMessage.addParentAddedCallback(
+            self._parentChanged))
+
+        for message in (OpenMaya.MSceneMessage.kBeforeNew,
+                        OpenMaya.MSceneMessage.kBeforeOpen):
+            self._callbacks.append(OpenMaya.MSceneMessage.addCallback(
+                message, self._sceneChanged))
+
+        for handle in self._guides.values():
+            self._addNodeCallback(handle)
+
+    def untrack(self):
+        """
+        Removes the callbacks added by "track".
+
+        Example:
+            guides.untrack()
+        """
+        for callbackId in self._callbacks:
+            OpenMaya.MMessage.removeCallback(callbackId)
+
+        self._callbacks = []
+        self._removeNodeCallbacks()
+
+    def add(self, node):
+        """
+        Adds a joint tagged after it was created, the node added callback
+        only sees it before the tag exists.
+
+        Args:
+            node (str/Joint): The tagged joint.
+        """
+        self._update()
+        self._addGuide(_toMObject(node))
+
+    def main(self):
+        """
+        The main guide control.
+
+        Returns:
+            Dag_Node: The "Guide" curve or None if there's none.
+        """
+        if self._main is None or not self._main.isValid():
+            nodes = m.ls(GUIDE_MAIN, type="transform")
+            if not nodes:
+                return None
+
+            self._main = OpenMaya.MObjectHandle(_toMObject(nodes[0]))
+            self._order = None
+
+        return Dag.fromMObject(self._main.object())
+
+    def joints(self):
+        """
+        The guides under the main guide control.
+
+        Returns:
+            list: [Joint, ...] in the same order as listRelatives(ad=True).
+
+        Example:
+            print(registry().joints())
+            # Output: [Joint('L_pinkyToe'), Joint('L_foot_out'), etc...]
+        """
+        self._update()
+
+        if self._order is None:
+            self._order = []
+            main = self.main()
+
+            if main is not None:
+                iterator = OpenMaya.MItDag(OpenMaya.MItDag.kDepthFirst,
+                                           OpenMaya.MFn.kJoint)
+                iterator.reset(main.dag, OpenMaya.MItDag.kDepthFirst,
+                               OpenMaya.MFn.kJoint)
+
+                while not iterator.isDone():
+                    key = nodeKey(iterator.currentItem())
+                    if key in self._guides:
+                        self._order.append(key)
+                    iterator.next()
+
+                self._order.reverse()
+
+        return [Joint.fromMObject(self._guides[i].object()) for i in self._order]
+
+    def find(self, side=None, label=None, role=None):
+        """
+        The guides matching every filter given.
+
+        Args:
+            side (str/int): Label side, example "L", "left" or 1.
+            label (str/int): Label type, example "hand" or a custom type.
+            role (str): "limb", "biped" or "base" from the tag attributes.
+
+        Returns:
+            list: [Joint, ...] in the same order as "joints".
+
+        Example:
+            print(registry().find(side="L", role="limb"))
+            # Output: [Joint('L_ankle'), Joint('L_knee'), etc...]
+        """
+        self._update()
+
+        if self._index is None:
+            self._index = {}
+            for key, handle in self._guides.items():
+                for item in _indexKeys(handle.object()):
+                    self._index.setdefault(item, set()).add(key)
+
+        found = None
+        for item in (("side", _sideKey(side)) if side is not None else None,
+                     ("label", _labelKey(label)) if label is not None else None,
+                     ("role", role) if role is not None else None):
+            if item is not None:
+                keys = self._index.get(item, set())
+                found = keys if found is None else found & keys
+
+        if found is None:
+            return self.joints()
+
+        return [i for i in self.joints() if nodeKey(i.dep.object()) in found]
+
+    # -------------------------------------------------------------------------
+
+    def _update(self):
+        """ Rebuilds a dirty registry and reads the joints added since. """
+        if self.dirty:
+            self.rebuild()
+
+        # The tag is added after the node, so new joints are read here
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            for handle in pending.values():
+                if handle.isValid():
+                    self._addGuide(handle.object())
+
+    def _addGuide(self, obj):
+        fnNode = OpenMaya.MFnDependencyNode(obj)
+        if not fnNode.hasAttribute(GUIDE_TAG):
+            return
+
+        handle = OpenMaya.MObjectHandle(obj)
+        self._guides[nodeKey(obj)] = handle
+
+        if self._callbacks:
+            self._addNodeCallback(handle)
+
+        self._index = None
+        self._order = None
+
+    def _addNodeCallback(self, handle):
+        key = nodeKey(handle.object())
+        if key not in self._nodeCallbacks:
+            self._nodeCallbacks[key] = OpenMaya.MNodeMessage.addAttributeChangedCallback(
+                handle.object(), self._attributeChanged)
+
+    def _removeNodeCallbacks(self):
+        for callbackId in self._nodeCallbacks.values():
+            OpenMaya.MMessage.removeCallback(callbackId)
+
+        self._nodeCallbacks = {}
+
+    def _nodeAdded(self, obj, *args):
+        self._pending[nodeKey(obj)] = OpenMaya.MObjectHandle(obj)
+
+    def _nodeRemoved(self, obj, *args):
+        key = nodeKey(obj)
+        self._pending.pop(key, None)
+
+        if self._guides.pop(key, None) is not None:
+            callbackId = self._nodeCallbacks.pop(key, None)
+            if callbackId is not None:
+                OpenMaya.MMessage.removeCallback(callbackId)
+
+            self._index = None
+            self._order = None
+
+    def _parentChanged(self, child, *args):
+        if nodeKey(child.node()) in self._guides:
+            self._order = None
+
+    def _attributeChanged(self, message, plug, *args):
+        if message & (OpenMaya.MNodeMessage.kAttributeSet |
+                      OpenMaya.MNodeMessage.kAttributeAdded |
+                      OpenMaya.MNodeMessage.kAttributeRemoved):
+            if plug.partialName(False, False, False, False, False, True) in _INDEXED_ATTRS:
+                self._index = None
+
+    def _sceneChanged(self, *args):
+        self.dirty = True
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def registry():
+    """
+    registry [Function]
+
+    The registry shared by the guide tools, created and tracked on the
+    first call.
+
+    Returns:
+        Guide_Registry: The shared registry.
+
+    Example:
+        print(registry().find(side="L"))
+    """
+    if not _REGISTRY:
+        _REGISTRY.append(Guide_Registry(track=True))
+
+    return _REGISTRY[0]
+
+
+def register_guide(node):
+    """
+    register_guide [Function]
+
+    Tells the shared registry about a joint tagged after its creation,
+    nothing to do while no registry exists yet.
+
+    Args:
+        node (str/Joint): The tagged joint.
+    """
+    if _REGISTRY:
+        _REGISTRY[0].add(node)
+
+# -----------------------------------------------------------------------------
+
+def _toMObject(node):
+    return node if isinstance(node, OpenMaya.MObject) else toMObject(str(node))
+
+
+def _sideKey(side):
+    if isinstance(side, int):
+        return side
+
+    return JOINT_LABEL_DICT["side"][side.lower()]
+
+
+def _labelKey(label):
+    if isinstance(label, int):
+        return label
+
+    return JOINT_LABEL_DICT["type"].get(label.lower(), label.lower())
+
+
+def _indexKeys(obj):
+    """ The ("side", value), ("label", value), ("role", value) of a guide. """
+    fnNode = OpenMaya.MFnDependencyNode(obj)
+
+    labelType = fnNode.findPlug("type").asInt()
+    if labelType == 18:
+        labelType = fnNode.findPlug("otherType").asString().lower()
+
+    keys = [("side", fnNode.findPlug("side").asInt()), ("label", labelType)]
+
+    for attr, role in _ROLES:
+        if fnNode.hasAttribute(attr):
+            keys.append(("role", role))
+            break
+
+    return keys
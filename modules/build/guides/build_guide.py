@@ -15,6 +15,11 @@
 
 >> NOTES >> 
 	Update 27/08/2023 : Started to work on the script.
+    Update 18/10/2026 : The skeleton is created in one pass from the guide
+                        world matrices.
+    Update 18/10/2026 : A second build only writes the guide branches that
+                        changed, from the hashes kept on the skeleton.
+    Update 18/10/2026 : A build is undone in one step.
 
 >> CONTACT >>
     luisf.carranza@outlook.com
@@ -26,84 +31,393 @@
 # -----------------------------------------------------------------------------
 # LIBRARIES AND MODULES
 # -----------------------------------------------------------------------------
+import hashlib
+import json
+import sys
 from maya import cmds as m
-from maya import mel
+from maya import OpenMaya
 from modules.base import Joint, Curve, Dag_Node as Dag
+from modules.common.functions import getKeyFromValue
+from modules.common.names import JOINT_LABEL_DICT
+from modules.utils import api_undo
+from modules.utils.open_maya_api import nodeKey, toMObject
 from modules.build.guides import (mirror_guide, 
                                   find_guide_main,
                                   find_guide_joints)
 
+GUIDE_SUFFIX = "_guide"
+ROOT_LABELS = ("COG", "Root")
+BUILD_ATTR = "guideBuild"  # json {"hashes": {guide: [own, branch]}, "map": {guide: joint uuid}}
+
 # -----------------------------------------------------------------------------
 # SCRIPT FUNCTIONS
 # -----------------------------------------------------------------------------
 
 def build_guide():
-    mirror_guide()
-    build_guide_structure()
-    pass
+    """
+    Builds the rig from the guides, when the rig was already built only
+    the guide branches that changed since are written again. One undo
+    removes the whole build.
+
+    Returns:
+        dict: {guide name: bind Joint} of the first build and the later ones.
+
+    Example:
+        bind_map = build_guide()
+        print(bind_map["L_hand_guide"])
+        # Output: Joint('L_hand')
+    """
+    m.undoInfo(openChunk=True, chunkName="build_guide")
+    try:
+        mirror_guide()
+
+        joint_grp = find_skeleton()
+        if joint_grp is None:
+            return build_guide_structure()[1]
+
+        bind_map, rebuilt = update_skeleton(joint_grp)
+
+    finally:
+        m.undoInfo(closeChunk=True)
+
+    sys.stdout.write(">>> Rebuilt {0} of {1} guides: {2}\n".format(
+        len(rebuilt), len(bind_map), rebuilt))
+
+    return bind_map
 
 
 def build_guide_structure():
-    guide_main = find_guide_main()
+    """
+    Creates the "Rig", "Skeleton" and "Geometry" groups of a first build,
+    all of it in one undo chunk.
 
-    rig_main = Dag("Rig", "transform")
-    guide_main.parentTo(rig_main)
+    Returns:
+        tuple: ([Dag_Node, Dag_Node, Dag_Node], dict) the groups and the
+               {guide name: bind Joint} map.
+    """
+    m.undoInfo(openChunk=True, chunkName="build_guide_structure")
+    try:
+        guide_main = find_guide_main()
 
-    joint_grp = generate_skeleton()
-    joint_grp.parentTo(rig_main)
+        rig_main = Dag("Rig", "transform")
+        guide_main.parentTo(rig_main)
+
+        joint_grp, bind_map = generate_skeleton()
+        joint_grp.parentTo(rig_main)
+
+        geo_grp = Dag("Geometry", "transform")
+        geo_grp.parentTo(rig_main)
+
+        guide_main.hide()
+
+    finally:
+        m.undoInfo(closeChunk=True)
 
-    geo_grp = Dag("Geometry", "transform")
-    geo_grp.parentTo(rig_main)
-    
-    guide_main.hide()
-    
     grps = [rig_main, joint_grp, geo_grp]
-    return grps
+    return grps, bind_map
 
 
 def generate_skeleton():
+    """
+    Creates the bind skeleton from the guides in one MDagModifier. The
+    guide hierarchy and world matrices are read once and every joint is
+    created under its parent with the world rotation in its joint orient,
+    no constraint and no re-parenting. The modifier runs as one undoable
+    command.
 
-    joint_grp = Dag("Skeleton", "transform")
-    
-    guide_joints = find_guide_joints()[::-1]
-    bind_joints = []
+    The content hash of every guide branch and the guide to joint map are
+    kept on the "Skeleton" group for update_skeleton.
+
+    Returns:
+        tuple: (Dag_Node, dict) the "Skeleton" group and the
+               {guide name: bind Joint} map in creation order.
+
+    Example:
+        joint_grp, bind_map = generate_skeleton()
+        print(bind_map["L_hand_guide"])
+        # Output: Joint('L_hand')
+    """
+    modifier = OpenMaya.MDagModifier()
+
+    skeleton = modifier.createNode("transform")
+    modifier.renameNode(skeleton, "Skeleton")
+
+    bind_map, hashes, _ = _skeletonPass(modifier, skeleton)
+    api_undo.doIt(modifier)
+
+    joint_grp = Dag.fromMObject(skeleton)
+    bind_map = _bindJoints(bind_map)
+    _saveState(joint_grp, hashes, bind_map)
+
+    return joint_grp, bind_map
+
+
+def update_skeleton(joint_grp):
+    """
+    Writes again only the guide branches whose content hash changed since
+    the last build. New guides get a joint, the joints of deleted guides
+    are deleted and a guide that changed is written on its existing joint,
+    so the other joints and their skinning are never touched. One undo
+    removes the update.
+
+    Args:
+        joint_grp (str/Dag_Node): The "Skeleton" group of a previous build.
+
+    Returns:
+        tuple: (dict, list) the {guide name: bind Joint} map and the names
+               of the guides written again.
+
+    Example:
+        bind_map, rebuilt = update_skeleton("Skeleton")
+        print(rebuilt)
+        # Output: ['L_hand', 'L_indexFinger_00', etc...]
+    """
+    joint_grp = Dag(joint_grp)
+    state = json.loads(m.getAttr(joint_grp.fullPath + "." + BUILD_ATTR) or "{}")
+
+    m.undoInfo(openChunk=True, chunkName="update_skeleton")
+    try:
+        modifier = OpenMaya.MDagModifier()
+        bind_map, hashes, rebuilt = _skeletonPass(modifier, joint_grp.dep.object(), state)
+        api_undo.doIt(modifier)
+
+        bind_map = _bindJoints(bind_map)
+        _saveState(joint_grp, hashes, bind_map)
+
+    finally:
+        m.undoInfo(closeChunk=True)
+
+    return bind_map, rebuilt
+
+
+def find_skeleton():
+    """ The "Skeleton" group of a previous build or None. """
+    nodes = m.ls("Skeleton", type="transform")
+    if nodes and m.attributeQuery(BUILD_ATTR, node=nodes[0], exists=True):
+        return Dag(nodes[0])
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+def _skeletonPass(modifier, skeleton, state=None):
+    """
+    Queues the joints of every dirty guide on the modifier.
+
+    Returns:
+        tuple: ({guide name: bind MObject}, {guide name: hashes}, [rebuilt names])
+    """
+    state = state or {}
+    old_hashes, old_map = state.get("hashes", {}), state.get("map", {})
+
+    guide_joints = find_guide_joints()[::-1]  # Parents first
+    hashes = _guideHashes(guide_joints)
+
+    matrices = {}  # {guide name: world matrix without scale}
+    bind_joints = {}  # {guide name: bind MObject}
+    bind_map = {}
+    clean = set()
+    rebuilt = []
 
     for jnt in guide_joints:
-        # SETTING NEW JOINT 
-        new_joint = Joint(m.joint(n=jnt.name, o = jnt.jointOrient))
-        new_joint.setLabel(jnt.labelSide, jnt.labelType, False) # Setting Labels
-        #new_joint.a.segmentScaleCompensate.set(0)
+        guide = jnt.dag
 
         # AVOIDING NAME COLLISIONS
-        guide_suffix = "_guide"
-        jnt.rename(jnt.name + guide_suffix) # Avoid same names
-        if new_joint.parent != joint_grp:
-            new_joint.parentTo(joint_grp)
-
-        new_joint.moveTo(jnt)
-        bind_joints.append(new_joint)
-
-    bind_joints = [Joint(i) for i in bind_joints]
-
-    # Recreating hierarchy
-    for nJnt, gJnt in zip(bind_joints,guide_joints):
-        if gJnt.parent:
-            parent = str(gJnt.parent)[:-6]
-            parent = parent.split("|")[-1]
-
-            if parent == "Guide":
-                m.parent(nJnt.name, joint_grp)
-            else:
-                m.parent(nJnt.name, parent)
-
-    for jnt in bind_joints:
-        labels = ["COG", "Root"]
-        for label in labels:
-            if label in jnt.labelType:
-                jnt.parentTo(joint_grp)
-        
-    
-    return joint_grp
+        name = _baseName(jnt.name)
+        if not jnt.name.endswith(GUIDE_SUFFIX):
+            modifier.renameNode(guide.node(), name + GUIDE_SUFFIX)
+
+        parent = OpenMaya.MDagPath(guide)
+        parent.pop()
+        parentName = _baseName(parent.partialPathName().split("|")[-1]) \
+            if parent.length() else None
+
+        # World matrix of every guide, the children of a clean guide can
+        # still need a joint under it
+        world = OpenMaya.MTransformationMatrix(guide.inclusiveMatrix())
+        position = world.getTranslation(OpenMaya.MSpace.kWorld)
+        rotation = world.rotation().asMatrix()
+
+        world = OpenMaya.MTransformationMatrix(rotation)
+        world.setTranslation(position, OpenMaya.MSpace.kTransform)
+        matrices[name] = world.asMatrix()
+
+        bind = _existingJoint(old_map.get(name))
+        dirty = list(hashes[name])
+
+        # The whole branch is the same as the last build
+        if bind is not None and (parentName in clean or old_hashes.get(name) == dirty):
+            clean.add(name)
+            bind_joints[name] = bind_map[name] = bind
+            continue
+
+        fnGuide = OpenMaya.MFnDependencyNode(guide.node())
+        labelType = fnGuide.findPlug("type").asInt()
+        otherType = fnGuide.findPlug("otherType").asString()
+
+        # Joints labeled as roots always start a new chain
+        if parentName not in bind_joints or _isRoot(fnGuide):
+            parentName = None
+
+        parentObj = bind_joints[parentName] if parentName is not None else skeleton
+        parentMatrix = matrices.get(parentName, OpenMaya.MMatrix())
+
+        # Only guides under it changed, the joint stays as it is
+        if bind is not None and name in old_hashes and old_hashes[name][0] == dirty[0]:
+            bind_joints[name] = bind_map[name] = bind
+            continue
+
+        parentRotation = OpenMaya.MTransformationMatrix(parentMatrix).rotation().asMatrix()
+        translate = OpenMaya.MPoint(position) * parentMatrix.inverse()
+        jointOrient = OpenMaya.MTransformationMatrix(
+            rotation * parentRotation.inverse()).eulerRotation()
+
+        # SETTING NEW JOINT
+        reparented = bind is None
+        if bind is None:
+            bind = modifier.createNode("joint", parentObj)
+            modifier.renameNode(bind, name)
+
+        elif OpenMaya.MFnDagNode(bind).parent(0) != parentObj:
+            modifier.reparentNode(bind, parentObj)
+            reparented = True
+
+        fnBind = OpenMaya.MFnDependencyNode(bind)
+
+        for axis, value in zip("xyz", (translate.x, translate.y, translate.z)):
+            modifier.newPlugValueMDistance(fnBind.findPlug("t" + axis),
+                                           OpenMaya.MDistance(value))
+
+        for axis, value in zip("xyz", (jointOrient.x, jointOrient.y, jointOrient.z)):
+            modifier.newPlugValueMAngle(fnBind.findPlug("jo" + axis),
+                                        OpenMaya.MAngle(value))
+
+        # Setting Labels
+        modifier.newPlugValueInt(fnBind.findPlug("side"), fnGuide.findPlug("side").asInt())
+        modifier.newPlugValueInt(fnBind.findPlug("type"), labelType)
+        modifier.newPlugValueString(fnBind.findPlug("otherType"), otherType)
+        modifier.newPlugValueBool(fnBind.findPlug("drawLabel"), False)
+
+        inverseScale = fnBind.findPlug("inverseScale")
+        if reparented and inverseScale.isConnected():
+            sources = OpenMaya.MPlugArray()
+            inverseScale.connectedTo(sources, True, False)
+            modifier.disconnect(sources[0], inverseScale)
+
+        if reparented and parentName is not None:
+            modifier.connect(OpenMaya.MFnDependencyNode(parentObj).findPlug("scale"),
+                             inverseScale)
+
+        bind_joints[name] = bind_map[name] = bind
+        rebuilt.append(name)
+
+    # Joints of the guides deleted since the last build, the top ones only
+    # as deleting them deletes their children
+    removed = {}
+    for name, joint in old_map.items():
+        bind = None if name in hashes else _existingJoint(joint)
+        if bind is not None:
+            removed[nodeKey(bind)] = bind
+
+    for bind in removed.values():
+        path = OpenMaya.MDagPath()
+        OpenMaya.MDagPath.getAPathTo(bind, path)
+        path.pop()
+
+        while path.length() and nodeKey(path.node()) not in removed:
+            path.pop()
+
+        if not path.length():
+            modifier.deleteNode(bind)
+
+    return bind_map, hashes, rebuilt
+
+
+def _guideHashes(guide_joints):
+    """
+    {guide name: [own hash, branch hash]} the own hash covers the name,
+    parent, local matrix and label of the guide, the branch hash adds the
+    branch hash of every child. The guides labeled as roots are built in
+    world space, so their world matrix is hashed.
+    """
+    own = {}
+    children = {}
+    names = {}
+
+    for jnt in guide_joints:
+        guide = jnt.dag
+        name = _baseName(jnt.name)
+        names[nodeKey(guide.node())] = name
+
+        parent = OpenMaya.MDagPath(guide)
+        parent.pop()
+        parentName = names.get(nodeKey(parent.node())) if parent.length() else None
+
+        fnGuide = OpenMaya.MFnDependencyNode(guide.node())
+
+        matrix = guide.inclusiveMatrix()
+        if parentName is not None and not _isRoot(fnGuide):
+            matrix = matrix * parent.inclusiveMatrixInverse()
+
+        content = [name, parentName,
+                   [round(matrix(row, column), 4) + 0.0 for row in range(4) for column in range(4)],
+                   [fnGuide.findPlug(i).asInt() for i in ("side", "type")],
+                   fnGuide.findPlug("otherType").asString()]
+
+        own[name] = hashlib.md5(json.dumps(content).encode("utf-8")).hexdigest()
+        children.setdefault(parentName, []).append(name)
+
+    hashes = {}
+    for jnt in guide_joints[::-1]:  # Children first
+        name = _baseName(jnt.name)
+        branch = own[name] + "".join(hashes[i][1] for i in children.get(name, []))
+        hashes[name] = [own[name], hashlib.md5(branch.encode("utf-8")).hexdigest()]
+
+    return hashes
+
+
+def _saveState(joint_grp, hashes, bind_map):
+    """ Keeps the hashes and the UUID of every bind joint on the group. """
+    uuids = dict((_baseName(guide), m.ls(jnt.fullPath, uuid=True)[0])
+                 for guide, jnt in bind_map.items())
+    state = {"hashes": hashes, "map": uuids}
+
+    attr = joint_grp.fullPath + "." + BUILD_ATTR
+    if not m.attributeQuery(BUILD_ATTR, node=joint_grp.fullPath, exists=True):
+        m.addAttr(joint_grp.fullPath, ln=BUILD_ATTR, dt="string")
+
+    m.setAttr(attr, json.dumps(state), typ="string")
+
+
+def _existingJoint(uuid):
+    """
+    The MObject of a joint of a previous build, None if it's gone. The
+    UUID survives renames, ls resolves the names of older states too.
+    """
+    nodes = m.ls(uuid, long=True, type="joint") if uuid else []
+    if not nodes:
+        return None
+
+    return toMObject(nodes[0])
+
+
+def _bindJoints(bind_map):
+    """ {guide name: Joint} keyed with the guide names on scene. """
+    return dict((name + GUIDE_SUFFIX, Joint.fromMObject(bind))
+                for name, bind in bind_map.items())
+
+
+def _baseName(name):
+    return name[:-len(GUIDE_SUFFIX)] if name.endswith(GUIDE_SUFFIX) else name
+
+
+def _isRoot(fnGuide):
+    """ True for the guides labeled as roots, they start a new chain. """
+    labelType = fnGuide.findPlug("type").asInt()
+    labelName = fnGuide.findPlug("otherType").asString() if labelType == 18 else \
+        getKeyFromValue(JOINT_LABEL_DICT["type"], labelType)
+
+    return any(i in str(labelName) for i in ROOT_LABELS)
 
 # -----------------------------------------------------------------------------
 # SYSTEMS
@@ -0,0 +1,22 @@
+'''
+/*****************************************************************************/
+                                Tests Build Library
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    This module includes a variety of unit test for the parent library 
+    and sub-libraries.
+
+>> HOW TO USE >>
+	When running "testing.py" it will automatically discover and run the
+    tests allocated in this library.
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+ 
+/*****************************************************************************/
+'''
\ No newline at end of file
@@ -0,0 +1,180 @@
+'''
+/*****************************************************************************/
+                           Test Build Guide v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Tests for our Build Guide Functionality, a second build only writes
+    the guide branches that changed.
+
+>> HOW TO USE >>
+	Simply run the script or run the script called "testing.py"
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import unittest
+from maya import cmds as m
+from modules.build.guides.build_guide import build_guide, update_skeleton, find_skeleton
+
+# (name, parent, world position, custom label)
+_GUIDES = [
+    ("spine", "Guide", (0, 10, 0), ""),
+    ("chest", "spine", (0, 15, 0), ""),
+    ("armA", "chest", (3, 15, 0), ""),
+    ("handA", "armA", (6, 15, 0), ""),
+    ("fingerA", "handA", (7, 15, 0), ""),
+    ("armB", "chest", (-3, 15, 0), ""),
+    ("handB", "armB", (-6, 15, 0), ""),
+    ("cog", "chest", (0, 12, 1), "COG"),
+]
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+class Test_Build_Guide(unittest.TestCase):
+
+    def setUp(self):
+        m.group(n="Guide", em=True)
+
+        for name, parent, position, otherType in _GUIDES:
+            makeGuide(name, parent, position, otherType)
+
+        self.bind_map = build_guide()
+        self.uuids = uuids(self.bind_map)
+
+    def tearDown(self):
+        m.delete([i for i in ("Rig", "Guide") if m.objExists(i)])
+
+    def update(self):
+        return update_skeleton(find_skeleton())
+
+    def assertPosition(self, node, position):
+        for value, expected in zip(m.xform(node, q=True, ws=True, t=True), position):
+            self.assertAlmostEqual(value, expected, places=4, msg=node)
+
+    def test_build_guide_return(self):
+        self.assertIsInstance(self.bind_map, dict)
+        self.assertEqual(sorted(self.bind_map), sorted(i[0] + "_guide" for i in _GUIDES))
+
+        bind_map = build_guide()
+        self.assertIsInstance(bind_map, dict)
+        self.assertEqual(uuids(bind_map), self.uuids)
+
+    def test_build_guide_undo(self):
+        # One undo removes the rig and gives the guides their names back
+        m.undo()
+
+        self.assertFalse(m.objExists("Rig") or m.objExists("Skeleton"))
+        self.assertEqual(m.listRelatives("Guide", p=True), None)
+        self.assertTrue(m.getAttr("Guide.visibility"))
+        self.assertEqual(m.ls("*_guide"), [])
+        self.assertEqual(m.nodeType("handA"), "joint")
+
+    def test_unchanged(self):
+        bind_map, rebuilt = self.update()
+
+        self.assertEqual(rebuilt, [])
+        self.assertEqual(uuids(bind_map), self.uuids)
+
+    def test_moved_hand(self):
+        m.move(0, 2, 0, "handA_guide", r=True)
+
+        bind_map, rebuilt = self.update()
+
+        self.assertEqual(rebuilt, ["handA"])
+        self.assertEqual(uuids(bind_map), self.uuids)
+        self.assertPosition("handA", (6, 17, 0))
+        self.assertPosition("fingerA", (7, 17, 0))
+        self.assertPosition("handB", (-6, 15, 0))
+
+    def test_moved_root_label(self):
+        m.move(0, 1, 0, "chest_guide", r=True)
+
+        _, rebuilt = self.update()
+
+        # The cog joint is in world space under the skeleton
+        self.assertEqual(sorted(rebuilt), ["chest", "cog"])
+        self.assertPosition("cog", (0, 13, 1))
+        self.assertPosition("handA", (6, 16, 0))
+
+    def test_deleted_joint(self):
+        m.delete("fingerA")
+
+        bind_map, rebuilt = self.update()
+
+        # Its parent branch is clean, the new joint is still placed under it
+        self.assertEqual(rebuilt, ["fingerA"])
+        self.assertEqual(bind_map["fingerA_guide"].name, "fingerA")
+        self.assertEqual(m.listRelatives("fingerA", p=True), ["handA"])
+        self.assertPosition("fingerA", (7, 15, 0))
+
+    def test_update_undo(self):
+        m.move(0, 2, 0, "handA_guide", r=True)
+        self.update()
+
+        m.undo()
+        self.assertPosition("handA", (6, 15, 0))
+        self.assertPosition("fingerA", (7, 15, 0))
+
+    def test_deleted_guides(self):
+        m.delete("armB_guide")
+
+        bind_map, rebuilt = self.update()
+
+        self.assertEqual(rebuilt, [])
+        self.assertNotIn("armB_guide", bind_map)
+        self.assertFalse(m.objExists("armB") or m.objExists("handB"))
+        self.assertTrue(m.objExists("armA"))
+
+    def test_renamed_joint(self):
+        m.rename("handB", "handB_renamed")
+
+        bind_map, rebuilt = self.update()
+
+        self.assertEqual(rebuilt, [])
+        self.assertEqual(bind_map["handB_guide"].name, "handB_renamed")
+        self.assertFalse(m.objExists("handB"))
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def makeGuide(name, parent, position, otherType):
+    """ A tagged guide joint at a world position. """
+    jnt = m.createNode("joint", n=name, p=parent)
+    m.xform(jnt, ws=True, t=position)
+    m.addAttr(jnt, ln="PtmMadre", at="float", k=True)
+
+    if otherType:
+        m.setAttr(jnt + ".type", 18)
+        m.setAttr(jnt + ".otherType", otherType, typ="string")
+
+    return jnt
+
+
+def uuids(bind_map):
+    """ {guide name: joint uuid} """
+    return dict((guide, m.ls(jnt.fullPath, uuid=True)[0]) for guide, jnt in bind_map.items())
+
+# -----------------------------------------------------------------------------
+# EXECUTE SCRIPT
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+'''
+/*****************************************************************************/
+                            Test Guide Base v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Tests for our Guide Base Functionality, the mirrored guides are
+    compared against the old mirrorJoint and "joint -oj" result.
+
+>> HOW TO USE >>
+	Simply run the script or run the script called "testing.py"
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import unittest
+from maya import cmds as m
+from modules.build.guides.base.guide_base import mirror_guide
+
+# (name, parent, world position, label type) 0 is no label
+_CHAIN = [
+    ("L_clavicle", "Guide", (2, 50, 1), 9),
+    ("L_shoulder", "L_clavicle", (8, 49, -1), 10),
+    ("L_elbow", "L_shoulder", (20, 40, -2), 11),
+    ("L_hand", "L_elbow", (30, 32, 2), 12),
+    ("L_palm", "L_hand", (33, 30, 3), 0),
+    ("L_finger", "L_palm", (36, 27, 5), 0),
+]
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+class Test_Guide_Base(unittest.TestCase):
+
+    def setUp(self):
+        self.guide = m.group(n="Guide", em=True)
+
+        for name, parent, position, labelType in _CHAIN:
+            makeGuide(name, parent, position, labelType)
+
+        m.joint("L_clavicle", e=True, oj="xzy", sao="ydown", ch=True, zso=True)
+
+    def tearDown(self):
+        m.delete(self.guide)
+
+    def test_mirror_guide(self):
+        expected = legacyMirror("L_clavicle")
+        mirrored = mirror_guide()
+
+        self.assertEqual(sorted(i.name for i in mirrored), sorted(expected))
+
+        for jnt in mirrored:
+            matrix = m.xform(jnt.fullPath, q=True, ws=True, m=True)
+            for value, legacy in zip(matrix, expected[jnt.name]):
+                self.assertAlmostEqual(value, legacy, places=3, msg=jnt.name)
+
+            self.assertEqual(m.getAttr(jnt.fullPath + ".side"), 2)
+
+    def test_mirror_guide_undo(self):
+        m.select("L_hand")
+        mirror_guide()
+
+        self.assertEqual(m.ls(sl=True), ["L_hand"])
+
+        # One undo removes the whole mirrored side
+        m.undo()
+        self.assertEqual(m.ls("R_*"), [])
+        self.assertTrue(m.objExists("L_finger"))
+
+    def test_mirror_guide_ruleless_name(self):
+        makeGuide("thumb", "L_hand", (31, 30, 4), 0)
+
+        names = [i.name for i in mirror_guide()]
+
+        self.assertIn("thumb", names)
+        self.assertEqual(len(m.ls("thumb")), 2)
+
+    def test_mirror_guide_nothing_left(self):
+        mirror_guide()
+        self.assertEqual(mirror_guide(), [])
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def makeGuide(name, parent, position, labelType):
+    """ A tagged guide joint at a world position. """
+    jnt = m.createNode("joint", n=name, p=parent)
+    m.xform(jnt, ws=True, t=position)
+    m.setAttr(jnt + ".side", 1)
+    m.setAttr(jnt + ".type", labelType)
+    m.addAttr(jnt, ln="PtmMadre", at="float", k=True)
+
+    return jnt
+
+
+def legacyMirror(root):
+    """ {name: world matrix} of the mirrorJoint result, deleted afterwards. """
+    mirrored = m.mirrorJoint(root, mirrorYZ=True, sr=["L_", "R_"])
+    mirrored = m.ls(mirrored, long=True)
+
+    for jnt in mirrored:
+        m.setAttr(jnt + ".side", 2)
+
+        labeled = "eye" in jnt or m.getAttr(jnt + ".type")
+        m.joint(jnt, e=True, oj="xzy", sao="ydown" if labeled else "zdown", ch=True, zso=True)
+
+        if not m.listRelatives(jnt, c=True, type="joint") and "heel" not in jnt:
+            m.setAttr(jnt + ".jointOrient", 0, 0, 0)
+
+    matrices = dict((i.split("|")[-1], m.xform(i, q=True, ws=True, m=True))
+                    for i in mirrored)
+    m.delete(mirrored[0])
+
+    return matrices
+
+# -----------------------------------------------------------------------------
+# EXECUTE SCRIPT
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,246 @@
+'''
+/*****************************************************************************/
+                           Test Guide Biped v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Tests for our Biped Guide Functionality, the guide table builds the
+    same guides the old joint commands did.
+
+>> HOW TO USE >>
+	Simply run the script or run the script called "testing.py"
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from maya import cmds as m
+from modules.build.guides.base.guide_base import resolve_template, load_template
+from modules.build.guides.base.guide_biped import (BIPED_GUIDES,
+                                                   biped_template,
+                                                   build_biped_guide,
+                                                   build_biped_branch)
+
+_CHANNELS = ("tx", "ty", "tz", "rx", "ry", "rz", "sx", "sy", "sz")
+_LEGACY = "legacy_"
+
+# Recorded from the joint commands of the old Biped_Guide classes:
+# (name, selected parent, p, o, r, (side, type, otherType, drawLabel),
+#  tag attributes, locked channels, hidden channels)
+_LEGACY_GUIDES = [
+    ('COG', 'Guide', (0, 60.584, 1.065), (0, 0, 0), False, (0, 18, 'COG', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('spine_01', 'COG', (0, 60.584, 1.065), (0, 0, 90), False, (0, 6, '', True), ('PtmMadre', 'Ground_1'), ('rx', 'rz', 'sx', 'sy', 'sz', 'tx'), ('rx', 'rz', 'sx', 'sy', 'sz', 'tx')),
+    ('spine_02', 'spine_01', (6.964, 0, 0), (0, 0, 0), True, (0, 18, 'spine mid', False), ('PtmMadre', 'Ground_1'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty')),
+    ('chest', 'spine_02', (6.964, 0, 0), (0, 0, 0), True, (0, 18, 'Chest', True), ('PtmMadre', 'Ground_1'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty')),
+    ('neck_01', 'chest', (0, 83.666, 0.127), (0, -6.231, 0), False, (0, 7, '', True), ('PtmMadre', 'Ground_1'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty')),
+    ('neck_02', 'neck_01', (4.242, 0, 0), (0, 0, 0), True, (0, 18, 'neck mid', False), ('PtmMadre', 'Ground_1'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty')),
+    ('neck_03', 'neck_02', (4.242, 0, 0), (0, 0, 0), True, (0, 18, 'neck end', False), ('PtmMadre', 'Ground_1'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty')),
+    ('head', 'neck_03', (0, 0, 0), (0, 0, 0), True, (0, 8, '', True), ('PtmMadre', 'Ground_1'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty')),
+    ('jaw_00', 'head', (1.09, 0, 0.378), (0, 216.241, 0), True, (0, 18, 'Jaw Swing', False), ('PtmMadre', 'Ground_1'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty')),
+    ('jaw_01', 'jaw_00', (2.501, 0, 0), (0, 48.909, 0), True, (0, 18, 'jaw', True), ('PtmMadre', 'Ground_1'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty')),
+    ('chin', 'jaw_01', (5.843, 0, 0), (0, 0, 0), True, (0, 18, 'jaw end', False), ('PtmMadre', 'Ground_1'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty')),
+    ('headEnd', 'head', (13.052, 0, 0), (0, 0, 0), True, (0, 18, 'head end', False), ('PtmMadre', 'Ground_1'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty')),
+    ('L_eye', 'head', (5.049, -2.172, 3.784), (-148.245, -76.85, -31.832), True, (1, 18, 'eye', True), ('PtmMadre', 'Ground_1'), ('rx', 'sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_eyeEnd', 'L_eye', (2.472, 0, 0), (0, 0, 0), True, (1, 18, 'eye end', False), ('PtmMadre', 'Ground_1'), ('rx', 'sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_clavicle', 'chest', (0.956, 82.173, -1.35), (0, 0, -90), False, (1, 9, '', True), ('PtmMadre', 'Ground_1', 'Ground_2'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_shoulder', 'L_clavicle', (9.566, 0, 0), (0, 0.5, 0), True, (1, 10, '', True), ('PtmMadre', 'Ground_1', 'Ground_2'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_elbow', 'L_shoulder', (13.595, 0, 0), (0, -1, 0), True, (1, 11, '', True), ('PtmMadre', 'Ground_1', 'Ground_2'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_wrist', 'L_elbow', (13.518, 0, 0), (0, 0, 0), True, (1, 18, 'wrist', False), ('PtmMadre', 'Ground_1', 'Ground_2'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_hand', 'L_wrist', (37.634, 82.173, -1.35), (0, 0, 0), False, (1, 12, '', True), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_indexFinger_00', 'L_hand', (1.309, 0.075, 0.726), (-0.623, -5.496, 3.016), True, (1, 18, 'index meta', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_indexFinger_01', 'L_indexFinger_00', (4, 0, 0), (0.337, 7.605, -2.958), True, (1, 19, '', True), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_indexFinger_02', 'L_indexFinger_01', (1.981, 0, 0), (0, 0, 0), True, (1, 19, '', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_indexFinger_03', 'L_indexFinger_02', (1.171, 0, 0), (0, 0, 0), True, (1, 19, '', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_indexFinger_04', 'L_indexFinger_03', (1.399, 0, 0), (0, 0, 0), True, (1, 18, 'index finger end', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_middleFinger_00', 'L_hand', (1.267, 0.069, 0.084), (0.048, 2.361, 3.104), True, (1, 18, 'middle meta', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_middleFinger_01', 'L_middleFinger_00', (4, 0, 0), (0.08, -0.229, -3.101), True, (1, 20, '', True), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_middleFinger_02', 'L_middleFinger_01', (1.974, 0, 0), (0, 0, 0), True, (1, 20, '', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_middleFinger_03', 'L_middleFinger_02', (1.476, 0, 0), (0, 0, 0), True, (1, 20, '', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_middleFinger_04', 'L_middleFinger_03', (2, 0, 0), (0, 0, 0), True, (1, 18, 'middle finger end', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_ringFinger_00', 'L_hand', (1.242, 0.072, -0.599), (0.7, 8.714, 3.089), True, (1, 18, 'ring meta', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_ringFinger_01', 'L_ringFinger_00', (4, 0.039, -0.189), (-0.233, -6.259, -3.028), True, (1, 21, '', True), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_ringFinger_02', 'L_ringFinger_01', (1.939, 0, 0), (0, 0, 0), True, (1, 21, '', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_ringFinger_03', 'L_ringFinger_02', (1.397, 0, 0), (0, 0, 0), True, (1, 21, '', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_ringFinger_04', 'L_ringFinger_03', (1.425, 0, 0), (0, 0, 0), True, (1, 18, 'ring finger end', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_pinkyFinger_00', 'L_hand', (1.125, 0.086, -1.244), (1.433, 15.996, 3.235), True, (1, 18, 'pinky meta', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_pinkyFinger_01', 'L_pinkyFinger_00', (3.673, 0, 0), (-0.556, -14.015, -2.975), True, (1, 22, '', True), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_pinkyFinger_02', 'L_pinkyFinger_01', (1.476, 0, 0), (0, 0, 0), True, (1, 22, '', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_pinkyFinger_03', 'L_pinkyFinger_02', (0.905, 0, 0), (0, 0, 0), True, (1, 22, '', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_pinkyFinger_04', 'L_pinkyFinger_03', (1.293, 0, 0), (0, 0, 0), True, (1, 18, 'pinky finger end', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_thumbFinger_00', 'L_hand', (1.466, -0.811, 1.164), (45.544, -32.643, -22.5), True, (1, 18, 'thumb meta', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_thumbFinger_01', 'L_thumbFinger_00', (2.276, 0, 0), (0, 0, -1.957), True, (1, 14, '', True), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_thumbFinger_02', 'L_thumbFinger_01', (1.551, 0, 0), (0, 0, -2.389), True, (1, 14, '', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_thumbFinger_03', 'L_thumbFinger_02', (1.73, 0, 0), (0, 0, 0), True, (1, 18, 'thumb end', False), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('hip', 'COG', (0, 0, 0), (0, 0, -90), True, (0, 18, 'hip swing', False), ('PtmMadre', 'Ground_1'), ('rx', 'rz', 'sx', 'sy', 'sz', 'tx'), ('rx', 'rz', 'sx', 'sy', 'sz', 'tx')),
+    ('hipEnd', 'hip', (5.919, 0, 0), (0, 0, 0), True, (0, 2, '', True), ('PtmMadre', 'Ground_1'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty'), ('rx', 'rz', 'sx', 'sy', 'sz', 'ty')),
+    ('L_leg', 'hipEnd', (0, 5.354, 0), (0, 0, 0), True, (1, 2, '', True), ('PtmMadre', 'Ground_1', 'Ground_2'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_knee', 'L_leg', (23.519, 0, 0), (0, 8.074, 0), True, (1, 3, '', True), ('PtmMadre', 'Ground_1', 'Ground_2'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_ankle', 'L_knee', (26.302, 0, 0), (0, 0, 0), True, (1, 18, 'ankle', False), ('PtmMadre', 'Ground_1', 'Ground_2'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_foot', 'L_ankle', (0, 0, 0), (-13.691, -64.119, 11.518), True, (1, 4, '', True), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_toe', 'L_foot', (6.533, 0, 0), (0, -18.513, 0), True, (1, 5, '', True), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_toeEnd', 'L_toe', (5.904, 0, 0), (0, 0, 0), True, (1, 18, 'toeEnd', False), ('PtmMadre', 'Ground_1', 'Ground_2'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_heel', 'L_foot', (0, 0, -6.064), (3.929, -33.15, -7.159), True, (1, 18, 'heel', True), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_foot_in', 'L_toe', (0.025, -2.495, -1.558), (1.31, -14.786, -5.124), True, (1, 18, 'Bank In', True), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_bigToe', 'L_foot_in', (5.302, 0, 0), (0, 0, 0), True, (1, 24, '', True), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_foot_out', 'L_toe', (0.028, 2.832, -1.558), (-2.377, -14.656, 9.316), True, (1, 18, 'Bank Out', True), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+    ('L_pinkyToe', 'L_foot_out', (3.241, 0, 0), (0, 0, 0), True, (1, 28, '', True), ('PtmMadre', 'Ground_1'), ('sx', 'sy', 'sz'), ('sx', 'sy', 'sz')),
+]
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+class Test_Guide_Biped(unittest.TestCase):
+
+    def setUp(self):
+        legacyBuild()
+
+    def tearDown(self):
+        m.delete([i for i in ("Guide", "Other", _LEGACY + "Guide") if m.objExists(i)])
+
+    def assertMatrix(self, name, legacyName=None):
+        legacyName = legacyName or _LEGACY + name
+
+        for value, expected in zip(m.xform(name, q=True, ws=True, m=True),
+                                   m.xform(legacyName, q=True, ws=True, m=True)):
+            self.assertAlmostEqual(value, expected, places=3, msg=name)
+
+    def assertLocal(self, name):
+        for attr in ("translate", "jointOrient"):
+            for value, expected in zip(m.getAttr(name + "." + attr)[0],
+                                       m.getAttr(_LEGACY + name + "." + attr)[0]):
+                self.assertAlmostEqual(value, expected, places=3, msg=name)
+
+    def test_build_biped_guide(self):
+        guides = build_biped_guide()
+
+        self.assertEqual(list(guides), [i[0] for i in _LEGACY_GUIDES])
+
+        for name, parent, _, _, _, label, tags, locked, hidden in _LEGACY_GUIDES:
+            self.assertEqual(m.listRelatives(name, p=True), [parent])
+            self.assertMatrix(name)
+            self.assertLocal(name)
+
+            self.assertEqual(labels(name), label)
+
+            for tag in ("PtmMadre", "Ground_1", "Ground_2"):
+                self.assertEqual(m.attributeQuery(tag, n=name, exists=True), tag in tags,
+                                 msg=name + "." + tag)
+
+            for attr in _CHANNELS:
+                plug = name + "." + attr
+                self.assertEqual(m.getAttr(plug, lock=True), attr in locked, msg=plug)
+                self.assertEqual(m.getAttr(plug, keyable=True), attr not in hidden, msg=plug)
+
+    def test_build_biped_guide_undo(self):
+        build_biped_guide()
+
+        m.undo()
+        self.assertFalse(m.objExists("Guide") or m.objExists("COG"))
+
+    def test_build_biped_branch(self):
+        build_biped_guide()
+        m.delete("L_hand")
+
+        guides = build_biped_branch("L_hand", "L_wrist")
+
+        self.assertEqual(list(guides), branch("L_hand"))
+        for name in guides:
+            self.assertMatrix(name)
+
+        m.undo()
+        self.assertFalse(m.objExists("L_hand"))
+        self.assertTrue(m.objExists("L_wrist"))
+
+    def test_build_biped_branch_parent(self):
+        m.group(n="Other", em=True)
+
+        guides = build_biped_branch("L_hand", "Other")
+
+        # The branch keeps its values relative to the new parent
+        self.assertEqual(m.listRelatives("L_hand", p=True), ["Other"])
+        self.assertEqual(list(guides), branch("L_hand"))
+        for name in guides:
+            self.assertLocal(name)
+
+        with self.assertRaises(ValueError):
+            build_biped_branch("L_tail", "Other")
+
+    def test_template(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "biped.guides")
+
+        try:
+            # Written the first time, read from then on
+            rows = biped_template(path)
+            self.assertTrue(os.path.exists(path))
+            self.assertEqual(rows, resolve_template(BIPED_GUIDES))
+            self.assertEqual(load_template(path), rows)
+
+            build_biped_guide(path)
+            for name in [i[0] for i in _LEGACY_GUIDES]:
+                self.assertMatrix(name)
+
+            with open(path, "w") as templateFile:
+                json.dump({"version": 0, "guides": []}, templateFile)
+
+            with self.assertRaises(ValueError):
+                load_template(path)
+
+        finally:
+            shutil.rmtree(directory)
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def legacyBuild():
+    """ The old guides, one joint command each under the selection. """
+    m.circle(n=_LEGACY + "Guide", r=20, nr=[0, 1, 0])
+
+    for name, parent, position, orient, relative, _, _, _, _ in _LEGACY_GUIDES:
+        m.select(_LEGACY + parent)
+        m.joint(n=_LEGACY + name, p=position, o=orient, r=relative)
+
+    m.select(cl=True)
+
+
+def labels(name):
+    """ (side, type, otherType, drawLabel) """
+    return (m.getAttr(name + ".side"), m.getAttr(name + ".type"),
+            m.getAttr(name + ".otherType") or "", m.getAttr(name + ".drawLabel"))
+
+
+def branch(root):
+    """ The legacy names of a guide and everything under it. """
+    names = [root]
+    for name, parent, _, _, _, _, _, _, _ in _LEGACY_GUIDES:
+        if parent in names:
+            names.append(name)
+
+    return names
+
+# -----------------------------------------------------------------------------
+# EXECUTE SCRIPT
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
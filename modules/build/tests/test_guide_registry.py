@@ -0,0 +1,133 @@
+'''
+/*****************************************************************************/
+                          Test Guide Registry v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Tests for our Guide Registry Functionality
+
+>> HOW TO USE >>
+	Simply run the script or run the script called "testing.py"
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import unittest
+from six.moves import reload_module
+from maya import cmds as m
+from modules.build.guides.base import guide_registry
+from modules.build.guides.base.guide_registry import Guide_Registry
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+class Test_Guide_Registry(unittest.TestCase):
+
+    def setUp(self):
+        self.guide = m.group(n="Guide", em=True)
+        makeGuide("L_arm", self.guide)
+        makeGuide("L_hand", "L_arm")
+
+        self.registry = Guide_Registry(track=True)
+
+    def tearDown(self):
+        self.registry.untrack()
+        m.delete(self.guide)
+
+    def names(self, joints):
+        return [i.name for i in joints]
+
+    def test_create(self):
+        makeGuide("L_leg", self.guide)
+        m.createNode("joint", n="untagged", p=self.guide)
+
+        expected = [i for i in m.listRelatives(self.guide, ad=True, type="joint")
+                    if i != "untagged"]
+
+        self.assertEqual(self.names(self.registry.joints()), expected)
+        self.assertEqual(len(expected), 3)
+        self.assertIn("L_leg", self.names(self.registry.find(side="L")))
+        self.assertNotIn("untagged", self.names(self.registry.joints()))
+
+    def test_delete(self):
+        m.delete("L_hand")
+
+        self.assertEqual(self.names(self.registry.joints()), ["L_arm"])
+        self.assertEqual(self.names(self.registry.find(side="L")), ["L_arm"])
+
+        # Undo brings the same node back
+        m.undo()
+        self.registry.add("L_hand")
+        self.assertEqual(self.names(self.registry.joints()), ["L_hand", "L_arm"])
+
+    def test_reparent(self):
+        m.parent("L_hand", self.guide)
+
+        self.assertEqual(self.names(self.registry.joints()),
+                         m.listRelatives(self.guide, ad=True, type="joint"))
+
+        m.parent("L_hand", "L_arm")
+        self.assertEqual(self.names(self.registry.joints()), ["L_hand", "L_arm"])
+
+    def test_relabel(self):
+        self.assertEqual(self.names(self.registry.find(label="hand")), [])
+
+        m.setAttr("L_hand.side", 2)
+        m.setAttr("L_hand.type", 12)  # hand
+
+        self.assertEqual(self.names(self.registry.find(side="L")), ["L_arm"])
+        self.assertEqual(self.names(self.registry.find(side="R", label="hand")), ["L_hand"])
+
+    def test_untrack(self):
+        self.registry.untrack()
+        self.assertEqual(self.registry._callbacks, [])
+        self.assertEqual(self.registry._nodeCallbacks, {})
+
+        # Nothing sees the new guide until the next rebuild
+        makeGuide("L_leg", self.guide)
+        self.assertNotIn("L_leg", self.names(self.registry.joints()))
+
+        self.registry.rebuild()
+        self.assertIn("L_leg", self.names(self.registry.joints()))
+
+    def test_reload(self):
+        shared = guide_registry.registry()
+        reload_module(guide_registry)
+
+        self.assertEqual(shared._callbacks, [])
+        self.assertEqual(shared._nodeCallbacks, {})
+        self.assertIsNot(guide_registry.registry(), shared)
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def makeGuide(name, parent):
+    """ A tagged left guide joint. """
+    jnt = m.createNode("joint", n=name, p=parent)
+    m.setAttr(jnt + ".side", 1)
+    m.addAttr(jnt, ln="PtmMadre", at="float", k=True)
+
+    return jnt
+
+# -----------------------------------------------------------------------------
+# EXECUTE SCRIPT
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
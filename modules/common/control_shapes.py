@@ -0,0 +1,316 @@
+'''
+/*****************************************************************************/
+                            Control Shapes v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Library of control shapes kept in a binary file, the degree, form,
+    knots and CVs of each curve are read straight into arrays the first
+    time a shape is used and each curve is created with one "curve"
+    command.
+
+>> HOW TO USE >>
+	Create one control or many at once from the shapes of the library:
+
+        ctl = createControl("L_hand_CTL", "gear")
+        ctls = createControls([("L_hand_CTL", "gear"), ("R_hand_CTL", "gear")])
+
+    Any curve of the scene can be added to the library and saved:
+
+        library().add("arrow", Curve("arrow_CRV"))
+        library().save()
+
+>> CONTENTS >>
+    + Shape_Library [Class]
+    + library [Func]
+    + createControl [Func]
+    + createControls [Func]
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> FILE FORMAT >>
+    Little endian, in this order:
+        header      "<4sHI" magic, version, shape count
+        each shape  "<H" name size, utf-8 name, "<H" curve count
+        each curve  "<BBII" degree, form, knot count, cv count then the
+                    float64 knots and the float64 x, y, z of the CVs
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import array
+import os
+import struct
+import sys
+from maya import cmds as m
+from maya import OpenMaya
+from modules.base import Curve
+from modules.utils.open_maya_api import littleEndian
+
+_MAGIC = b"MPCS"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHI")
+_CURVE = struct.Struct("<BBII")
+
+_LIBRARY_PATH = os.path.join(os.path.dirname(__file__), "shapes", "controls.shapes")
+_LIBRARY = {}
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+class Shape_Library(object):
+    """
+    Shape_Library [Class]
+
+    The control shapes of a library file, the file is only read when the
+    first shape is asked for.
+
+    Args:
+        path (str): The library file. Defaults to "shapes/controls.shapes".
+
+    Example:
+        shapes = Shape_Library()
+        print(shapes.names())
+        # Output: ['gear']
+    """
+    def __init__(self, path=None):
+        self.path = path or _LIBRARY_PATH
+        self._shapes = None
+
+    def __contains__(self, name):
+        return name in self.shapes
+
+    @property
+    def shapes(self):
+        """ {name: [{"degree", "form", "knots", "cvs"}, ...]} one item per curve. """
+        if self._shapes is None:
+            self._shapes = _readLibrary(self.path) if os.path.exists(self.path) else {}
+
+        return self._shapes
+
+    def names(self):
+        return sorted(self.shapes)
+
+    def get(self, name):
+        """
+        The curves of a shape.
+
+        Args:
+            name (str): The shape name.
+
+        Returns:
+            list: [{"degree", "form", "knots", "cvs"}, ...] with the knots
+                  and the flat object space CVs as array("d").
+        """
+        if name not in self.shapes:
+            raise ValueError(">>> No control shape called {0}, use one of {1}.".format(
+                name, self.names()))
+
+        return self.shapes[name]
+
+    def add(self, name, curve):
+        """
+        Adds or replaces a shape with the curves of a scene curve.
+
+        Args:
+            name (str): The shape name.
+            curve (str/Curve): The curve to capture, every shape of it.
+        """
+        self.shapes[name] = Curve(curve).getShapeData()
+
+    def remove(self, name):
+        self.shapes.pop(name, None)
+
+    def save(self, path=None):
+        """
+        Writes the library file.
+
+        Args:
+            path (str): The file to write. Defaults to the library path.
+        """
+        _writeLibrary(path or self.path, self.shapes)
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def library(path=None):
+    """
+    library [Function]
+
+    The library of a file, shared by every call with the same path.
+
+    Args:
+        path (str): The library file. Defaults to "shapes/controls.shapes".
+
+    Returns:
+        Shape_Library: The library.
+    """
+    path = os.path.normpath(path or _LIBRARY_PATH)
+
+    if path not in _LIBRARY:
+        _LIBRARY[path] = Shape_Library(path)
+
+    return _LIBRARY[path]
+
+
+def createControl(name, shape, size=1.0):
+    """
+    createControl [Function]
+
+    Creates a control from a shape of the library.
+
+    Args:
+        name (str): The name of the control transform.
+        shape (str): The shape name in the library.
+        size (float): Scales the CVs. Defaults to 1.0.
+
+    Returns:
+        Curve: The new control.
+
+    Example:
+        ctl = createControl("L_hand_CTL", "gear")
+    """
+    return createControls([(name, shape)], size)[0]
+
+
+def createControls(controls, size=1.0):
+    """
+    createControls [Function]
+
+    Creates many controls in one undo chunk, every curve is made with a
+    single "curve" command from the degree, knots and CVs of the library
+    so one undo removes all of them.
+
+    Args:
+        controls (list): [(name, shape), ...] the control names and the
+                         library shapes to use.
+        size (float): Scales the CVs. Defaults to 1.0.
+
+    Returns:
+        list: [Curve, ...] the new controls in the same order.
+
+    Example:
+        ctls = createControls([("L_hand_CTL", "gear"), ("R_hand_CTL", "gear")])
+    """
+    shapes = library()
+    created = []
+
+    m.undoInfo(openChunk=True, chunkName="createControls")
+    try:
+        for name, shape in controls:
+            control = None
+
+            for index, curve in enumerate(shapes.get(shape)):
+                curveNode = Curve(_createCurve(curve, size))
+
+                if control is None:
+                    control = curveNode.rename(name)
+                    control.shape.rename(name + "Shape")
+                    continue
+
+                # The next curves are moved under the first transform
+                curveNode.shape.rename("{0}Shape{1}".format(name, index))
+                m.parent(curveNode.shape.fullPath, control.fullPath, r=True, s=True)
+                curveNode.delete()
+
+            created.append(control)
+
+    finally:
+        m.undoInfo(closeChunk=True)
+
+    return created
+
+# -----------------------------------------------------------------------------
+
+def _createCurve(curve, size):
+    """ One curve transform and shape, the periodic CVs are already repeated. """
+    cvs = curve["cvs"]
+    points = [(cvs[index] * size, cvs[index + 1] * size, cvs[index + 2] * size)
+              for index in range(0, len(cvs), 3)]
+
+    return m.curve(d=curve["degree"], k=list(curve["knots"]), p=points,
+                   per=curve["form"] == OpenMaya.MFnNurbsCurve.kPeriodic)
+
+
+def _readLibrary(path):
+    """ {name: [curve, ...]} from a library file. """
+    with open(path, "rb") as libraryFile:
+        data = libraryFile.read()
+
+    magic, version, shapeCount = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(">>> {0} is not a control shape library.".format(path))
+
+    position = _HEADER.size
+    shapes = {}
+
+    for _ in range(shapeCount):
+        nameSize, = struct.unpack_from("<H", data, position)
+        position += 2
+        name = data[position:position + nameSize].decode("utf-8")
+        position += nameSize
+
+        curveCount, = struct.unpack_from("<H", data, position)
+        position += 2
+
+        curves = []
+        for _ in range(curveCount):
+            degree, form, knotCount, cvCount = _CURVE.unpack_from(data, position)
+            position += _CURVE.size
+
+            knots = _doubles(data, position, knotCount)
+            position += knotCount * 8
+
+            cvs = _doubles(data, position, cvCount * 3)
+            position += cvCount * 24
+
+            curves.append({"degree": degree, "form": form, "knots": knots, "cvs": cvs})
+
+        shapes[name] = curves
+
+    return shapes
+
+
+def _writeLibrary(path, shapes):
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    with open(path, "wb") as libraryFile:
+        libraryFile.write(_HEADER.pack(_MAGIC, _VERSION, len(shapes)))
+
+        for name in sorted(shapes):
+            encoded = name.encode("utf-8")
+            libraryFile.write(struct.pack("<H", len(encoded)) + encoded)
+            libraryFile.write(struct.pack("<H", len(shapes[name])))
+
+            for curve in shapes[name]:
+                knots, cvs = curve["knots"], curve["cvs"]
+                libraryFile.write(_CURVE.pack(curve["degree"], curve["form"],
+                                              len(knots), len(cvs) // 3))
+                libraryFile.write(littleEndian(knots, "d"))
+                libraryFile.write(littleEndian(cvs, "d"))
+
+
+def _doubles(data, position, count):
+    values = array.array("d")
+    values.frombytes(data[position:position + count * 8])
+
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return values
@@ -15,6 +15,9 @@
 
 >> NOTES >> 
 	Update 02/09/2023 : Started to work on the script.
+	Update 18/10/2026 : build_ctl_from_points creates the curve from every CV
+	                    in one undoable call
+	Update 18/10/2026 : gear is read from the control shape library
 
 >> CONTACT >>
     luisf.carranza@outlook.com
@@ -29,92 +32,15 @@
 
 from maya import cmds as m
 from modules.base import Curve
+from modules.common.control_shapes import createControl
 
 # -----------------------------------------------------------------------------
 # SCRIPT FUNCTIONS
 # -----------------------------------------------------------------------------
 
 def gear(name = "gear"):
-    """ Gear control. """
-
-    points = [[0.21603651945719954, 1.3791639334092862e-16, -0.9999999450684957], 
-              [1.3732739104155965e-08, 1.3791639334092862e-16, -1.0], 
-              [-0.21603649199172023, 1.3791639334092862e-16, -0.9999999450684957], 
-              [-0.16479234607656865, 1.3791639334092862e-16, -0.7752870977708756], 
-              [-0.2449291652082523, 1.3791639334092862e-16, -0.7538145018005422], 
-              [-0.32238248900073263, 1.3791639334092862e-16, -0.7240829564026557], 
-              [-0.4212858022220725, 1.3791639334092862e-16, -0.6614361270186367], 
-              [-0.5615744718243212, 1.3791639334092862e-16, -0.8482670952399188], 
-              [-0.6677740248751424, 1.3791639334092862e-16, -0.7420676975051386], 
-              [-0.7420676837724013, 1.3791639334092862e-16, -0.6677740386078793], 
-              [-0.8482670815071806, 1.3791639334092862e-16, -0.5615744855570556], 
-              [-0.6614361132858948, 1.3791639334092862e-16, -0.42128581595480996], 
-              [-0.7240829426699158, 1.3791639334092862e-16, -0.3223825027334723], 
-              [-0.7538144880678022, 1.3791639334092862e-16, -0.24492917894099184], 
-              [-0.7752870840381361, 1.3791639334092862e-16, -0.16479235980930768], 
-              [-0.9999999313357568, 1.3791639334092862e-16, -0.2212772834749046], 
-              [-0.9999999862672607, 1.3791639334092862e-16, -2.6249900909976018e-16], 
-              [-0.9999999313357568, 1.3791639334092862e-16, 0.22127728347490364], 
-              [-0.7752870840381361, 1.3791639334092862e-16, 0.16479235980930695], 
-              [-0.7538144880678022, 1.3791639334092862e-16, 0.24492917894099106], 
-              [-0.7240829426699158, 1.3791639334092862e-16, 0.32238250273347174], 
-              [-0.6630478603563272, 1.3791639334092862e-16, 0.41967406888438885], 
-              [-0.849017585726927, 0.0, 0.560823981337324], 
-              [-0.7420676837723974, 0.0, 0.6677740386078822], 
-              [-0.6677740248751389, 0.0, 0.74206769750514], 
-              [-0.560823967604561, 0.0, 0.849017599459689], 
-              [-0.4196740551516422, 0.0, 0.6630478740890717], 
-              [-0.3223824890007329, 0.0, 0.7240829564026543], 
-              [-0.2449291652082523, 0.0, 0.75381450180054], 
-              [-0.16479234607656879, 0.0, 0.7752870977708738], 
-              [-0.21603649199172079, 0.0, 0.9999999450684962], 
-              [1.3732738828323178e-08, 0.0, 1.0], 
-              [0.21603651945719762, 0.0, 0.9999999450684962], 
-              [0.16479237354204604, 0.0, 0.7752870977708738], 
-              [0.24492919267373026, 0.0, 0.7538145018005402], 
-              [0.32238251646621086, 0.0, 0.724082956402654], 
-              [0.4212858296875513, 0.0, 0.6614361270186357], 
-              [0.5615745381184206, 0.0, 0.8482671340685369], 
-              [0.667774013511999, 0.0, 0.7420676586765155], 
-              [0.742067672409258, 0.0, 0.667773999779256], 
-              [0.8482671478012801, 0.0, 0.5615745243856729], 
-              [0.661436140751372, 1.3791639334092862e-16, 0.4212858159548099], 
-              [0.724082970135393, 1.3791639334092862e-16, 0.322382502733472], 
-              [0.7538145155332788, 1.3791639334092862e-16, 0.24492917894099106], 
-              [0.7752871115036131, 1.3791639334092862e-16, 0.16479235980930723], 
-              [0.9999999862667116, 1.3791639334092862e-16, 0.22127728347490436], 
-              [0.9999999862672607, 1.3791639334092862e-16, 2.912578472088767e-16], 
-              [0.9999999862667116, 1.3791639334092862e-16, -0.22127728347490316], 
-              [0.7752871115036131, 1.3791639334092862e-16, -0.1647923598093071], 
-              [0.7538145155332788, 1.3791639334092862e-16, -0.24492917894099092], 
-              [0.724082970135393, 1.3791639334092862e-16, -0.3223825027334711], 
-              [0.6630478878218046, 1.3791639334092862e-16, -0.4196740688843877], 
-              [0.849017613192404, 1.3791639334092862e-16, -0.5608239813373235], 
-              [0.7420677112378746, 1.3791639334092862e-16, -0.6677740386078811], 
-              [0.6677740523406147, 1.3791639334092862e-16, -0.7420676975051396], 
-              [0.5608239950700369, 1.3791639334092862e-16, -0.8490175994596892], 
-              [0.41967408261712014, 1.3791639334092862e-16, -0.6630478740890715], 
-              [0.3223825164662114, 1.3791639334092862e-16, -0.724082956402654], 
-              [0.24492919267373053, 1.3791639334092862e-16, -0.7538145018005402], 
-              [0.16479237354204632, 1.3791639334092862e-16, -0.7752870977708741]]
-    
-    gear_main = build_ctl_from_points("outer", points)
-    
-    points = [[0.3863065680801773, 1.3791639334092882e-16, -0.38650484294311777], 
-              [1.373273868288378e-08, 1.3791639334092852e-16, -0.5458528571061978], 
-              [-0.3863065406146977, 1.3791639334092885e-16, -0.3865048429431176], 
-              [-0.5463210052369586, 1.379163933409285e-16, 0.00010396035502080224], 
-              [-0.38630654061469855, 1.3791639334092887e-16, 0.386241572863445], 
-              [1.3732739604037028e-08, 1.379163933409285e-16, 0.5463749225973845], 
-              [0.3863065680801772, 1.3791639334092882e-16, 0.38624157286344457], 
-              [0.5463210327024363, 1.379163933409284e-16, 0.00010396035502077687]]
-    
-    gear_inner = build_ctl_from_points(n = "inner", cvs = points)
-    
-    gear_main.mergeCurves(gear_inner)
-
-    gear_main.rename(name)
-    gear_main.deleteHistory() # Delete history of circle creation
+    """ Gear control, from the control shape library. """
+    gear_main = createControl(name, "gear")
     m.select(cl=True)
     
     return gear_main
@@ -122,19 +48,18 @@ def gear(name = "gear"):
 
 def build_ctl_from_points(n = "ctl", cvs = None):
     """
-    Creates a circle curve from len of points and move them into position
+    Creates a closed curve through the CV positions, the same periodic
+    cubic curve as a circle with one section per point.
 
     Args:
         n (str): name of curve. Defaults to "ctl".
         cvs (list): The cvPosition. Defaults to None.
     """
-    ctl = Curve(m.circle(n = n, s = len(cvs), normal = [0,1,0]) [0])
-    
-    pnt = 0
+    # A periodic curve repeats its first CVs, one knot for each of them
+    points = [tuple(i) for i in cvs] + [tuple(i) for i in cvs[:3]]
+    knots = list(range(-2, len(cvs) + 3))
 
-    for i in cvs:
-        m.move(i[0], i[1], i[2], '{}.cv[{}]'.format(n, pnt))
-        pnt += 1
+    ctl = Curve(m.curve(n = n, d = 3, p = points, k = knots, per = True))
     
     return ctl
 
@@ -0,0 +1,98 @@
+'''
+/*****************************************************************************/
+                          Test Control Shapes v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Tests for our Control Shapes Functionality
+
+>> HOW TO USE >>
+	Simply run the script or run the script called "testing.py"
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import array
+import os
+import tempfile
+import unittest
+from maya import cmds as m
+from modules.base import Curve
+from modules.common.control_shapes import (Shape_Library, library, createControls,
+                                           _readLibrary, _writeLibrary)
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+class Test_Control_Shapes(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(tempfile.gettempdir(), "test_control_shapes.shapes")
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_readLibrary_writeLibrary(self):
+        shapes = {"line": [{"degree": 1, "form": 1,
+                            "knots": array.array("d", [0, 1]),
+                            "cvs": array.array("d", [0, 0, 0, 0, 1.5, -2])}]}
+
+        _writeLibrary(self.path, shapes)
+        self.assertEqual(_readLibrary(self.path), shapes)
+
+    def test_readLibrary_ValueError(self):
+        with open(self.path, "wb") as libraryFile:
+            libraryFile.write(b"NOPE" + bytes(6))
+
+        with self.assertRaises(ValueError):
+            _readLibrary(self.path)
+
+    def test_shapeLibrary_add(self):
+        circle = Curve(m.circle(n="circle_CTL", s=8, ch=False)[0])
+
+        shapes = Shape_Library(self.path)
+        shapes.add("circle", circle)
+        shapes.save()
+
+        saved = Shape_Library(self.path).get("circle")
+        self.assertEqual(saved, circle.getShapeData())
+        self.assertEqual(len(saved[0]["cvs"]) // 3, 11)  # 8 CVs and 3 repeats
+
+        circle.delete()
+
+    def test_createControls(self):
+        ctls = createControls([("L_hand_CTL", "gear"), ("R_hand_CTL", "gear")])
+
+        expected = [len(i["cvs"]) // 3 for i in library().get("gear")]
+        for ctl in ctls:
+            self.assertEqual([len(i["cvs"]) // 3 for i in ctl.getShapeData()], expected)
+
+        self.assertEqual([i.name for i in ctls[0].shapes],
+                         ["L_hand_CTLShape", "L_hand_CTLShape1"])
+
+        # One undo removes every control
+        m.undo()
+        self.assertFalse(m.objExists("L_hand_CTL") or m.objExists("R_hand_CTL"))
+
+# -----------------------------------------------------------------------------
+# EXECUTE SCRIPT
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
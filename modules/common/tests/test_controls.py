@@ -0,0 +1,56 @@
+'''
+/*****************************************************************************/
+                            Test Controls v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Tests for our Common Controls Functionality
+
+>> HOW TO USE >>
+	Simply run the script or run the script called "testing.py"
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import unittest
+from maya import cmds as m
+from modules.common.controls import build_ctl_from_points
+
+_SQUARE = [[1, 0, 1], [1, 0, -1], [-1, 0, -1], [-1, 0, 1]]
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+class Test_Controls(unittest.TestCase):
+
+    def test_build_ctl_from_points(self):
+        ctl = build_ctl_from_points("square_CTL", _SQUARE)
+
+        self.assertEqual(list(ctl.getCVs()), [float(i) for point in _SQUARE for i in point])
+        self.assertEqual(m.getAttr(ctl.shapes[0].fullPath + ".form"), 2)  # Periodic
+
+        # One undo removes the curve, no circle is left behind
+        m.undo()
+        self.assertFalse(m.objExists("square_CTL"))
+
+# -----------------------------------------------------------------------------
+# EXECUTE SCRIPT
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
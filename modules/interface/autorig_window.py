@@ -27,7 +27,7 @@
 
 from maya import cmds as m
 from modules.interface import Window_Base as Window
-from modules.build.guides.base.guide_biped import Biped_Guide
+from modules.build.guides.base.guide_biped import build_biped_guide
 from modules.build.guides import (mirror_guide, 
                                   toggle_guide_name, 
                                   toggle_guide_axis,
@@ -60,7 +60,7 @@ class AutoRig_Window(Window):
         # Layout
         m.rowColumnLayout(nc=2, adj=1)
         # Buttons
-        m.button(l="Create Guides", c = lambda x: Biped_Guide("GuideJnt").build())
+        m.button(l="Create Guides", c = lambda x: build_biped_guide())
         m.button(l="Clean", c = lambda x: del_base())
         self.exitLayout
         m.separator(h=10)
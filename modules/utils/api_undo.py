@@ -0,0 +1,120 @@
+'''
+/*****************************************************************************/
+                                API Undo v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Runs an MDGModifier or MDagModifier as one Maya command, so all the
+    edits queued in it are undone and redone with a single Ctrl+Z. This
+    file is also the plugin that registers that command, it is loaded
+    the first time a modifier is run.
+
+>> HOW TO USE >>
+	Queue the edits into a modifier and run it through "doIt":
+
+        modifier = OpenMaya.MDGModifier()
+        modifier.newPlugValueDouble(plug, 1.0)
+        doIt(modifier)
+
+>> CONTENTS >>
+    + doIt [Func]
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import os
+from maya import cmds as m
+from maya import OpenMayaMPx
+
+COMMAND_NAME = "ptmApiUndo"
+
+_PLUGIN_PATH = os.path.splitext(os.path.abspath(__file__))[0] + ".py"
+
+# Modifiers waiting for the command, Maya loads the plugin as another
+# module so the command reads them from this one.
+_PENDING = []
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+class _Api_Undo_Command(OpenMayaMPx.MPxCommand):
+    """ Runs the last pending modifier and keeps it to undo and redo it. """
+
+    def __init__(self):
+        OpenMayaMPx.MPxCommand.__init__(self)
+        self._modifier = None
+
+    def isUndoable(self):
+        return True
+
+    def doIt(self, args):
+        # Importing here, the package module holds the pending modifiers
+        from modules.utils import api_undo
+
+        self._modifier = api_undo._PENDING.pop()
+        self._modifier.doIt()
+
+    def redoIt(self):
+        self._modifier.doIt()
+
+    def undoIt(self):
+        self._modifier.undoIt()
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def doIt(modifier):
+    """
+    doIt [Function]
+
+    Runs a modifier as one undoable command.
+
+    Args:
+        modifier (MDGModifier): The modifier with the queued edits.
+
+    Example:
+        modifier = OpenMaya.MDGModifier()
+        modifier.newPlugValueDouble(plug, 1.0)
+        doIt(modifier)
+        m.undo()  # Undoes every edit of the modifier
+    """
+    if not m.pluginInfo(_PLUGIN_PATH, query=True, loaded=True):
+        m.loadPlugin(_PLUGIN_PATH, quiet=True)
+
+    _PENDING.append(modifier)
+    try:
+        getattr(m, COMMAND_NAME)()
+    finally:
+        # A failing command leaves its modifier behind
+        del _PENDING[:]
+
+# -----------------------------------------------------------------------------
+# PLUGIN
+# -----------------------------------------------------------------------------
+
+def _creator():
+    return OpenMayaMPx.asMPxPtr(_Api_Undo_Command())
+
+
+def initializePlugin(plugin):
+    OpenMayaMPx.MFnPlugin(plugin).registerCommand(COMMAND_NAME, _creator)
+
+
+def uninitializePlugin(plugin):
+    OpenMayaMPx.MFnPlugin(plugin).deregisterCommand(COMMAND_NAME)
@@ -0,0 +1,362 @@
+'''
+/*****************************************************************************/
+                              Batch Build v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Builds many rigs without the interface. Every guide template or scene
+    file is built, validated and exported by its own mayapy process, a
+    pool of them runs at the same time and the progress with the timings
+    of each file is printed as they finish. A failing or crashing file is
+    reported and the batch goes on.
+
+>> HOW TO USE >>
+	From a terminal, the files can be scenes or guide templates:
+
+        mayapy -m modules.utils.batch_build body.ma arms.guides -o C:/rigs -w 4
+
+    Or from python, getting the results back:
+
+        results = runBatch(["body.ma", "arms.guides"], output="C:/rigs")
+
+    A step can be one of STEPS or a "module:function" taking the file
+    and the output directory, example "projects.nightly:exportFbx".
+
+>> CONTENTS >>
+    + STEPS [Dict]
+    + runBatch [Func]
+    + runFile [Func]
+    + main [Func]
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# No maya import here, the batch itself runs in any python
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_TEMPLATE_EXTENSIONS = (".guides", ".json")
+
+DEFAULT_STEPS = ("build", "validate", "export")
+
+# -----------------------------------------------------------------------------
+# STEPS
+# -----------------------------------------------------------------------------
+
+def _build(path, output):
+    """ Builds the rig from the guides of the scene or of a template. """
+    # Importing here, these need a maya session
+    from modules.build.guides.build_guide import build_guide
+    from modules.build.guides.base.guide_biped import build_biped_guide
+
+    if path.lower().endswith(_TEMPLATE_EXTENSIONS):
+        build_biped_guide(path)
+
+    build_guide()
+
+
+def _validate(path, output):
+    """ The skeleton exists, every guide has its joint and no name clashes. """
+    # Importing here, these need a maya session
+    from maya import cmds as m
+    from modules.build.guides import find_guide_joints
+    from modules.build.guides.build_guide import find_skeleton, GUIDE_SUFFIX
+
+    if find_skeleton() is None:
+        raise ValueError(">>> No skeleton was built for {0}.".format(path))
+
+    names = [i.split("|")[-1] for i in m.ls(type="joint", l=True)]
+    clashes = sorted(set(i for i in names if names.count(i) > 1))
+
+    missing = []
+    for jnt in find_guide_joints():
+        name = jnt.name[:-len(GUIDE_SUFFIX)] if jnt.name.endswith(GUIDE_SUFFIX) else jnt.name
+        if name not in names:
+            missing.append(name)
+
+    if clashes or missing:
+        raise ValueError(">>> Joint names used more than once: {0}, guides without "
+                         "joint: {1}".format(clashes, missing))
+
+
+def _export(path, output):
+    """ Saves the built rig as a maya binary in the output directory. """
+    # Importing here, these need a maya session
+    from maya import cmds as m
+
+    if not output:
+        raise ValueError(">>> The export step needs an output directory.")
+
+    name = os.path.splitext(os.path.basename(path))[0]
+    m.file(rename=os.path.join(output, name + "_rig.mb"))
+    m.file(save=True, type="mayaBinary", force=True)
+
+
+STEPS = {"build": _build, "validate": _validate, "export": _export}
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def runBatch(files, steps=DEFAULT_STEPS, output=None, workers=None,
+             executable=None, timeout=None, progress=None, env=None):
+    """
+    runBatch [Function]
+
+    Runs the steps on every file, each file in its own process.
+
+    Args:
+        files (list): The scene or guide template files.
+        steps (list): The step names or "module:function". Defaults to
+                      ("build", "validate", "export").
+        output (str): The export directory. Defaults to None.
+        workers (int): Files built at the same time. Defaults to the
+                       cpu count.
+        executable (str): The mayapy to run. Defaults to sys.executable.
+        timeout (float): Seconds before a file is given up. Defaults to None.
+        progress (callable): Called as progress(result, done, total) when
+                             a file is done. Defaults to printing a line.
+        env (dict): Environment of the workers. Defaults to os.environ.
+
+    Returns:
+        list: [{"file", "ok", "step", "error", "timings", "seconds"}, ...]
+              one per file in the same order.
+
+    Example:
+        results = runBatch(["body.ma", "arms.guides"], output="C:/rigs")
+        # Output: >>> [1/2] arms.guides: ok in 21.40 s (open 0.01 s, build 19.8 s, etc...)
+    """
+    steps = list(steps)
+    for step in steps:
+        _resolveStep(step, load=False)  # Fails here, not in every worker
+
+    # The workers run from the package root, relative paths are made
+    # absolute from the working directory of the caller
+    files = [os.path.abspath(i) for i in files]
+    output = os.path.abspath(output) if output else output
+
+    if output and not os.path.exists(output):
+        os.makedirs(output)
+
+    executable = executable or sys.executable
+    progress = progress or _printProgress
+    workers = max(1, min(workers or os.cpu_count() or 1, len(files) or 1))
+
+    workerEnv = dict(os.environ if env is None else env)
+    workerEnv["PYTHONPATH"] = os.pathsep.join(
+        [_ROOT] + [i for i in [workerEnv.get("PYTHONPATH")] if i])
+
+    results = [None] * len(files)
+    start = time.time()
+
+    with ThreadPoolExecutor(workers) as pool:
+        jobs = dict((pool.submit(_runWorker, executable, path, steps, output,
+                                 timeout, workerEnv), index)
+                    for index, path in enumerate(files))
+
+        for done, job in enumerate(as_completed(jobs), 1):
+            result = job.result()
+            results[jobs[job]] = result
+            progress(result, done, len(files))
+
+    failed = [i["file"] for i in results if not i["ok"]]
+    sys.stdout.write(">>> Built {0} of {1} files in {2:.2f} s, {3} failed{4}\n".format(
+        len(files) - len(failed), len(files), time.time() - start, len(failed),
+        ": {0}".format(failed) if failed else "."))
+
+    return results
+
+
+def runFile(path, steps=DEFAULT_STEPS, output=None):
+    """
+    runFile [Function]
+
+    Opens a file and runs the steps on it in this maya session, the
+    worker side of runBatch.
+
+    Args:
+        path (str): The scene or guide template file.
+        steps (list): The step names or "module:function".
+        output (str): The export directory. Defaults to None.
+
+    Returns:
+        dict: {"file", "ok", "step", "error", "timings", "seconds"} the
+              failing step and its traceback when not ok.
+    """
+    result = {"file": path, "ok": False, "step": "open", "error": None,
+              "timings": {}, "seconds": 0.0}
+    start = time.time()
+
+    try:
+        # Importing here, only the workers need maya
+        from maya import cmds as m
+
+        stepStart = time.time()
+        if path.lower().endswith(_TEMPLATE_EXTENSIONS):
+            m.file(new=True, force=True)
+        else:
+            m.file(path, open=True, force=True)
+        result["timings"]["open"] = time.time() - stepStart
+
+        for step in steps:
+            result["step"] = step
+            stepStart = time.time()
+            _resolveStep(step)(path, output)
+            result["timings"][step] = time.time() - stepStart
+
+        result["ok"] = True
+        result["step"] = None
+
+    except Exception:
+        result["error"] = traceback.format_exc()
+
+    result["seconds"] = time.time() - start
+
+    return result
+
+
+def main(argv=None):
+    """
+    main [Function]
+
+    Command line entry, see the module description.
+
+    Returns:
+        int: 0 when every file was built, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog="batch_build",
+                                     description="Builds rigs in parallel mayapy processes.")
+    parser.add_argument("files", nargs="+", help="Scene or guide template files.")
+    parser.add_argument("-s", "--steps", default=",".join(DEFAULT_STEPS),
+                        help="Comma separated steps. Default: %(default)s")
+    parser.add_argument("-o", "--output", help="Export directory.")
+    parser.add_argument("-w", "--workers", type=int, help="Files built at the same time.")
+    parser.add_argument("-t", "--timeout", type=float, help="Seconds per file.")
+    parser.add_argument("-e", "--executable", help="The mayapy to use.")
+    parser.add_argument("--result", help=argparse.SUPPRESS)  # Worker mode
+
+    args = parser.parse_args(argv)
+    steps = [i for i in args.steps.split(",") if i]
+
+    if args.result:
+        return _workerMain(args.files[0], steps, args.output, args.result)
+
+    results = runBatch(args.files, steps, args.output, args.workers,
+                       args.executable, args.timeout)
+
+    return 0 if all(i["ok"] for i in results) else 1
+
+# -----------------------------------------------------------------------------
+
+def _resolveStep(step, load=True):
+    """
+    The function of a step name or of a "module:function" string, the
+    module is not imported with load=False as it may need maya.
+    """
+    if step in STEPS:
+        return STEPS[step]
+
+    if ":" not in step:
+        raise ValueError(">>> Unknown step {0}, use one of {1} or \"module:function\".".format(
+            step, sorted(STEPS)))
+
+    if load:
+        module, function = step.split(":", 1)
+        return getattr(importlib.import_module(module), function)
+
+
+def _workerMain(path, steps, output, resultPath):
+    """ Runs one file in a standalone session and writes its result. """
+    try:
+        import maya.standalone
+        maya.standalone.initialize(name="python")
+        result = runFile(path, steps, output)
+
+    except Exception:
+        result = {"file": path, "ok": False, "step": "initialize",
+                  "error": traceback.format_exc(), "timings": {}, "seconds": 0.0}
+
+    with open(resultPath, "w") as resultFile:
+        json.dump(result, resultFile)
+
+    return 0 if result["ok"] else 1
+
+
+def _runWorker(executable, path, steps, output, timeout, env):
+    """ One worker process, a crash or a timeout is a failed result. """
+    handle, resultPath = tempfile.mkstemp(suffix=".json", prefix="batch_build_")
+    os.close(handle)
+
+    command = [executable, "-m", "modules.utils.batch_build", path,
+               "--steps", ",".join(steps), "--result", resultPath]
+    if output:
+        command += ["--output", output]
+
+    start = time.time()
+    try:
+        process = subprocess.run(command, env=env, cwd=_ROOT, timeout=timeout,
+                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+        with open(resultPath) as resultFile:
+            data = resultFile.read()
+
+        if data:
+            return json.loads(data)
+
+        error = process.stderr.decode("utf-8", "replace")[-2000:]
+        error = "Worker exited with code {0}\n{1}".format(process.returncode, error)
+
+    except subprocess.TimeoutExpired:
+        error = "Timed out after {0} s".format(timeout)
+
+    finally:
+        os.remove(resultPath)
+
+    return {"file": path, "ok": False, "step": None, "error": error,
+            "timings": {}, "seconds": time.time() - start}
+
+
+def _printProgress(result, done, total):
+    name = os.path.basename(result["file"])
+    timings = ", ".join("{0} {1:.2f} s".format(step, seconds)
+                        for step, seconds in result["timings"].items())
+
+    if result["ok"]:
+        line = "ok in {0:.2f} s ({1})".format(result["seconds"], timings)
+    else:
+        error = (result["error"] or "").strip().splitlines() or [""]
+        line = "FAILED at {0}: {1}".format(result["step"], error[-1])
+
+    sys.stdout.write(">>> [{0}/{1}] {2}: {3}\n".format(done, total, name, line))
+    sys.stdout.flush()
+
+# -----------------------------------------------------------------------------
+# EXECUTE SCRIPT
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    sys.exit(main())
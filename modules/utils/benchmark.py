@@ -0,0 +1,88 @@
+'''
+/*****************************************************************************/
+                                Benchmark v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Small timing tools to compare the cost of our functions from within Maya.
+
+>> HOW TO USE >>
+	Pass the callables to compare to "compare", it will print and return
+    the best time per call of each one.
+
+>> CONTENTS >>
+    + timePerCall [Func]
+    + compare [Func]
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import timeit
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def timePerCall(func, number=1000, repeat=3):
+    """
+    timePerCall [Function]
+
+    Times a callable and returns the best time of a single call.
+
+    Args:
+        func (callable): The function to time, it takes no arguments.
+        number (int): Calls per repetition. Defaults to 1000.
+        repeat (int): Repetitions, the fastest one is used. Defaults to 3.
+
+    Returns:
+        float: Seconds per call.
+
+    Example:
+        timePerCall(lambda: cube.a.tx.get())
+        # Output: 1.2e-05
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def compare(label, before, after, number=1000, repeat=3):
+    """
+    compare [Function]
+
+    Times two callables doing the same work and prints the difference.
+
+    Args:
+        label (str): The name to print for this comparison.
+        before (callable): The old implementation.
+        after (callable): The new implementation.
+        number (int): Calls per repetition. Defaults to 1000.
+        repeat (int): Repetitions, the fastest one is used. Defaults to 3.
+
+    Returns:
+        tuple: (before, after) seconds per call.
+
+    Example:
+        compare("get", lambda: m.getAttr("cube.tx"), cube.a.tx.get)
+        # Output: >>> get: 25.10 us -> 3.42 us (x7.3)
+    """
+    beforeTime = timePerCall(before, number, repeat)
+    afterTime = timePerCall(after, number, repeat)
+
+    print(">>> {0}: {1:.2f} us -> {2:.2f} us (x{3:.1f})".format(
+        label, beforeTime * 1e6, afterTime * 1e6,
+        beforeTime / afterTime if afterTime else 0))
+
+    return beforeTime, afterTime
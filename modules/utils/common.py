@@ -15,10 +15,12 @@
 
 >> CONTENTS >> 
     + matchMove [Func]
+    + matchMovePairs [Func]
     + createOffset [Func]
 
 >> NOTES >> 
 	Update 04/08/2023 : Start working on the script
+    Update 18/10/2026 : matchMove uses the world matrices, no constraints.
  
 >> THANKS >> 
     Nick Hughes [04/08/2023]:
@@ -36,30 +38,93 @@
 # -----------------------------------------------------------------------------
 
 from maya import cmds as m
+from maya import OpenMaya
+from modules.utils import open_maya_api
 
 
 # -----------------------------------------------------------------------------
 # SCRIPT FUNCTIONS
 # -----------------------------------------------------------------------------
 
-def matchMove(selection, point=0, orient=0):
+def matchMove(selection, point=0, orient=0, constraint=False):
     """
     Takes a driver location object and a list of driven items to move in that 
-    order. The default option is to use a parentConstrain to move both translate 
-    and rotate unless point or orient are set to True.  
+    order. The default option is to match both translate and rotate unless
+    point or orient are set to True.
     The first item in list/selection is gonna be the driver of our function.
 
+    The driver world matrix is read once and every driven item gets its
+    local translate and rotate set directly, taking the joint orient, the
+    rotate axis and the rotate order into account.
+
     Args:
         selection (List): A list of items in the scene. Defaults to None.
-        point (Bool): The type of contraint to create. Defaults to False.
-        orient (Bool): The type of contraint to create. Defaults to False.
+        point (Bool): Match only the position. Defaults to False.
+        orient (Bool): Match only the rotation. Defaults to False.
+        constraint (Bool): Use temporary constraints instead of the
+                           matrices. Defaults to False.
 
     Example:
         matchMove(["sphere_GEO", "MODEL_GRP"])
     """
-    parentObj = selection.pop(0)  # Remove parent from list
+    parentObj, drivenObjs = selection[0], selection[1:]
+
+    if constraint:
+        _matchMoveConstraint(parentObj, drivenObjs, point, orient)
+        return
+
+    if not (point or orient):
+        point = orient = True
+
+    try:
+        driverPath = open_maya_api.toMDagPath(parentObj)
+        driverPosition, driverRotation = _worldPivotAndRotation(driverPath)
+    except Exception as e:
+        print(">>> matchMove Error: {0}: {1}".format(type(e).__name__, e))
+        return
+
+    for obj in drivenObjs:
+        try:
+            _setWorldTransform(open_maya_api.toMDagPath(obj),
+                               driverPosition if point else None,
+                               driverRotation if orient else None)
+
+        except Exception as e:
+            print(">>> matchMove Error: {0}: {1}".format(type(e).__name__, e))
+
+
+def matchMovePairs(pairs, point=0, orient=0):
+    """
+    Batch matchMove where every driven item has its own driver, all the
+    driver matrices are read before moving anything.
+
+    Args:
+        pairs (List): [(driver, driven), ...] items in the scene.
+        point (Bool): Match only the position. Defaults to False.
+        orient (Bool): Match only the rotation. Defaults to False.
+
+    Example:
+        matchMovePairs(zip(guideJoints, bindJoints))
+    """
+    if not (point or orient):
+        point = orient = True
+
+    targets = []
+    for driver, driven in pairs:
+        driverPosition, driverRotation = _worldPivotAndRotation(
+            open_maya_api.toMDagPath(driver))
+        targets.append((driven, driverPosition, driverRotation))
+
+    # Parents are matched before their children, the order is kept
+    for driven, driverPosition, driverRotation in targets:
+        _setWorldTransform(open_maya_api.toMDagPath(driven),
+                           driverPosition if point else None,
+                           driverRotation if orient else None)
+
 
-    for obj in selection:
+def _matchMoveConstraint(parentObj, drivenObjs, point=0, orient=0):
+    """ The original matchMove, creating and deleting constraints. """
+    for obj in drivenObjs:
         # Repositions Obj
         try:
             if point or orient:
@@ -78,6 +143,63 @@ def matchMove(selection, point=0, orient=0):
             print(">>> matchMove Error: {0}: {1}".format(type(e).__name__, e))
 
 
+def _worldPivotAndRotation(dagPath):
+    """
+    The world position of the rotate pivot and the world rotation,
+    the same targets a parentConstraint would use.
+
+    Returns:
+        tuple: (MPoint, MMatrix) the rotation matrix has no scale.
+    """
+    position = OpenMaya.MFnTransform(dagPath).rotatePivot(OpenMaya.MSpace.kWorld)
+    rotation = OpenMaya.MTransformationMatrix(
+        dagPath.inclusiveMatrix()).rotation().asMatrix()
+
+    return position, rotation
+
+
+def _setWorldTransform(dagPath, position=None, rotation=None):
+    """
+    Sets the local translate and rotate of a transform or joint so it
+    lands on the world position and rotation given. setAttr keeps it undoable.
+
+    Args:
+        dagPath (MDagPath): The driven transform.
+        position (MPoint): World position, None to leave it.
+        rotation (MMatrix): World rotation, None to leave it.
+    """
+    node = dagPath.fullPathName()
+
+    if position is not None:
+        local = position * dagPath.exclusiveMatrixInverse()
+        unit = OpenMaya.MDistance.uiUnit()
+
+        m.setAttr(node + ".translate", *[
+            OpenMaya.MDistance(i, OpenMaya.MDistance.kCentimeters).asUnits(unit)
+            for i in (local.x, local.y, local.z)])
+
+    if rotation is not None:
+        parentRotation = OpenMaya.MTransformationMatrix(
+            dagPath.exclusiveMatrix()).rotation().asMatrix()
+
+        # Joint: rotateAxis * rotate * jointOrient * parent = world
+        rotateAxis = OpenMaya.MFnTransform(dagPath).rotateOrientation(
+            OpenMaya.MSpace.kTransform).asMatrix()
+        local = rotateAxis.inverse() * rotation * parentRotation.inverse()
+
+        if dagPath.hasFn(OpenMaya.MFn.kJoint):
+            jointOrient = OpenMaya.MQuaternion()
+            OpenMaya.MFnIkJoint(dagPath).getOrientation(jointOrient)
+            local = local * jointOrient.asMatrix().inverse()
+
+        euler = OpenMaya.MTransformationMatrix(local).eulerRotation()
+        euler.reorderIt(m.getAttr(node + ".rotateOrder"))
+        unit = OpenMaya.MAngle.uiUnit()
+
+        m.setAttr(node + ".rotate", *[
+            OpenMaya.MAngle(i).asUnits(unit) for i in (euler.x, euler.y, euler.z)])
+
+
 def createOffset(selection, grpName = "_OFF_GRP"):
     """
     Takes the selection passed in the scene or the selection passed and
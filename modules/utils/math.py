@@ -16,9 +16,18 @@
 >> CONTENTS >> 
     + getDistanceBetween [Function]
     + getDistanceBetweenCalculation [Function]
+    + worldPositions [Function]
+    + pairwiseDistances [Function]
+    + distanceMatrix [Function]
+    + nearestNeighbours [Function]
+    + chainLength [Function]
+    + KDTree [Class]
 
 >> NOTES >> 
 	Update 08/08/2023 : Start working on the script
+	Update 18/10/2026 : Array based distance functions, they use numpy when
+	                    it can be imported and the "array" module otherwise
+	Update 18/10/2026 : KDTree for many closest point queries
  
 >> THANKS >> 
     Nick Hughes [08/08/2023]:
@@ -36,9 +45,141 @@
 # -----------------------------------------------------------------------------
 
 from maya import cmds as m
+from maya import OpenMaya
+from modules.utils import open_maya_api
+import array
 import math
 import six
 
+try:
+    import numpy
+except ImportError:  # mayapy builds without numpy
+    numpy = None
+
+# Distances measured at once by nearestNeighbours, 1M is about 24MB
+_CHUNK_SIZE = 2 ** 20
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+class KDTree(object):
+    """
+    KDTree [Class]
+
+    Points split in halves along their widest axis, built once for many
+    closest point queries that only measure a few points each.
+
+    Args:
+        points (list/numpy.ndarray): (N, 3) points to search in.
+        leafSize (int): Points kept together at the end of a branch.
+                        Defaults to 8.
+
+    Example:
+        tree = KDTree(worldPositions(joints))
+        indices, distances = tree.nearest(vertices)
+    """
+    def __init__(self, points, leafSize=8):
+        self._points = [tuple(float(i) for i in point) for point in points]
+
+        if not self._points:
+            raise ValueError(">>> KDTree needs at least one point.")
+
+        self._leafSize = max(leafSize, 1)
+        self._array = None
+        self._root = self._build(list(range(len(self._points))))
+
+    def __len__(self):
+        return len(self._points)
+
+    def nearest(self, points):
+        """
+        The closest tree point to each point.
+
+        Args:
+            points (list/numpy.ndarray): (M, 3) points to search from.
+
+        Returns:
+            tuple: (indices, distances) M tree indices and their distances.
+        """
+        indices, distances = array.array("l"), array.array("d")
+
+        for point in points:
+            best = [-1, float("inf")]  # [index, squared distance]
+            self._search(self._root, tuple(float(i) for i in point), best)
+
+            indices.append(best[0])
+            distances.append(math.sqrt(best[1]))
+
+        if numpy is not None:
+            return numpy.asarray(indices, dtype=int), numpy.asarray(distances)
+
+        return indices, distances
+
+    # -------------------------------------------------------------------------
+
+    def _build(self, indices):
+        """
+        A leaf is a list of indices, a branch is
+        (axis, split, lower, upper, minimum, maximum) with its bounding box.
+        """
+        if len(indices) <= self._leafSize:
+            return list(indices)
+
+        if numpy is not None:
+            if not isinstance(indices, numpy.ndarray):
+                self._array = numpy.asarray(self._points)
+                indices = numpy.asarray(indices)
+
+            points = self._array[indices]
+            minimum, maximum = points.min(axis=0).tolist(), points.max(axis=0).tolist()
+        else:
+            columns = [[self._points[i][axis] for i in indices] for axis in range(3)]
+            minimum, maximum = [min(i) for i in columns], [max(i) for i in columns]
+
+        extents = [j - i for i, j in zip(minimum, maximum)]
+        axis = extents.index(max(extents))
+
+        if not extents[axis]:
+            return list(indices)  # Every point is the same
+
+        if numpy is not None:
+            indices = indices[points[:, axis].argsort(kind="stable")]
+        else:
+            indices = [i for _, i in sorted(zip(columns[axis], indices))]
+
+        middle = len(indices) // 2
+
+        return (axis, self._points[indices[middle]][axis],
+                self._build(indices[:middle]), self._build(indices[middle:]),
+                minimum, maximum)
+
+    def _search(self, node, point, best):
+        if isinstance(node, list):
+            for index in node:
+                other = self._points[index]
+                distance = (other[0] - point[0]) ** 2 + (other[1] - point[1]) ** 2 + \
+                    (other[2] - point[2]) ** 2
+                if distance < best[1]:
+                    best[0], best[1] = index, distance
+            return
+
+        axis, split, lower, upper, minimum, maximum = node
+
+        # Nothing inside the box can be closer than the box itself
+        outside = 0.0
+        for i in range(3):
+            gap = max(minimum[i] - point[i], point[i] - maximum[i], 0.0)
+            outside += gap * gap
+
+        if outside >= best[1]:
+            return
+
+        difference = point[axis] - split
+
+        self._search(lower if difference < 0 else upper, point, best)
+        self._search(upper if difference < 0 else lower, point, best)
+
 # -----------------------------------------------------------------------------
 # SCRIPT FUNCTIONS
 # -----------------------------------------------------------------------------
@@ -59,8 +200,11 @@ def getDistanceBetween(obj1, obj2):
         float: The distance in the scene between the items.
     """
     
-    objectDistance1 = m.xform(obj1, ws=1, t=1, q=1) if isinstance(obj1, six.string_types) else obj1
-    objectDistance2 = m.xform(obj2, ws=1, t=1, q=1) if isinstance(obj2, six.string_types) else obj2
+    names = [i for i in (obj1, obj2) if isinstance(i, six.string_types)]
+    fetched = iter(_rows(worldPositions(names)) if names else [])
+
+    objectDistance1 = next(fetched) if isinstance(obj1, six.string_types) else obj1
+    objectDistance2 = next(fetched) if isinstance(obj2, six.string_types) else obj2
 
     return getDistanceBetweenCalculation(objectDistance1, objectDistance2)
 
@@ -80,4 +224,187 @@ def getDistanceBetweenCalculation(objectDistance1, objectDistance2):
         zDiff = objectDistance2[2] - objectDistance1[2]
         return math.sqrt(xDiff*xDiff + yDiff*yDiff + zDiff*zDiff)
     
-    return math.sqrt(xDiff*xDiff + yDiff*yDiff)
\ No newline at end of file
+    return math.sqrt(xDiff*xDiff + yDiff*yDiff)
+
+
+def worldPositions(nodes):
+    """
+    worldPositions [Function]
+
+    The world translation of many nodes in one pass, the same values as
+    "xform -q -ws -t" without a command per node.
+
+    Args:
+        nodes (list): The transforms, names or Dag_Nodes.
+
+    Returns:
+        numpy.ndarray/list: (N, 3) points, a list of array("d") rows when
+                            numpy is not available.
+
+    Example:
+        points = worldPositions(["L_arm_JNT", "L_elbow_JNT", "L_hand_JNT"])
+    """
+    unit = OpenMaya.MDistance.uiUnit()
+
+    points = []
+    for node, obj in zip(nodes, open_maya_api.toMObjects([str(i) for i in nodes])):
+        if not obj.hasFn(OpenMaya.MFn.kDagNode):
+            raise ValueError(">>> No world position found for {0}.".format(node))
+
+        dagPath = OpenMaya.MDagPath()
+        OpenMaya.MDagPath.getAPathTo(obj, dagPath)
+
+        matrix = dagPath.inclusiveMatrix()
+        points.append([OpenMaya.MDistance(matrix(3, i), OpenMaya.MDistance.kCentimeters).asUnits(unit)
+                       for i in range(3)])
+
+    return _asPoints(points)
+
+
+def pairwiseDistances(points1, points2):
+    """
+    pairwiseDistances [Function]
+
+    The distance between each point and the point with the same index.
+
+    Args:
+        points1 (list/numpy.ndarray): (N, 3) points.
+        points2 (list/numpy.ndarray): (N, 3) points.
+
+    Returns:
+        numpy.ndarray/array: N distances.
+
+    Example:
+        print(pairwiseDistances([[0, 0, 0], [1, 0, 0]], [[0, 3, 4], [1, 0, 2]]))
+        # Output: [5. 2.]
+    """
+    points1, points2 = _asPoints(points1), _asPoints(points2)
+
+    if len(points1) != len(points2):
+        raise ValueError(">>> pairwiseDistances needs the same number of points on both sides.")
+
+    if numpy is not None:
+        return numpy.sqrt(((points2 - points1) ** 2).sum(axis=1))
+
+    return array.array("d", [_distance(a, b) for a, b in zip(points1, points2)])
+
+
+def distanceMatrix(points1, points2=None):
+    """
+    distanceMatrix [Function]
+
+    The distance from every point to every other point.
+
+    Args:
+        points1 (list/numpy.ndarray): (N, 3) points.
+        points2 (list/numpy.ndarray): (M, 3) points. Defaults to points1.
+
+    Returns:
+        numpy.ndarray/list: (N, M) distances, a list of array("d") rows when
+                            numpy is not available.
+
+    Example:
+        print(distanceMatrix([[0, 0, 0], [0, 1, 0]]))
+        # Output: [[0. 1.]
+        #          [1. 0.]]
+    """
+    points1 = _asPoints(points1)
+    points2 = points1 if points2 is None else _asPoints(points2)
+
+    if numpy is not None:
+        difference = points1[:, numpy.newaxis, :] - points2[numpy.newaxis, :, :]
+        return numpy.sqrt((difference ** 2).sum(axis=2))
+
+    return [array.array("d", [_distance(a, b) for b in points2]) for a in points1]
+
+
+def nearestNeighbours(points, targets):
+    """
+    nearestNeighbours [Function]
+
+    The closest target to each point, for closest joint searches.
+
+    Args:
+        points (list/numpy.ndarray): (N, 3) points to search from.
+        targets (list/numpy.ndarray): (M, 3) points to search in.
+
+    Returns:
+        tuple: (indices, distances) N target indices and their distances.
+
+    Example:
+        indices, distances = nearestNeighbours(vertices, worldPositions(joints))
+        print(joints[indices[0]])
+        # Output: L_arm_JNT
+    """
+    points, targets = _asPoints(points), _asPoints(targets)
+
+    if not len(targets):
+        raise ValueError(">>> nearestNeighbours needs at least one target.")
+
+    if numpy is None:
+        return KDTree(targets).nearest(points)
+
+    # A slice of the points at a time, the whole (N, M, 3) matrix of a
+    # mesh against a skeleton takes hundreds of megabytes
+    rows = max(1, _CHUNK_SIZE // len(targets))
+    indices = numpy.empty(len(points), dtype=int)
+    distances = numpy.empty(len(points))
+
+    for start in range(0, len(points), rows):
+        chunk = distanceMatrix(points[start:start + rows], targets)
+        indices[start:start + rows] = chunk.argmin(axis=1)
+        distances[start:start + rows] = chunk[numpy.arange(len(chunk)),
+                                              indices[start:start + rows]]
+
+    return indices, distances
+
+
+def chainLength(points):
+    """
+    chainLength [Function]
+
+    The length of a chain going through the points in order, for the
+    IK stretch setups.
+
+    Args:
+        points (list/numpy.ndarray): (N, 3) points.
+
+    Returns:
+        float: The sum of the segment lengths.
+
+    Example:
+        print(chainLength(worldPositions(["L_arm_JNT", "L_elbow_JNT", "L_hand_JNT"])))
+        # Output: 10.0
+    """
+    points = _asPoints(points)
+    if len(points) < 2:
+        return 0.0
+
+    return float(sum(pairwiseDistances(points[:-1], points[1:])))
+
+# -----------------------------------------------------------------------------
+
+def _asPoints(points):
+    """
+    (N, 3) float points, a numpy array or a list of array("d") rows. Flat
+    x, y, z values are split in rows on both.
+    """
+    if numpy is not None:
+        return numpy.asarray(points, dtype=float).reshape(-1, 3)
+
+    points = list(points)
+    if points and isinstance(points[0], (int, float)):
+        if len(points) % 3:
+            raise ValueError(">>> Flat points need x, y and z for every point.")
+
+        return [array.array("d", points[i:i + 3]) for i in range(0, len(points), 3)]
+
+    return [array.array("d", point) for point in points]
+
+
+def _rows(points):
+    return [list(point) for point in points]
+
+
+def _distance(point1, point2):
+    return math.sqrt(sum((b - a) * (b - a) for a, b in zip(point1, point2)))
@@ -16,10 +16,24 @@
 >> CONTENTS >> 
     + toDpendencyNode [Func]
     + toMObject [Func]
+    + toMObjects [Func]
+    + toMDagPath [Func]
+    + toMPlug [Func]
+    + toMObjectHandle [Func]
+    + nodeKey [Func]
+    + meshPoints [Func]
+    + toMSpace [Func]
+    + flatValues [Func]
+    + littleEndian [Func]
 
 >> NOTES >> 
 	Update 02/08/2023 : Start working on the script
     Update 03/08/2023 : Added the "toMDagPath" function
+    Update 18/10/2026 : Added "toMPlug" and "toMObjectHandle" functions
+    Update 18/10/2026 : Added "toMObjects" to resolve many nodes at once
+    Update 18/10/2026 : Added "nodeKey" to key caches by node
+    Update 18/10/2026 : Added "meshPoints" shared by the mesh and skin tools
+    Update 18/10/2026 : Added "toMSpace", "flatValues" and "littleEndian"
 
 >> THANKS >> 
     Nick Hughes [02/08/2023]:
@@ -37,7 +51,15 @@
 # -----------------------------------------------------------------------------
 
 from maya import OpenMaya
+import array
+import itertools
+import sys
 
+SPACES = {"world": OpenMaya.MSpace.kWorld, "object": OpenMaya.MSpace.kObject}
+
+# {hashCode: [(MObjectHandle, key), ...]} Nodes sharing a hash code.
+_NODE_KEYS = {}
+_KEY_COUNTER = itertools.count()
 
 # -----------------------------------------------------------------------------
 # SCRIPT FUNCTIONS
@@ -97,6 +119,45 @@ def toMObject(node):
     return obj
 
 
+def toMObjects(nodes):
+    """
+    toMObjects [Function]
+
+    Converts many nodes into OpenMaya Objects with a single selection list.
+
+    Args:
+        nodes (list): The maya nodes, unique names or full paths.
+
+    Returns:
+        list: [MObject, ...] one per node in the same order, repeated
+              nodes included.
+
+    Example:
+        objs = toMObjects(m.listRelatives("L_arm_GRP", ad=True, f=True))
+    """
+
+    selectionList = OpenMaya.MSelectionList()
+    indices = []
+    for node in nodes:
+        length = selectionList.length()
+        selectionList.add(node)
+
+        # A node already in the list is merged, it is resolved on its own
+        indices.append(length if selectionList.length() > length else None)
+
+    objs = []
+    for node, index in zip(nodes, indices):
+        if index is None:
+            objs.append(toMObject(node))
+            continue
+
+        obj = OpenMaya.MObject()
+        selectionList.getDependNode(index, obj)
+        objs.append(obj)
+
+    return objs
+
+
 def toMDagPath(node):
     """
     toMDagPath [Function]
@@ -123,3 +184,205 @@ def toMDagPath(node):
     if obj.hasFn(OpenMaya.MFn.kDagNode):
         dag = OpenMaya.MDagPath.getAPathTo(obj)
         return dag
+
+
+def toMPlug(attr):
+    """
+    toMPlug [Function]
+
+    Converts a node attribute string into an OpenMaya Plug.
+
+    Args:
+        attr (str): The maya node attribute, "node.attribute".
+
+    Returns:
+        Object: The OpenMaya Plug.
+
+    Example:
+        plug = toMPlug("L_hand_JNT.rotateX")
+        print(plug.asDouble())
+
+        # Output: 0.0
+    """
+
+    selectionList = OpenMaya.MSelectionList()
+    selectionList.add(attr)
+
+    plug = OpenMaya.MPlug()
+    selectionList.getPlug(0, plug)
+
+    return plug
+
+
+def toMObjectHandle(node):
+    """
+    toMObjectHandle [Function]
+
+    Converts a node or an OpenMaya Object into an OpenMaya Object Handle,
+    this lets us know if the node is still valid after being deleted.
+
+    Args:
+        node (str/MObject): The maya node.
+
+    Returns:
+        Object: The OpenMaya Object Handle.
+
+    Example:
+        handle = toMObjectHandle("L_hand_JNT")
+        print(handle.isValid())
+
+        # Output: True
+    """
+
+    if not isinstance(node, OpenMaya.MObject):
+        node = toMObject(node)
+
+    return OpenMaya.MObjectHandle(node)
+
+
+def nodeKey(obj):
+    """
+    nodeKey [Function]
+
+    A dictionary key unique to a node. MObjectHandle hash codes are not
+    unique between live nodes, so the nodes sharing one are told apart
+    by comparing their MObjects. A key is never given to another node.
+
+    Args:
+        obj (MObject): The maya node.
+
+    Returns:
+        tuple: (hashCode, index) the same for every call with that node.
+
+    Example:
+        cache[nodeKey(toMObject("L_hand_JNT"))] = data
+    """
+
+    handle = OpenMaya.MObjectHandle(obj)
+    code = handle.hashCode()
+    bucket = _NODE_KEYS.get(code)
+
+    if bucket:
+        for other, key in bucket:
+            if other.isAlive() and other.object() == obj:
+                return key
+
+        # Nodes gone from the undo queue too won't come back
+        bucket[:] = [i for i in bucket if i[0].isAlive()]
+    else:
+        bucket = _NODE_KEYS[code] = []
+
+    key = (code, next(_KEY_COUNTER))
+    bucket.append((handle, key))
+
+    return key
+
+
+def meshPoints(dagPath, space=OpenMaya.MSpace.kWorld):
+    """
+    meshPoints [Function]
+
+    The position of every vertex of a mesh read in one MFnMesh call.
+
+    Args:
+        dagPath (MDagPath): The mesh shape.
+        space (int): The MSpace to read in. Defaults to kWorld.
+
+    Returns:
+        array: Flat array("d") of x, y, z in centimeters.
+
+    Example:
+        points = meshPoints(toMDagPath("body_GEOShape"))
+    """
+
+    points = OpenMaya.MPointArray()
+    OpenMaya.MFnMesh(dagPath).getPoints(points, space)
+
+    values = array.array("d")
+    for index in range(points.length()):
+        point = points[index]
+        values.extend((point.x, point.y, point.z))
+
+    return values
+
+
+def toMSpace(space):
+    """
+    toMSpace [Function]
+
+    Converts a space name into an OpenMaya Space.
+
+    Args:
+        space (str): "world" or "object".
+
+    Returns:
+        int: The MSpace constant.
+
+    Example:
+        curveFn.getCVs(points, toMSpace("world"))
+    """
+
+    if space not in SPACES:
+        raise ValueError(">>> Space has to be one of {0}.".format(sorted(SPACES)))
+
+    return SPACES[space]
+
+
+def flatValues(values):
+    """
+    flatValues [Function]
+
+    Flat list of floats from flat values, rows or a numpy array, the
+    way the API setters take points and weights.
+
+    Args:
+        values (list/numpy.ndarray): Flat values or rows of values.
+
+    Returns:
+        list: [float, ...]
+
+    Example:
+        print(flatValues([[0, 1, 2], [3, 4, 5]]))
+        # Output: [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    """
+
+    if hasattr(values, "ravel"):
+        return values.ravel().tolist()
+
+    flat = []
+    for value in values:
+        if hasattr(value, "__len__"):
+            flat.extend(float(i) for i in value)
+        else:
+            flat.append(float(value))
+
+    return flat
+
+
+def littleEndian(values, typecode=None):
+    """
+    littleEndian [Function]
+
+    The bytes of an array in little endian, the byte order of our
+    binary files.
+
+    Args:
+        values (array/list): The values to write.
+        typecode (str): The array typecode. Defaults to the one of values.
+
+    Returns:
+        bytes: The packed values.
+
+    Example:
+        skinFile.write(littleEndian(offsets))
+    """
+
+    typecode = typecode or values.typecode
+
+    if sys.byteorder == "big" or getattr(values, "typecode", None) != typecode:
+        values = array.array(typecode, values)
+
+        if sys.byteorder == "big":
+            values.byteswap()
+
+    return values.tobytes()
@@ -0,0 +1,347 @@
+'''
+/*****************************************************************************/
+                              Skin Weights v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Saves and loads skin weights in a small binary file, only the non zero
+    weights of each vertex are written with the index of their influence.
+    The file is memory mapped on load so the weights never become a list.
+
+>> HOW TO USE >>
+	Save the weights of a skinned mesh and load them on the rebuilt one:
+
+        saveWeights("body_GEO", "C:/rig/body.skin")
+        loadWeights("body_GEO", "C:/rig/body.skin")
+
+    The influences are matched by name, when the vertex count changed the
+    weights are taken from the closest saved vertex.
+
+>> CONTENTS >>
+    + saveWeights [Func]
+    + loadWeights [Func]
+    + readWeightsFile [Func]
+    + closeWeightsFile [Func]
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> FILE FORMAT >>
+    Little endian, in this order:
+        header      "<4sHBBIII" magic, version, weight bytes (2 or 4),
+                    unused, vertex count, weight count, info size
+        info        utf-8 json {"mesh": name, "influences": [name, ...]}
+        points      float32 x, y, z world position of each vertex
+        offsets     uint32 vertex count + 1, the weights of vertex i are
+                    the range offsets[i]:offsets[i + 1]
+        influences  uint16 influence index of each weight
+        weights     float16 or float32
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import array
+import json
+import mmap
+import struct
+import sys
+import time
+from modules.base import Mesh
+from modules.utils.math import KDTree
+from modules.utils.open_maya_api import littleEndian, meshPoints
+from modules.utils.path import rootName
+
+try:
+    import numpy
+except ImportError:  # mayapy builds without numpy
+    numpy = None
+
+_MAGIC = b"MPSW"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHBBIII")
+
+# -----------------------------------------------------------------------------
+# SCRIPT FUNCTIONS
+# -----------------------------------------------------------------------------
+
+def saveWeights(mesh, path, precision=16, threshold=1e-5):
+    """
+    saveWeights [Function]
+
+    Writes the skin weights of a mesh, the weights under the threshold are
+    pruned.
+
+    Args:
+        mesh (str/Mesh): The skinned mesh.
+        path (str): The file to write.
+        precision (int): 16 or 32 bits per weight. Defaults to 16.
+        threshold (float): Smaller weights are not saved. Defaults to 1e-5.
+
+    Returns:
+        int: The number of weights written.
+
+    Example:
+        saveWeights("body_GEO", "C:/rig/body.skin")
+        # Output: >>> Saved 412331 weights of body_GEO in 0.21 s.
+    """
+    if precision not in (16, 32):
+        raise ValueError(">>> Precision has to be 16 or 32 bits.")
+
+    start = time.time()
+
+    mesh = Mesh(mesh)
+    influences = [rootName(i.fullPath) for i in mesh.joints or []]
+    weights = mesh.getWeights()
+    points = _worldPoints(mesh)
+
+    weightFormat = "e" if precision == 16 else "f"
+    vertexCount = len(points) // 3
+
+    if numpy is not None:
+        mask = weights > threshold
+        offsets = numpy.concatenate(([0], numpy.cumsum(mask.sum(axis=1)))).astype("<u4")
+        indices = numpy.nonzero(mask)[1].astype("<u2")
+        values = weights[mask].astype("<f2" if precision == 16 else "<f4")
+        chunks = [points.tobytes(), offsets.tobytes(), indices.tobytes(), values.tobytes()]
+        weightCount = len(values)
+
+    else:
+        offsets, indices, values = array.array("I", [0]), array.array("H"), []
+        influenceCount = len(influences)
+
+        for vertex in range(vertexCount):
+            row = weights[vertex * influenceCount:(vertex + 1) * influenceCount]
+            for index, weight in enumerate(row):
+                if weight > threshold:
+                    indices.append(index)
+                    values.append(weight)
+            offsets.append(len(indices))
+
+        chunks = [littleEndian(points), littleEndian(offsets), littleEndian(indices),
+                  struct.pack("<{0}{1}".format(len(values), weightFormat), *values)]
+        weightCount = len(values)
+
+    info = json.dumps({"mesh": mesh.name, "influences": influences}).encode("utf-8")
+
+    with open(path, "wb") as skinFile:
+        skinFile.write(_HEADER.pack(_MAGIC, _VERSION, precision // 8, 0,
+                                    vertexCount, weightCount, len(info)))
+        skinFile.write(info)
+        for chunk in chunks:
+            skinFile.write(chunk)
+
+    sys.stdout.write(">>> Saved {0} weights of {1} in {2:.2f} s.\n".format(
+        weightCount, mesh.name, time.time() - start))
+
+    return weightCount
+
+
+def readWeightsFile(path):
+    """
+    readWeightsFile [Function]
+
+    Memory maps a weights file, the buffers are views on the file and are
+    only read when used. Call closeWeightsFile when done.
+
+    Args:
+        path (str): The file written by saveWeights.
+
+    Returns:
+        dict: {"mesh", "influences", "vertexCount", "points", "offsets",
+               "indices", "weights", "mmap"} the buffers are numpy arrays,
+               or memoryviews and float sequences without numpy.
+
+    Example:
+        data = readWeightsFile("C:/rig/body.skin")
+        print(data["influences"])
+        closeWeightsFile(data)
+    """
+    with open(path, "rb") as skinFile:
+        fileMap = mmap.mmap(skinFile.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, weightSize, _, vertexCount, weightCount, infoSize = \
+        _HEADER.unpack_from(fileMap, 0)
+
+    if magic != _MAGIC or version != _VERSION:
+        fileMap.close()
+        raise ValueError(">>> {0} is not a skin weights file.".format(path))
+
+    position = _HEADER.size
+    info = json.loads(fileMap[position:position + infoSize].decode("utf-8"))
+    position += infoSize
+
+    sections = []
+    for count, numpyType, arrayType, size in (
+            (vertexCount * 3, "<f4", "f", 4),
+            (vertexCount + 1, "<u4", "I", 4),
+            (weightCount, "<u2", "H", 2),
+            (weightCount, "<f2" if weightSize == 2 else "<f4", None, weightSize)):
+
+        if numpy is not None:
+            sections.append(numpy.frombuffer(fileMap, numpyType, count, position))
+        elif arrayType is not None:
+            sections.append(memoryview(fileMap)[position:position + count * size].cast(arrayType))
+        else:
+            sections.append(_FloatView(fileMap, position, count, weightSize))
+
+        position += count * size
+
+    return {"mesh": info["mesh"],
+            "influences": info["influences"],
+            "vertexCount": vertexCount,
+            "points": sections[0],
+            "offsets": sections[1],
+            "indices": sections[2],
+            "weights": sections[3],
+            "mmap": fileMap}
+
+
+def closeWeightsFile(data):
+    """
+    closeWeightsFile [Function]
+
+    Releases the buffers of readWeightsFile and closes the file.
+
+    Args:
+        data (dict): The readWeightsFile result.
+    """
+    for key in ("points", "offsets", "indices", "weights"):
+        buffer = data.pop(key, None)
+        if isinstance(buffer, memoryview):
+            buffer.release()
+
+    del buffer
+
+    try:
+        data["mmap"].close()
+    except BufferError:
+        pass  # A view is still alive, in a traceback for example, the map closes with it
+
+
+def loadWeights(mesh, path, verbose=True):
+    """
+    loadWeights [Function]
+
+    Applies a weights file on a skinned mesh. The influences are matched
+    by name and the vertices by index, or by closest point when the vertex
+    count is different.
+
+    Args:
+        mesh (str/Mesh): The skinned mesh, it needs every saved influence.
+        path (str): The file written by saveWeights.
+        verbose (bool): Print the timings. Defaults to True.
+
+    Returns:
+        dict: {"read", "remap", "set"} seconds spent on each step.
+
+    Example:
+        loadWeights("body_GEO", "C:/rig/body.skin")
+        # Output: >>> Loaded body.skin on body_GEO: read 0.00 s, remap 0.08 s, set 0.31 s.
+    """
+    timings = {}
+    start = time.time()
+
+    mesh = Mesh(mesh)
+    data = readWeightsFile(path)
+
+    try:
+        timings["read"] = time.time() - start
+        start = time.time()
+
+        targets = [rootName(i.fullPath) for i in mesh.joints or []]
+        missing = [i for i in data["influences"] if i not in targets]
+        if missing:
+            raise ValueError(">>> {0} are not influences of {1}.".format(missing, mesh.name))
+
+        remap = [targets.index(i) for i in data["influences"]]
+        vertices = _vertexMap(mesh, data)
+        weights = _denseWeights(data, remap, vertices, len(targets))
+
+        timings["remap"] = time.time() - start
+        start = time.time()
+
+        mesh.setWeights(weights, normalize=True)
+        timings["set"] = time.time() - start
+
+    finally:
+        closeWeightsFile(data)
+
+    if verbose:
+        sys.stdout.write(">>> Loaded {0} on {1}: read {2:.2f} s, remap {3:.2f} s, set {4:.2f} s.\n".format(
+            path.replace("\\", "/").split("/")[-1], mesh.name,
+            timings["read"], timings["remap"], timings["set"]))
+
+    return timings
+
+# -----------------------------------------------------------------------------
+
+class _FloatView(object):
+    """ Read only sequence of little endian floats inside the mmap. """
+    def __init__(self, buffer, offset, count, size):
+        self._struct = struct.Struct("<e" if size == 2 else "<f")
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        return self._struct.unpack_from(
+            self._buffer, self._offset + index * self._struct.size)[0]
+
+
+def _worldPoints(mesh):
+    """ Flat x, y, z float32 world positions of the vertices. """
+    points = meshPoints(mesh.shape.dag)
+
+    if numpy is not None:
+        return numpy.frombuffer(points, dtype=float).astype("<f4")
+
+    return array.array("f", points)
+
+
+def _vertexMap(mesh, data):
+    """ The saved vertex used by each vertex of the mesh. """
+    points = _worldPoints(mesh)
+    vertexCount = len(points) // 3
+
+    if vertexCount == data["vertexCount"]:
+        return range(vertexCount)
+
+    tree = KDTree(_points(data["points"]))
+    return [int(i) for i in tree.nearest(_points(points))[0]]
+
+
+def _points(values):
+    return values.reshape(-1, 3) if numpy is not None else \
+        [values[i:i + 3] for i in range(0, len(values), 3)]
+
+
+def _denseWeights(data, remap, vertices, influenceCount):
+    """ (vertices, influences) weights in the order of the mesh joints. """
+    offsets, indices, values = data["offsets"], data["indices"], data["weights"]
+
+    if numpy is not None:
+        saved = numpy.zeros((data["vertexCount"], influenceCount))
+        rows = numpy.repeat(numpy.arange(data["vertexCount"]), numpy.diff(offsets))
+        saved[rows, numpy.asarray(remap)[indices]] = values
+        return saved[numpy.asarray(vertices)]
+
+    weights = array.array("d", bytes(8 * len(vertices) * influenceCount))
+    for row, vertex in enumerate(vertices):
+        for entry in range(offsets[vertex], offsets[vertex + 1]):
+            weights[row * influenceCount + remap[indices[entry]]] = values[entry]
+
+    return weights
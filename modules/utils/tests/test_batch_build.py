@@ -0,0 +1,139 @@
+'''
+/*****************************************************************************/
+                            Test Batch Build v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Tests for our Batch Build module. The workers run against a stub
+    maya package so these also run in a plain python without Maya.
+
+>> HOW TO USE >>
+	Simply run the script or run the script called "testing.py"
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from modules.utils.batch_build import runBatch, main
+
+# Stub maya, cmds.file only writes the saved scene
+_STUB_FILES = {
+    "maya/__init__.py": "",
+    "maya/standalone.py": "def initialize(name=None):\n    pass\n",
+    "maya/cmds.py": (
+        "_scene = {}\n"
+        "def file(path=None, **kwargs):\n"
+        "    if kwargs.get('rename'):\n"
+        "        _scene['name'] = kwargs['rename']\n"
+        "    if kwargs.get('save'):\n"
+        "        open(_scene['name'], 'w').close()\n"),
+    "stub_steps.py": (
+        "import os\n"
+        "def build(path, output):\n"
+        "    if 'broken' in path:\n"
+        "        raise ValueError('>>> No guides in ' + path)\n"
+        "    if 'crash' in path:\n"
+        "        os._exit(3)\n"),
+}
+
+# In the Maya interface sys.executable is Maya itself, not a python
+_EXECUTABLE = os.path.basename(sys.executable).lower()
+_IN_MAYA_UI = _EXECUTABLE.startswith("maya") and not _EXECUTABLE.startswith("mayapy")
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+@unittest.skipIf(_IN_MAYA_UI, "The workers need a python executable.")
+class Test_Batch_Build(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.stub = os.path.join(self.folder, "stub")
+        self.output = os.path.join(self.folder, "rigs")
+
+        for name, text in _STUB_FILES.items():
+            path = os.path.join(self.stub, name)
+            if not os.path.exists(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            with open(path, "w") as stubFile:
+                stubFile.write(text)
+
+        self.env = dict(os.environ, PYTHONPATH=self.stub)
+        self.files = [os.path.join(self.folder, i) for i in
+                      ("body.ma", "broken.ma", "crash.ma", "arms.guides")]
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_runBatch(self):
+        progress = []
+        results = runBatch(self.files, ["stub_steps:build", "export"], self.output,
+                           workers=2, env=self.env,
+                           progress=lambda *args: progress.append(args))
+
+        self.assertEqual([i["file"] for i in results], self.files)
+        self.assertEqual([i["ok"] for i in results], [True, False, False, True])
+        self.assertEqual(sorted(i[1] for i in progress), [1, 2, 3, 4])
+
+        self.assertEqual(list(results[0]["timings"]), ["open", "stub_steps:build", "export"])
+        self.assertEqual(results[1]["step"], "stub_steps:build")
+        self.assertIn("No guides", results[1]["error"])
+        self.assertIn("code 3", results[2]["error"])
+
+        self.assertEqual(sorted(os.listdir(self.output)), ["arms_rig.mb", "body_rig.mb"])
+
+    def test_runBatch_relativePaths(self):
+        previous = os.getcwd()
+        os.chdir(self.folder)
+        folder = os.getcwd()  # The temp folder can be behind a symlink
+        try:
+            results = runBatch(["body.ma", "arms.guides"], ["stub_steps:build", "export"],
+                               "rigs", env=self.env, progress=lambda *args: None)
+        finally:
+            os.chdir(previous)
+
+        self.assertEqual([i["file"] for i in results],
+                         [os.path.join(folder, i) for i in ("body.ma", "arms.guides")])
+        self.assertEqual([i["ok"] for i in results], [True, True])
+        self.assertEqual(sorted(os.listdir(self.output)), ["arms_rig.mb", "body_rig.mb"])
+
+    def test_unknownStep(self):
+        with self.assertRaises(ValueError):
+            runBatch(self.files, ["rig"], env=self.env)
+
+    def test_main(self):
+        os.environ["PYTHONPATH"], previous = self.stub, os.environ.get("PYTHONPATH")
+        try:
+            self.assertEqual(main([self.files[0], "-s", "stub_steps:build"]), 0)
+            self.assertEqual(main(self.files[:2] + ["-s", "stub_steps:build"]), 1)
+        finally:
+            if previous is None:
+                os.environ.pop("PYTHONPATH")
+            else:
+                os.environ["PYTHONPATH"] = previous
+
+# -----------------------------------------------------------------------------
+# EXECUTE SCRIPT
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+'''
+/*****************************************************************************/
+                                Test Math v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Tests for our Math module.
+
+>> HOW TO USE >>
+	Simply run the script or run the script called "testing.py"
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import unittest
+from maya import cmds as m
+from modules.utils.math import (
+    getDistanceBetween,
+    worldPositions,
+    pairwiseDistances,
+    distanceMatrix,
+    nearestNeighbours,
+    chainLength
+)
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+class Test_Math(unittest.TestCase):
+
+    def setUp(self):
+        self.points = [[0, 0, 0], [0, 3, 4], [10, 3, 4]]
+
+    def test_worldPositions(self):
+        parent = m.group(em=1, w=1)
+        child = m.group(em=1, p=parent)
+        m.setAttr(parent + ".t", 1, 2, 3)
+        m.setAttr(child + ".t", 1, 0, 0)
+
+        self.assertEqual(
+            [[round(i, 4) for i in point] for point in worldPositions([parent, child])],
+            [[1, 2, 3], [2, 2, 3]])
+        self.assertEqual(getDistanceBetween(parent, child), 1)
+
+        m.delete(parent)
+
+    def test_pairwiseDistances(self):
+        self.assertEqual(list(pairwiseDistances(self.points[:-1], self.points[1:])), [5, 10])
+
+        with self.assertRaises(ValueError):
+            pairwiseDistances(self.points, self.points[1:])
+
+    def test_distanceMatrix(self):
+        self.assertEqual(
+            [list(row) for row in distanceMatrix(self.points[:2])],
+            [[0, 5], [5, 0]])
+
+    def test_nearestNeighbours(self):
+        indices, distances = nearestNeighbours([[9, 3, 4], [0, 1, 0]], self.points)
+
+        self.assertEqual(list(indices), [2, 0])
+        self.assertEqual(list(distances), [1, 1])
+
+    def test_nearestNeighbours_flat(self):
+        indices, distances = nearestNeighbours([9, 3, 4, 0, 1, 0], self.points)
+
+        self.assertEqual(list(indices), [2, 0])
+        self.assertEqual(list(distances), [1, 1])
+
+    def test_chainLength(self):
+        self.assertEqual(chainLength(self.points), 15)
+        self.assertEqual(chainLength(self.points[:1]), 0)
+
+# -----------------------------------------------------------------------------
+# EXECUTE SCRIPT
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -32,7 +32,7 @@
 
 import unittest
 from maya import cmds, OpenMaya
-from modules.utils.open_maya_api import toMObject, toDpendencyNode
+from modules.utils.open_maya_api import toMObject, toMObjects, toDpendencyNode
 
 # -----------------------------------------------------------------------------
 # CLASSES
@@ -69,6 +69,14 @@ class Test_Maya_Open_API(unittest.TestCase):
 
         self.assertEqual(fullPathName, expectedResult)
 
+    def test_toMObjects(self):
+        nodes = [self.jointName, self.baseGrp, "|BASE_GRP|SUB_GRP|L_hand_JNT"]
+
+        result = toMObjects(nodes)
+        names = [OpenMaya.MFnDagNode(i).name() for i in result]
+
+        self.assertEqual(names, ["L_hand_JNT", "BASE_GRP", "L_hand_JNT"])
+
 
 # -----------------------------------------------------------------------------
 # EXECUTE SCRIPT
@@ -0,0 +1,129 @@
+'''
+/*****************************************************************************/
+                            Test Skin Weights v 1.0
+                     ________________________________________
+                    |                                        |
+                    |  Author: Luis Felipe Carranza          |
+                    |________________________________________|
+
+>> DESCRIPTION >>
+    Tests for our Skin Weights module.
+
+>> HOW TO USE >>
+	Simply run the script or run the script called "testing.py"
+
+>> NOTES >>
+	Update 18/10/2026 : Start working on the script
+
+>> CONTACT >>
+    luisf.carranza@outlook.com
+    Copyright (C) 2023. All rights reserved.
+
+/*****************************************************************************/
+'''
+
+# -----------------------------------------------------------------------------
+# LIBRARIES AND MODULES
+# -----------------------------------------------------------------------------
+
+import os
+import tempfile
+import unittest
+from maya import cmds as m
+from modules.base import Mesh, Dag_Node
+from modules.utils.skin_weights import saveWeights, loadWeights, readWeightsFile, closeWeightsFile
+
+# -----------------------------------------------------------------------------
+# CLASSES
+# -----------------------------------------------------------------------------
+
+class Test_Skin_Weights(unittest.TestCase):
+
+    def setUp(self):
+        self.sphere = Mesh(m.polySphere(n="sphere_GEO", r=1)[0])
+
+        m.select(cl=True)
+        self.body_j1 = Dag_Node(m.joint(n="body_j1", p=(0, -1, 0)))
+        m.select(cl=True)
+        self.body_j2 = Dag_Node(m.joint(n="body_j2", p=(0, 1, 0)))
+
+        m.skinCluster(self.sphere.fullPath, [self.body_j1, self.body_j2], rui=0, mi=3, tsb=1, dr=2)
+
+        self.path = os.path.join(tempfile.gettempdir(), "test_skin_weights.skin")
+
+    def tearDown(self) -> None:
+        self.sphere.delete()
+        self.body_j1.delete()
+        self.body_j2.delete()
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def weightOf(self, mesh, vertex, joint):
+        return m.skinPercent(mesh.skinCluster.name, mesh.verts[vertex], transform=joint.name, q=1)
+
+    def test_saveWeights(self):
+        count = saveWeights(self.sphere, self.path)
+        data = readWeightsFile(self.path)
+
+        try:
+            self.assertEqual(data["influences"], ["body_j1", "body_j2"])
+            self.assertEqual(data["vertexCount"], len(self.sphere.verts))
+            self.assertEqual(len(data["weights"]), count)
+        finally:
+            closeWeightsFile(data)
+
+    def test_closeWeightsFile_viewAlive(self):
+        saveWeights(self.sphere, self.path)
+        data = readWeightsFile(self.path)
+        weights = data["weights"]
+
+        closeWeightsFile(data)  # No BufferError while the view is alive
+        self.assertNotIn("weights", data)
+
+        del weights
+
+    def test_loadWeights(self):
+        expected = round(self.weightOf(self.sphere, 0, self.body_j2), 2)
+        saveWeights(self.sphere, self.path)
+
+        self.sphere.setWeights([[1, 0]] * len(self.sphere.verts))
+        timings = loadWeights(self.sphere, self.path)
+
+        self.assertEqual(sorted(timings), ["read", "remap", "set"])
+        self.assertEqual(round(self.weightOf(self.sphere, 0, self.body_j2), 2), expected)
+
+    def test_loadWeights_closestPoint(self):
+        saveWeights(self.sphere, self.path, precision=32)
+
+        sphere2 = Mesh(m.polySphere(n="sphere2_GEO", r=1, sx=30, sy=30)[0])
+        m.skinCluster(sphere2.fullPath, [self.body_j2, self.body_j1], rui=0, mi=3, tsb=1, dr=2)
+        sphere2.setWeights([[1, 0]] * len(sphere2.verts))
+
+        loadWeights(sphere2, self.path)
+
+        # The bottom pole of both spheres is the last vertex before the top one
+        bottom = len(sphere2.verts) - 2
+        self.assertEqual(
+            round(self.weightOf(sphere2, bottom, self.body_j1), 2),
+            round(self.weightOf(self.sphere, len(self.sphere.verts) - 2, self.body_j1), 2))
+
+        sphere2.delete()
+
+    def test_loadWeights_missingInfluence(self):
+        saveWeights(self.sphere, self.path)
+
+        sphere2 = Mesh(m.polySphere(n="sphere2_GEO", r=1)[0])
+        m.skinCluster(sphere2.fullPath, [self.body_j1], rui=0, mi=3, tsb=1)
+
+        with self.assertRaises(ValueError):
+            loadWeights(sphere2, self.path)
+
+        sphere2.delete()
+
+# -----------------------------------------------------------------------------
+# EXECUTE SCRIPT
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()